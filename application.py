@@ -9,18 +9,17 @@
 - Журнал виловів зберігає інформацію в SQLite БД
 """
 
+import argparse
 import sys
 import os
 
 # Додавання папки src до шляху пошуку модулів
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
 
-from catch_log_service import CatchLogService
-from fisherman import Fisherman
-from sensor import Sensor
-from ecologist import Ecologist
-from fishing_trip import FishingTrip
-from weather_service import WeatherService
+# Решта модулів імпортується там, де вони потрібні, щоб короткі запуски
+# підкоманд не завантажували всю систему
+from cli import add_subcommands
+from logging_config import configure_logging, shutdown_logging
 
 
 def print_header(title: str) -> None:
@@ -45,6 +44,12 @@ def main() -> None:
     - Риболовля та реєстрація виловів
     - Екологічна оцінка
     """
+    from catch_log_service import CatchLogService
+    from ecologist import Ecologist
+    from fisherman import Fisherman
+    from fishing_trip import FishingTrip
+    from sensor import Sensor
+    from weather_service import WeatherService
     
     print_header("СИСТЕМА УПРАВЛІННЯ РИБАЛЬСТВОМ")
     print("Демонстрація об'єктно-орієнтованої системи рибальства на Python")
@@ -84,6 +89,7 @@ def main() -> None:
     
     if not is_suitable:
         print("[Planning] Погода непридатна, експедиція відкладена")
+        catch_log_service.close()
         return
     
     # Перевірка карт та точок
@@ -95,7 +101,8 @@ def main() -> None:
     
     # Створення та запуск експедиції
     fishing_spots = ["Біля берега", "В центрі", "Біля острова"]
-    fishing_trip = FishingTrip(location, fisherman.name, "Карта 2024", fishing_spots)
+    fishing_trip = FishingTrip(location, fisherman.name, "Карта 2024", fishing_spots,
+                               catch_log_service)
     fishing_trip.start()
     
     print(fishing_trip.get_fishing_plan())
@@ -103,7 +110,7 @@ def main() -> None:
     # Фаза 2: Риболовля
     print_header("ФАЗА 2: ПРОЦЕС РИБОЛОВЛІ")
     
-    fisherman.start_fishing(location)
+    fisherman.start_fishing(location, fishing_trip)
     
     # Моніторинг умов сенсорами
     print("[Environmental Monitoring] Одержання даних від сенсорів")
@@ -135,6 +142,10 @@ def main() -> None:
     print(f"[Database Summary] Зведення з бази даних:")
     print(f"  Загальна кількість рибин: {summary['count']}")
     print(f"  Загальна вага: {summary['total_weight']} кг")
+    trip_stats = fishing_trip.get_stats()
+    if trip_stats:
+        print(f"  Експедиція #{trip_stats['trip_id']}: {trip_stats['catch_count']} рибин, "
+              f"{trip_stats['total_weight']} кг за {trip_stats['duration_minutes']:.1f} хв")
     print()
 
     # Фаза 4: Екологічна оцінка
@@ -149,6 +160,8 @@ def main() -> None:
     print("  ✓ Рекомендується збільшити частоту екологічного моніторингу")
     print()
 
+    catch_log_service.close()
+
     # Завершення
     print_header("ЕКСПЕДИЦІЯ ЗАВЕРШЕНА")
     print(f"Дякуємо за використання системи управління рибальством!")
@@ -156,12 +169,50 @@ def main() -> None:
 
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Система управління рибальством")
+    parser.add_argument("--quiet", action="store_true",
+                        help="Тихий режим: не виводити повідомлення компонентів")
+    parser.add_argument("--log-queue", action="store_true",
+                        help="Виводити повідомлення компонентів з окремого потоку")
+    parser.add_argument("--fleet", metavar="CONFIG", nargs="?", const="",
+                        help="Запустити симуляцію флоту (опціонально з JSON-файлом параметрів)")
+    parser.add_argument("--fishermen", type=int, help="Кількість рибалок у симуляції флоту")
+    parser.add_argument("--workers", type=int, help="Кількість процесів симуляції флоту")
+    parser.add_argument("--metrics", choices=["json", "prometheus"],
+                        help="Вимірювати гарячі шляхи та вивести метрики у вказаному форматі")
+    add_subcommands(parser)
+    args = parser.parse_args()
+    configure_logging(quiet=args.quiet, use_queue=args.log_queue)
+    registry = None
+    if args.metrics:
+        from instrumentation import enable_instrumentation
+        registry = enable_instrumentation()
+    exit_code = 0
     try:
-        main()
-        print("[Exit] Програма завершена успішно")
+        if args.command is not None:
+            exit_code = args.handler(args)
+        elif args.fleet is not None:
+            from fleet_simulation import FleetConfig, print_fleet_report, run_fleet_simulation
+
+            config = FleetConfig.from_json_file(args.fleet) if args.fleet else FleetConfig()
+            if args.fishermen:
+                config.fishermen = args.fishermen
+            if args.workers:
+                config.workers = args.workers
+            print_fleet_report(run_fleet_simulation(config))
+        else:
+            main()
+        if registry is not None:
+            print(registry.to_json() if args.metrics == "json" else registry.to_prometheus())
+        if args.command is None:
+            print("[Exit] Програма завершена успішно")
     except KeyboardInterrupt:
         print("\n[Exit] Програма переривається користувачем")
     except Exception as e:
         print(f"\n[Error] Помилка при виконанні програми: {e}")
+        exit_code = 1
         import traceback
         traceback.print_exc()
+    finally:
+        shutdown_logging()
+    sys.exit(exit_code)
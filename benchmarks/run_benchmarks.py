@@ -0,0 +1,360 @@
+#!/usr/bin/env python3
+"""
+Набір бенчмарків системи управління рибальством.
+
+Вимірює швидкодію основних операцій:
+- CatchLog.add_entry та get_total_weight для 10^3-10^6 записів
+- CatchLogService.save_catch, get_all_catches та get_catch_summary
+  на попередньо заповнених базах даних різного розміру
+- Цикли вимірювань Sensor
+- Запити прогнозу WeatherService
+- Холодний запуск підкоманд application.py в окремому процесі
+
+Результати зберігаються у JSON. У режимі порівняння результати
+звіряються з базовим файлом, і регресії понад поріг позначаються.
+"""
+
+import argparse
+import json
+import os
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+
+# Додавання папки src до шляху пошуку модулів
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+APPLICATION = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'application.py')
+
+from catch_log import CatchLog
+from catch_log_service import CatchLogService
+from logging_config import configure_logging
+from sensor import Sensor
+from weather_service import WeatherService
+
+
+FISH_SPECIES = ['Окунь', 'Щука', 'Карась', 'Сом', 'Короп', 'Лящ']
+
+
+def measure(func: Callable[[], None], operations: int, repeat: int = 5) -> dict:
+    """
+    Багаторазове вимірювання часу виконання функції.
+
+    Параметри:
+        func: Функція, що виконує operations операцій
+        operations: Кількість операцій за один виклик func
+        repeat: Кількість повторень вимірювання
+
+    Повертає:
+        Словник з мінімальним та медіанним часом і кількістю операцій за секунду
+    """
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    best = min(timings)
+    return {
+        'operations': operations,
+        'min_s': best,
+        'median_s': statistics.median(timings),
+        'ops_per_s': operations / best if best else 0.0
+    }
+
+
+def bench_catch_log(size: int, repeat: int) -> Dict[str, dict]:
+    """
+    Бенчмарк локального журналу виловів.
+
+    Параметри:
+        size: Кількість записів у журналі
+        repeat: Кількість повторень вимірювання
+
+    Повертає:
+        Результати для add_entry та get_total_weight
+    """
+    rng = random.Random(size)
+    catches = [(rng.choice(FISH_SPECIES), round(rng.uniform(0.2, 5.0), 2)) for _ in range(size)]
+
+    def fill() -> None:
+        catch_log = CatchLog()
+        for species, weight in catches:
+            catch_log.add_entry(species, weight)
+
+    filled = CatchLog()
+    for species, weight in catches:
+        filled.add_entry(species, weight)
+    calls = 100000
+
+    def total_weight() -> None:
+        for _ in range(calls):
+            filled.get_total_weight()
+
+    return {
+        f'catch_log.add_entry[{size}]': measure(fill, size, repeat),
+        f'catch_log.get_total_weight[{size}]': measure(total_weight, calls, repeat)
+    }
+
+
+def _seed_database(db_path: str, size: int, fishermen: int = 50) -> CatchLogService:
+    """
+    Створення бази даних з заданою кількістю виловів.
+
+    Параметри:
+        db_path: Шлях до файлу бази даних
+        size: Кількість виловів
+        fishermen: Кількість різних рибалок
+
+    Повертає:
+        Сервіс журналу виловів для заповненої бази даних
+    """
+    rng = random.Random(size)
+    service = CatchLogService(db_path)
+    service.save_catches_bulk(
+        (f"Рибалка {rng.randrange(fishermen)}", rng.choice(FISH_SPECIES),
+         round(rng.uniform(0.2, 5.0), 2))
+        for _ in range(size))
+    return service
+
+
+def bench_catch_log_service(size: int, repeat: int, work_dir: str) -> Dict[str, dict]:
+    """
+    Бенчмарк сервісу журналу виловів на заповненій базі даних.
+
+    Параметри:
+        size: Кількість виловів у базі даних
+        repeat: Кількість повторень вимірювання
+        work_dir: Каталог для тимчасових файлів бази даних
+
+    Повертає:
+        Результати для save_catch, get_all_catches та get_catch_summary
+    """
+    service = _seed_database(os.path.join(work_dir, f"bench_{size}.db"), size)
+    inserts = 200
+    summaries = 500
+    # Кілька запитів на вимірювання: один запит до малої БД коротший за шум таймера
+    reads = max(10, 1000000 // size)
+
+    def save() -> None:
+        for i in range(inserts):
+            service.save_catch("Рибалка 0", FISH_SPECIES[i % len(FISH_SPECIES)], 1.0)
+
+    def read_all() -> None:
+        for _ in range(reads):
+            service.get_all_catches("Рибалка 1")
+
+    def summary() -> None:
+        for i in range(summaries):
+            service.get_catch_summary(f"Рибалка {i % 50}")
+
+    try:
+        return {
+            f'catch_log_service.save_catch[{size}]': measure(save, inserts, repeat),
+            f'catch_log_service.get_all_catches[{size}]': measure(read_all, reads, repeat),
+            f'catch_log_service.get_catch_summary[{size}]': measure(summary, summaries, repeat)
+        }
+    finally:
+        service.close()
+
+
+def bench_sensor(count: int, repeat: int) -> Dict[str, dict]:
+    """
+    Бенчмарк вимірювань датчика.
+
+    Параметри:
+        count: Кількість вимірів
+        repeat: Кількість повторень вимірювання
+
+    Повертає:
+        Результати для поодиноких та пакетних вимірів
+    """
+    sensor = Sensor("BENCH", "Озеро", seed=1)
+
+    def single() -> None:
+        for _ in range(count):
+            sensor.measure_temperature()
+            sensor.measure_water_quality()
+
+    def batch() -> None:
+        sensor.sample_temperatures(count)
+        sensor.sample_water_quality(count)
+
+    return {
+        f'sensor.measure[{count}]': measure(single, count, repeat),
+        f'sensor.sample_batch[{count}]': measure(batch, count, repeat)
+    }
+
+
+def bench_weather(count: int, repeat: int) -> Dict[str, dict]:
+    """
+    Бенчмарк запитів прогнозу погоди.
+
+    Параметри:
+        count: Кількість запитів
+        repeat: Кількість повторень вимірювання
+
+    Повертає:
+        Результати для get_weather_forecast та is_suitable_for_fishing
+    """
+    locations = [f"Озеро {i}" for i in range(count)]
+
+    def forecast() -> None:
+        for location in locations:
+            WeatherService.get_weather_forecast(location)
+
+    forecasts = [WeatherService.get_weather_forecast(location) for location in locations]
+
+    def suitability() -> None:
+        for item in forecasts:
+            WeatherService.is_suitable_for_fishing(item)
+
+    return {
+        f'weather.get_weather_forecast[{count}]': measure(forecast, count, repeat),
+        f'weather.is_suitable_for_fishing[{count}]': measure(suitability, count, repeat)
+    }
+
+
+def bench_cold_start(repeat: int, work_dir: str) -> Dict[str, dict]:
+    """
+    Бенчмарк холодного запуску програми в новому процесі інтерпретатора.
+
+    Запуск порожнього інтерпретатора вимірюється окремо як нижня межа.
+
+    Параметри:
+        repeat: Кількість повторень вимірювання
+        work_dir: Каталог для тимчасових файлів бази даних
+
+    Повертає:
+        Результати для запуску інтерпретатора, підкоманд log і report
+        та відкриття бази даних з актуальною схемою
+    """
+    db_path = os.path.join(work_dir, "cold_start.db")
+    _seed_database(db_path, 1000).close()
+
+    def run(*args: str) -> Callable[[], None]:
+        command = [sys.executable, *args]
+        return lambda: subprocess.run(command, check=True, stdout=subprocess.DEVNULL)
+
+    opens = 100
+
+    def open_service() -> None:
+        for _ in range(opens):
+            CatchLogService(db_path).close()
+
+    return {
+        'cold_start.python': measure(run("-c", "pass"), 1, repeat),
+        'cold_start.log': measure(run(APPLICATION, "--quiet", "log", "Рибалка 0", "Окунь", "1.0",
+                                      "--db", db_path), 1, repeat),
+        'cold_start.report': measure(run(APPLICATION, "--quiet", "report", "--db", db_path),
+                                     1, repeat),
+        'catch_log_service.open_current_schema': measure(open_service, opens, repeat)
+    }
+
+
+def run_benchmarks(quick: bool = False, repeat: int = 5) -> dict:
+    """
+    Запуск усіх бенчмарків.
+
+    Параметри:
+        quick: Швидкий режим зі зменшеними розмірами даних
+        repeat: Кількість повторень кожного вимірювання
+
+    Повертає:
+        Словник з метаданими запуску та результатами бенчмарків
+    """
+    log_sizes = [10 ** 3, 10 ** 4] if quick else [10 ** 3, 10 ** 4, 10 ** 5, 10 ** 6]
+    db_sizes = [10 ** 3, 10 ** 4] if quick else [10 ** 3, 10 ** 4, 10 ** 5]
+    results: Dict[str, dict] = {}
+
+    for size in log_sizes:
+        results.update(bench_catch_log(size, repeat))
+    with tempfile.TemporaryDirectory() as work_dir:
+        for size in db_sizes:
+            results.update(bench_catch_log_service(size, repeat, work_dir))
+        results.update(bench_cold_start(repeat, work_dir))
+    results.update(bench_sensor(1000 if quick else 10000, repeat))
+    results.update(bench_weather(1000 if quick else 10000, repeat))
+
+    return {
+        'meta': {
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'quick': quick,
+            'repeat': repeat,
+            'timestamp': time.strftime("%Y-%m-%dT%H:%M:%S")
+        },
+        'results': results
+    }
+
+
+def compare_results(current: dict, baseline: dict,
+                    threshold: float = 0.10) -> List[Tuple[str, float]]:
+    """
+    Порівняння результатів з базовими та пошук регресій.
+
+    Параметри:
+        current: Поточні результати
+        baseline: Базові результати
+        threshold: Допустиме відносне уповільнення (0.10 - 10%)
+
+    Повертає:
+        Список пар (назва бенчмарку, відносна зміна часу) для регресій
+    """
+    regressions = []
+    for name, result in current['results'].items():
+        base = baseline['results'].get(name)
+        if not base or not base['min_s']:
+            continue
+        change = result['min_s'] / base['min_s'] - 1
+        if change > threshold:
+            regressions.append((name, change))
+    return regressions
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Головна функція запуску бенчмарків.
+
+    Параметри:
+        argv: Аргументи командного рядка (за замовчуванням: sys.argv)
+
+    Повертає:
+        Код завершення: 0 - успішно, 1 - знайдено регресії
+    """
+    parser = argparse.ArgumentParser(description="Бенчмарки системи управління рибальством")
+    parser.add_argument("--quick", action="store_true", help="Зменшені розміри даних")
+    parser.add_argument("--repeat", type=int, default=5, help="Кількість повторень вимірювання")
+    parser.add_argument("--output", help="Файл для збереження результатів у JSON")
+    parser.add_argument("--baseline", help="JSON-файл з базовими результатами для порівняння")
+    parser.add_argument("--threshold", type=float, default=0.10,
+                        help="Допустиме уповільнення відносно базових результатів")
+    args = parser.parse_args(argv)
+
+    configure_logging(quiet=True)
+    report = run_benchmarks(quick=args.quick, repeat=args.repeat)
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as output_file:
+            json.dump(report, output_file, ensure_ascii=False, indent=2)
+    else:
+        print(json.dumps(report, ensure_ascii=False, indent=2))
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as baseline_file:
+            baseline = json.load(baseline_file)
+        regressions = compare_results(report, baseline, args.threshold)
+        for name, change in regressions:
+            print(f"[Regression] {name}: повільніше на {change:.1%}", file=sys.stderr)
+        if regressions:
+            return 1
+        print("[Benchmark] Регресій не виявлено", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
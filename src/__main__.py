@@ -0,0 +1,15 @@
+"""
+Точка входу пакета: запуск підкоманд командою `python src <команда>`
+або `python -m src <команда>`.
+"""
+
+import os
+import sys
+
+# Модулі пакета імпортують один одного без префікса пакета, тому папка src
+# має бути в шляху пошуку модулів і при запуску через `python -m src`
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from cli import main
+
+sys.exit(main())
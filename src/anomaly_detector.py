@@ -0,0 +1,227 @@
+"""
+Модуль потокового виявлення аномалій у вимірах датчиків.
+
+Цей модуль обробляє потік вимірів датчиків (генератор або асинхронний
+потік) і для кожного датчика підтримує ковзну статистику сталого розміру:
+експоненційне ковзне середнє (EWMA) та дисперсію за алгоритмом Велфорда.
+Сплески температури та погіршення якості води повідомляються одразу,
+без зберігання повної історії вимірів.
+"""
+
+import math
+import time
+from typing import AsyncIterator, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from logging_config import get_logger
+from sensor import QUALITY_LEVELS, Sensor
+
+logger = get_logger("anomaly_detector")
+
+# Вимір у потоці: (ідентифікатор датчика, мітка часу, температура, код якості або None)
+Reading = Tuple[str, float, float, Optional[int]]
+
+
+class SensorStats:
+    """
+    Ковзна статистика одного датчика сталого розміру.
+    """
+
+    __slots__ = ('count', 'mean', 'm2', 'ewma', 'last_quality')
+
+    def __init__(self) -> None:
+        """
+        Ініціалізація порожньої статистики.
+        """
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.ewma = 0.0
+        self.last_quality: Optional[int] = None
+
+    def update(self, value: float, alpha: float) -> None:
+        """
+        Оновлення статистики новим значенням температури.
+
+        Параметри:
+            value: Нове значення
+            alpha: Коефіцієнт згладжування EWMA
+        """
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
+        self.ewma = value if self.count == 1 else alpha * value + (1 - alpha) * self.ewma
+
+    @property
+    def stdev(self) -> float:
+        """
+        Вибіркове стандартне відхилення температури.
+
+        Повертає:
+            Стандартне відхилення або 0.0, якщо вимірів менше двох
+        """
+        return math.sqrt(self.m2 / (self.count - 1)) if self.count > 1 else 0.0
+
+
+class AnomalyDetector:
+    """
+    Потоковий детектор аномалій для тисяч датчиків.
+
+    Сплеск температури - відхилення виміру від EWMA більш ніж на
+    z_threshold стандартних відхилень. Погіршення якості - зростання коду
+    якості (індексу у QUALITY_LEVELS) щонайменше на quality_drop рівнів.
+    """
+
+    def __init__(self, alpha: float = 0.1, z_threshold: float = 3.0,
+                 warmup: int = 10, quality_drop: int = 1) -> None:
+        """
+        Ініціалізація детектора.
+
+        Параметри:
+            alpha: Коефіцієнт згладжування EWMA
+            z_threshold: Поріг відхилення у стандартних відхиленнях
+            warmup: Кількість вимірів датчика до початку перевірки сплесків
+            quality_drop: Мінімальне погіршення якості (у рівнях) для сповіщення
+        """
+        self.alpha = alpha
+        self.z_threshold = z_threshold
+        self.warmup = warmup
+        self.quality_drop = quality_drop
+        self._stats: Dict[str, SensorStats] = {}
+        self.alert_count = 0
+
+    def update(self, sensor_id: str, timestamp: float, temperature: float,
+               quality: Optional[int] = None) -> List[dict]:
+        """
+        Обробка одного виміру датчика.
+
+        Параметри:
+            sensor_id: Ідентифікатор датчика
+            timestamp: Мітка часу виміру
+            temperature: Температура води
+            quality: Код якості води (опціонально)
+
+        Повертає:
+            Список сповіщень, спричинених цим виміром (зазвичай порожній)
+        """
+        stats = self._stats.get(sensor_id)
+        if stats is None:
+            stats = self._stats[sensor_id] = SensorStats()
+
+        alerts = []
+        if stats.count >= self.warmup:
+            stdev = stats.stdev
+            if stdev > 0 and abs(temperature - stats.ewma) > self.z_threshold * stdev:
+                alerts.append({
+                    'sensor_id': sensor_id,
+                    'timestamp': timestamp,
+                    'type': 'temperature_spike',
+                    'value': temperature,
+                    'expected': round(stats.ewma, 2)
+                })
+        if quality is not None:
+            if stats.last_quality is not None and quality - stats.last_quality >= self.quality_drop:
+                alerts.append({
+                    'sensor_id': sensor_id,
+                    'timestamp': timestamp,
+                    'type': 'quality_drop',
+                    'value': QUALITY_LEVELS[quality],
+                    'expected': QUALITY_LEVELS[stats.last_quality]
+                })
+            stats.last_quality = quality
+        stats.update(temperature, self.alpha)
+
+        for alert in alerts:
+            self.alert_count += 1
+            logger.warning("[Anomaly] Датчик %s: %s (%s, очікувалось %s)",
+                           alert['sensor_id'], alert['type'], alert['value'], alert['expected'])
+        return alerts
+
+    def process(self, readings: Iterable[Reading]) -> Iterator[dict]:
+        """
+        Обробка потоку вимірів з видачею сповіщень у міру їх виникнення.
+
+        Параметри:
+            readings: Потік вимірів (sensor_id, timestamp, temperature, quality)
+
+        Повертає:
+            Генератор сповіщень
+        """
+        update = self.update
+        for sensor_id, timestamp, temperature, quality in readings:
+            alerts = update(sensor_id, timestamp, temperature, quality)
+            if alerts:
+                yield from alerts
+
+    async def process_async(self, readings: AsyncIterator[Reading]) -> AsyncIterator[dict]:
+        """
+        Обробка асинхронного потоку вимірів.
+
+        Параметри:
+            readings: Асинхронний потік вимірів (sensor_id, timestamp, temperature, quality)
+
+        Повертає:
+            Асинхронний генератор сповіщень
+        """
+        async for sensor_id, timestamp, temperature, quality in readings:
+            for alert in self.update(sensor_id, timestamp, temperature, quality):
+                yield alert
+
+    def get_stats(self, sensor_id: str) -> Optional[dict]:
+        """
+        Отримання поточної ковзної статистики датчика.
+
+        Параметри:
+            sensor_id: Ідентифікатор датчика
+
+        Повертає:
+            Словник з кількістю вимірів, середнім, стандартним відхиленням,
+            EWMA та останнім рівнем якості, або None для невідомого датчика
+        """
+        stats = self._stats.get(sensor_id)
+        if stats is None:
+            return None
+        return {
+            'count': stats.count,
+            'mean': stats.mean,
+            'stdev': stats.stdev,
+            'ewma': stats.ewma,
+            'last_quality': (QUALITY_LEVELS[stats.last_quality]
+                             if stats.last_quality is not None else None)
+        }
+
+    def __len__(self) -> int:
+        """
+        Отримання кількості відстежуваних датчиків.
+
+        Повертає:
+            Кількість датчиків
+        """
+        return len(self._stats)
+
+
+def stream_sensor_readings(sensors: Iterable[Sensor], rounds: int,
+                           interval: float = 1.0,
+                           start_time: Optional[float] = None) -> Iterator[Reading]:
+    """
+    Генератор вимірів групи датчиків раунд за раундом.
+
+    У кожному раунді всі датчики опитуються пакетно, а виміри видаються
+    по одному, тому в пам'яті зберігається лише один раунд.
+
+    Параметри:
+        sensors: Датчики для опитування
+        rounds: Кількість раундів опитування
+        interval: Інтервал між раундами у секундах
+        start_time: Мітка часу першого раунду (за замовчуванням: поточний час)
+
+    Повертає:
+        Генератор вимірів (sensor_id, timestamp, temperature, quality)
+    """
+    sensors = list(sensors)
+    for round_index in range(rounds):
+        timestamp = time.time() if start_time is None else start_time + round_index * interval
+        batch = Sensor.sample_many(sensors, 1, interval, timestamp)
+        for sensor in sensors:
+            temperatures, qualities = batch[sensor.sensor_id]
+            yield sensor.sensor_id, timestamp, temperatures[0], qualities[0]
@@ -0,0 +1,280 @@
+"""
+Модуль асинхронного сервісу журналу виловів.
+
+Цей модуль надає asyncio-інтерфейс до журналу виловів у SQLite базі даних.
+Записи передаються через чергу окремому потоку-записувачу, який зберігає
+їх пакетами, тому цикл подій не блокується на операціях з базою даних.
+"""
+
+import asyncio
+import queue
+import sqlite3
+import threading
+from typing import Iterable, List, Optional, Tuple
+from catch_log_service import CatchLogService
+
+
+def _resolve_future(future: 'asyncio.Future', error: Optional[BaseException]) -> None:
+    """
+    Завершення очікування запису, якщо його ще не скасовано.
+
+    Параметри:
+        future: Future, що очікує збереження запису
+        error: Помилка збереження або None, якщо записи збережено
+    """
+    if future.done():
+        return
+    if error is None:
+        future.set_result(None)
+    else:
+        future.set_exception(error)
+
+
+class AsyncCatchLogService:
+    """
+    Асинхронний сервіс для управління журналом виловів в SQLite базі даних.
+
+    Має ті самі методи, що й CatchLogService, але у вигляді корутин.
+    Записи від багатьох рибалок накопичуються в черзі й фіксуються
+    потоком-записувачем однією транзакцією на пакет.
+    """
+
+    def __init__(self, db_path: str = "fishing.db", batch_size: int = 500) -> None:
+        """
+        Ініціалізація асинхронного сервісу журналу виловів.
+
+        Параметри:
+            db_path: Шлях до файлу SQLite бази даних (за замовчуванням: fishing.db)
+            batch_size: Максимальна кількість записів, що об'єднуються в одну
+                транзакцію; більший виклик save_catches_bulk зберігається
+                окремою транзакцією цілком
+        """
+        self.db_path = db_path
+        self.batch_size = batch_size
+        self._service = CatchLogService(db_path)
+        self._queue: 'queue.Queue' = queue.Queue()
+        self._closed = False
+        self._close_lock = threading.Lock()
+        self._writer = threading.Thread(target=self._writer_loop,
+                                        name="catch-log-writer", daemon=True)
+        self._writer.start()
+
+    def _next_batch(self, carry: Optional[tuple]) -> Tuple[list, Optional[tuple]]:
+        """
+        Збирання з черги пакета запитів, що разом містять не більше
+        batch_size записів.
+
+        Параметри:
+            carry: Запит, що не вмістився в попередній пакет (опціонально)
+
+        Повертає:
+            Пару (запити пакета, запит для наступного пакета або None);
+            None серед запитів пакета означає зупинку потоку-записувача
+        """
+        batch = [carry if carry is not None else self._queue.get()]
+        rows = 0 if batch[0] is None else len(batch[0][0])
+        while batch[-1] is not None and rows < self.batch_size:
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if item is not None:
+                if rows + len(item[0]) > self.batch_size:
+                    return batch, item
+                rows += len(item[0])
+            batch.append(item)
+        return batch, None
+
+    def _save_rows(self, rows: List[tuple]) -> Optional[BaseException]:
+        """
+        Збереження записів однією транзакцією.
+
+        Параметри:
+            rows: Записи виловів
+
+        Повертає:
+            Помилку збереження або None, якщо записи збережено
+        """
+        try:
+            if not self._service.save_catches_bulk(rows):
+                return sqlite3.DatabaseError("Не вдалося зберегти пакет виловів")
+        except Exception as e:
+            # Помилку передано очікувачам, щоб жоден з них не чекав вічно
+            return e
+        return None
+
+    def _writer_loop(self) -> None:
+        """
+        Основний цикл потоку-записувача: збирає пакет записів з черги
+        та зберігає його в базу даних.
+
+        Якщо пакет кількох викликів не вдалося зберегти, записи кожного
+        виклику повторюються окремою транзакцією, тому помилковий запис
+        одного рибалки не скасовує записи інших.
+        """
+        running = True
+        carry = None
+        while running:
+            batch, carry = self._next_batch(carry)
+            requests = []
+            for item in batch:
+                if item is None:
+                    running = False
+                    continue
+                requests.append(item)
+            if not requests:
+                continue
+
+            error = self._save_rows([row for rows, _, _ in requests for row in rows])
+            if error is not None and len(requests) > 1:
+                results = [(loop, future, self._save_rows(rows))
+                           for rows, loop, future in requests]
+            else:
+                results = [(loop, future, error) for _, loop, future in requests]
+            for loop, future, item_error in results:
+                try:
+                    loop.call_soon_threadsafe(_resolve_future, future, item_error)
+                except RuntimeError:
+                    # Цикл подій уже закрито, очікувати результат нікому
+                    pass
+
+    async def _enqueue(self, rows: List[tuple]) -> None:
+        """
+        Передача записів потоку-записувачу та очікування їх збереження.
+
+        Параметри:
+            rows: Записи у вигляді кортежів (ім'я рибалки, вид риби, вага[, експедиція, точка])
+
+        Викликає sqlite3.DatabaseError, якщо пакет не вдалося зберегти,
+        та RuntimeError, якщо сервіс уже закрито.
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        with self._close_lock:
+            if self._closed:
+                raise RuntimeError("[AsyncCatchLogService] Сервіс журналу виловів закрито")
+            self._queue.put((rows, loop, future))
+        await future
+
+    async def save_catch(self, fisherman_name: str, fish_species: str, weight: float,
+                         trip_id: Optional[int] = None, spot: Optional[str] = None) -> None:
+        """
+        Збереження запису про вилов риби в базу даних.
+
+        Параметри:
+            fisherman_name: Ім'я рибалки
+            fish_species: Вид риби
+            weight: Вага риби у кілограмах
+            trip_id: Ідентифікатор експедиції (опціонально)
+            spot: Точка кльову, де виловлено рибу (опціонально)
+        """
+        try:
+            await self._enqueue([(fisherman_name, fish_species, weight, trip_id, spot)])
+        except sqlite3.Error:
+            # Помилку вже записано в журнал сервісом, як і в CatchLogService.save_catch
+            pass
+
+    async def save_catches_bulk(self, catches: Iterable[tuple]) -> int:
+        """
+        Пакетне збереження записів виловів.
+
+        Параметри:
+            catches: Послідовність кортежів (ім'я рибалки, вид риби, вага),
+                які можуть бути доповнені ідентифікатором експедиції та точкою кльову
+
+        Повертає:
+            Кількість збережених записів (0, якщо пакет не вдалося зберегти)
+        """
+        rows = list(catches)
+        if not rows:
+            return 0
+        try:
+            await self._enqueue(rows)
+        except sqlite3.Error:
+            return 0
+        return len(rows)
+
+    async def get_all_catches(self, fisherman_name: Optional[str] = None) -> List[dict]:
+        """
+        Отримання всіх записів виловів з бази даних.
+
+        Параметри:
+            fisherman_name: Фільтр за іменем рибалки (опціонально)
+
+        Повертає:
+            Список словників з інформацією про виловів
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self._service.get_all_catches, fisherman_name)
+
+    async def get_catch_summary(self, fisherman_name: str) -> dict:
+        """
+        Отримання зведеної інформації про виловів конкретного рибалки.
+
+        Параметри:
+            fisherman_name: Ім'я рибалки
+
+        Повертає:
+            Словник з кількістю та загальною вагою виловів
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self._service.get_catch_summary, fisherman_name)
+
+    async def start_trip(self, fisherman_name: str, location: str,
+                         depth_map: Optional[str] = None) -> Optional[int]:
+        """
+        Збереження початку рибальської експедиції.
+
+        Запис виконується в пулі потоків, щоб очікування блокування БД
+        не зупиняло цикл подій.
+
+        Параметри:
+            fisherman_name: Ім'я рибалки-організатора
+            location: Назва водойми/місцезнаходження
+            depth_map: Інформація про карту глибин (опціонально)
+
+        Повертає:
+            Ідентифікатор експедиції або None у разі помилки
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self._service.start_trip,
+                                          fisherman_name, location, depth_map)
+
+    async def end_trip(self, trip_id: int) -> None:
+        """
+        Збереження завершення рибальської експедиції.
+
+        Параметри:
+            trip_id: Ідентифікатор експедиції
+        """
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, self._service.end_trip, trip_id)
+
+    async def get_trip_stats(self, trip_id: int) -> Optional[dict]:
+        """
+        Отримання статистики однієї експедиції.
+
+        Параметри:
+            trip_id: Ідентифікатор експедиції
+
+        Повертає:
+            Словник зі статистикою експедиції або None
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self._service.get_trip_stats, trip_id)
+
+    async def close(self) -> None:
+        """
+        Запис усіх записів з черги, зупинка потоку-записувача та закриття
+        з'єднань з базою даних.
+
+        Після закриття запис виловів викликає RuntimeError.
+        """
+        with self._close_lock:
+            if self._closed:
+                return
+            self._closed = True
+            self._queue.put(None)
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, self._writer.join)
+        self._service.close()
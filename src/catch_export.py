@@ -0,0 +1,285 @@
+"""
+Модуль колонкового експорту та імпорту таблиці виловів.
+
+Цей модуль вивантажує таблицю catches у каталог з окремим файлом
+формату NumPy .npy для кожної колонки. Рядкові колонки (ім'я рибалки,
+вид риби, точка кльову) зберігаються як коди зі словником у
+manifest.json, а невелика таблиця trips - у trips.json, щоб вилови
+після імпорту залишалися прив'язаними до експедицій. Експорт та імпорт
+виловів виконуються частинами, тому пам'ять не залежить від розміру
+таблиці. Файли .npy пишуться без залежності від NumPy, але читаються
+нею напряму (numpy.load).
+"""
+
+import calendar
+import json
+import math
+import os
+import sys
+import time
+from array import array
+from typing import BinaryIO, Dict, Iterator, List, Optional
+
+from catch_log_service import CatchLogService
+from logging_config import get_logger
+from npy_format import npy_header, read_npy_header
+
+logger = get_logger("catch_export")
+
+TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M:%S"
+TRIPS_FILE = "trips.json"
+# Значення цілочисельних колонок для NULL (вилов без експедиції чи точки)
+NULL_CODE = -1
+
+# Колонки експорту: назва -> (dtype NumPy, код типу array)
+COLUMNS: Dict[str, tuple] = {
+    'id': ('<i8', 'q'),
+    'fisherman_code': ('<u4', 'I'),
+    'species_code': ('<u4', 'I'),
+    'weight': ('<f8', 'd'),
+    'timestamp': ('<f8', 'd'),
+    'trip_id': ('<i8', 'q'),
+    'spot_code': ('<i4', 'i'),
+}
+
+
+class _NpyColumnWriter:
+    """
+    Потоковий запис одновимірного масиву у файл .npy.
+    """
+
+    def __init__(self, path: str, dtype: str, typecode: str) -> None:
+        """
+        Відкриття файлу та запис тимчасового заголовка.
+
+        Параметри:
+            path: Шлях до файлу .npy
+            dtype: Опис типу NumPy
+            typecode: Код типу array
+        """
+        self.dtype = dtype
+        self.typecode = typecode
+        self.length = 0
+        self._file: BinaryIO = open(path, "wb")
+        self._file.write(npy_header(dtype, (0,)))
+
+    def write(self, values: array) -> None:
+        """
+        Дописування значень у файл.
+
+        Параметри:
+            values: Масив значень з кодом типу typecode
+        """
+        if sys.byteorder == "big":
+            values = array(self.typecode, values)
+            values.byteswap()
+        values.tofile(self._file)
+        self.length += len(values)
+
+    def close(self) -> None:
+        """
+        Запис остаточного заголовка з кількістю елементів та закриття файлу.
+        """
+        self._file.seek(0)
+        self._file.write(npy_header(self.dtype, (self.length,)))
+        self._file.close()
+
+
+class _NpyColumnReader:
+    """
+    Потокове читання одновимірного масиву з файлу .npy.
+    """
+
+    def __init__(self, path: str, typecode: str) -> None:
+        """
+        Відкриття файлу та розбір заголовка.
+
+        Параметри:
+            path: Шлях до файлу .npy
+            typecode: Код типу array
+        """
+        self.typecode = typecode
+        self._file: BinaryIO = open(path, "rb")
+        dtype, shape, _ = read_npy_header(self._file)
+        self.length = shape[0]
+        self._swap = dtype[0] == "<" and sys.byteorder == "big"
+
+    def read(self, count: int) -> array:
+        """
+        Читання наступних значень з файлу.
+
+        Параметри:
+            count: Максимальна кількість значень
+
+        Повертає:
+            Масив array (порожній наприкінці файлу)
+        """
+        values = array(self.typecode)
+        data = self._file.read(count * values.itemsize)
+        values.frombytes(data)
+        if self._swap:
+            values.byteswap()
+        return values
+
+    def close(self) -> None:
+        """
+        Закриття файлу.
+        """
+        self._file.close()
+
+
+def _timestamp_to_epoch(timestamp: Optional[str]) -> float:
+    """
+    Перетворення мітки часу SQLite (UTC) на секунди Unix.
+
+    Параметри:
+        timestamp: Мітка часу у форматі 'YYYY-MM-DD HH:MM:SS' або None
+
+    Повертає:
+        Секунди Unix або NaN для відсутньої мітки часу
+    """
+    if not timestamp:
+        return math.nan
+    return float(calendar.timegm(time.strptime(timestamp[:19], TIMESTAMP_FORMAT)))
+
+
+def _epoch_to_timestamp(epoch: float) -> Optional[str]:
+    """
+    Перетворення секунд Unix на мітку часу SQLite (UTC).
+
+    Параметри:
+        epoch: Секунди Unix або NaN
+
+    Повертає:
+        Мітка часу у форматі 'YYYY-MM-DD HH:MM:SS' або None
+    """
+    if math.isnan(epoch):
+        return None
+    return time.strftime(TIMESTAMP_FORMAT, time.gmtime(epoch))
+
+
+def export_catches(service: CatchLogService, directory: str,
+                   chunk_size: int = 50000) -> dict:
+    """
+    Експорт таблиці catches у колонкові файли .npy та таблиці trips у JSON.
+
+    Параметри:
+        service: Сервіс журналу виловів (CatchLogService або ShardedCatchLogService)
+        directory: Каталог для файлів експорту (створюється за потреби)
+        chunk_size: Кількість записів, що обробляються за один крок
+
+    Повертає:
+        Маніфест експорту (кількість рядків, колонки, словники кодів)
+    """
+    os.makedirs(directory, exist_ok=True)
+    writers = {name: _NpyColumnWriter(os.path.join(directory, f"{name}.npy"), dtype, typecode)
+               for name, (dtype, typecode) in COLUMNS.items()}
+    dictionaries: Dict[str, Dict[str, int]] = {'fisherman_code': {}, 'species_code': {},
+                                               'spot_code': {}}
+
+    def encode(column: str, value: Optional[str]) -> int:
+        if value is None:
+            return NULL_CODE
+        codes = dictionaries[column]
+        code = codes.get(value)
+        if code is None:
+            code = codes[value] = len(codes)
+        return code
+
+    try:
+        for chunk in service.iter_catch_chunks(chunk_size):
+            writers['id'].write(array('q', [row[0] for row in chunk]))
+            writers['fisherman_code'].write(array('I', [encode('fisherman_code', row[1]) for row in chunk]))
+            writers['species_code'].write(array('I', [encode('species_code', row[2]) for row in chunk]))
+            writers['weight'].write(array('d', [row[3] for row in chunk]))
+            writers['timestamp'].write(array('d', [_timestamp_to_epoch(row[4]) for row in chunk]))
+            writers['trip_id'].write(array('q', [NULL_CODE if row[5] is None else row[5]
+                                                 for row in chunk]))
+            writers['spot_code'].write(array('i', [encode('spot_code', row[6]) for row in chunk]))
+    finally:
+        for writer in writers.values():
+            writer.close()
+
+    trips = service.get_all_trips()
+    with open(os.path.join(directory, TRIPS_FILE), "w", encoding="utf-8") as trips_file:
+        json.dump(trips, trips_file, ensure_ascii=False)
+
+    manifest = {
+        'rows': writers['id'].length,
+        'columns': {name: dtype for name, (dtype, _) in COLUMNS.items()},
+        'dictionaries': {column: list(codes) for column, codes in dictionaries.items()},
+        'null_code': NULL_CODE,
+        'timestamp_unit': 'seconds since epoch (UTC)',
+        'trips': len(trips)
+    }
+    with open(os.path.join(directory, "manifest.json"), "w", encoding="utf-8") as manifest_file:
+        json.dump(manifest, manifest_file, ensure_ascii=False, indent=2)
+    logger.info("[CatchExport] Експортовано %d виловів у '%s'", manifest['rows'], directory)
+    return manifest
+
+
+def _read_chunks(directory: str, manifest: dict, chunk_size: int) -> Iterator[List[tuple]]:
+    """
+    Читання експортованих колонок частинами у вигляді рядків таблиці.
+
+    Параметри:
+        directory: Каталог з файлами експорту
+        manifest: Маніфест експорту
+        chunk_size: Кількість записів в одній частині
+
+    Експорти без колонок trip_id та spot_code (створені до їх появи)
+    читаються з NULL у цих колонках.
+
+    Повертає:
+        Генератор списків кортежів
+        (id, fisherman_name, fish_species, weight, timestamp, trip_id, spot)
+    """
+    fishermen = manifest['dictionaries']['fisherman_code']
+    species = manifest['dictionaries']['species_code']
+    spots = manifest['dictionaries'].get('spot_code', [])
+    readers = {name: _NpyColumnReader(os.path.join(directory, f"{name}.npy"), typecode)
+               for name, (_, typecode) in COLUMNS.items() if name in manifest['columns']}
+    try:
+        while True:
+            ids = readers['id'].read(chunk_size)
+            if not ids:
+                return
+            fisherman_codes = readers['fisherman_code'].read(chunk_size)
+            species_codes = readers['species_code'].read(chunk_size)
+            weights = readers['weight'].read(chunk_size)
+            timestamps = readers['timestamp'].read(chunk_size)
+            nulls = [NULL_CODE] * len(ids)
+            trip_ids = readers['trip_id'].read(chunk_size) if 'trip_id' in readers else nulls
+            spot_codes = readers['spot_code'].read(chunk_size) if 'spot_code' in readers else nulls
+            yield [(ids[i], fishermen[fisherman_codes[i]], species[species_codes[i]],
+                    weights[i], _epoch_to_timestamp(timestamps[i]),
+                    None if trip_ids[i] == NULL_CODE else trip_ids[i],
+                    None if spot_codes[i] == NULL_CODE else spots[spot_codes[i]])
+                   for i in range(len(ids))]
+    finally:
+        for reader in readers.values():
+            reader.close()
+
+
+def import_catches(service: CatchLogService, directory: str,
+                   chunk_size: int = 50000) -> int:
+    """
+    Завантаження експортованих експедицій та колонок виловів в одній транзакції.
+
+    Параметри:
+        service: Сервіс журналу виловів (CatchLogService або ShardedCatchLogService)
+        directory: Каталог з файлами експорту
+        chunk_size: Кількість записів, що обробляються за один крок
+
+    Повертає:
+        Кількість завантажених записів
+    """
+    with open(os.path.join(directory, "manifest.json"), encoding="utf-8") as manifest_file:
+        manifest = json.load(manifest_file)
+    trips: List[list] = []
+    trips_path = os.path.join(directory, TRIPS_FILE)
+    if os.path.exists(trips_path):
+        with open(trips_path, encoding="utf-8") as trips_file:
+            trips = json.load(trips_file)
+    return service.import_catches(_read_chunks(directory, manifest, chunk_size),
+                                  [tuple(trip) for trip in trips])
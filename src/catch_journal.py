@@ -0,0 +1,258 @@
+"""
+Модуль журналу попереднього запису (write-ahead) для виловів.
+
+Цей модуль відокремлює реєстрацію вилову від запису в базу даних.
+Кожен вилов спочатку дописується рядком JSON у локальний файл журналу,
+після чого фоновий потік пакетами зберігає вилови в SQLite. Черга між
+ними обмежена: якщо база даних не встигає, реєстрація чекає (зворотний
+тиск) замість необмеженого зростання пам'яті. Номер останнього
+збереженого запису фіксується в базі даних у тій самій транзакції, що й
+вилови, тому після збою записи журналу, яких ще немає в базі даних,
+повторюються при наступному запуску рівно один раз.
+"""
+
+import json
+import os
+import queue
+import threading
+import time
+from typing import List, Optional, Tuple, Union, TYPE_CHECKING
+
+from catch_log_service import CatchLogService
+from logging_config import get_logger
+
+if TYPE_CHECKING:
+    from sharded_catch_log_service import ShardedCatchLogService
+
+logger = get_logger("catch_journal")
+
+# Запис журналу: (ім'я рибалки, вид риби, вага, експедиція, точка кльову)
+JournalRecord = Tuple[str, str, float, Optional[int], Optional[str]]
+
+_STOP = object()
+
+
+class CatchJournal:
+    """
+    Журнал попереднього запису виловів з фоновим записом у базу даних.
+
+    Один журнал може використовуватися багатьма рибалками (і потоками)
+    одночасно.
+    """
+
+    def __init__(self, path: str,
+                 service: Union[CatchLogService, 'ShardedCatchLogService'], batch_size: int = 500,
+                 max_pending: int = 10000, flush_interval: float = 0.5,
+                 sync: bool = False, retry_delay: float = 1.0) -> None:
+        """
+        Відкриття журналу, повторення незбережених записів та запуск
+        фонового потоку запису.
+
+        Параметри:
+            path: Шлях до файлу журналу
+            service: Сервіс журналу виловів (CatchLogService або
+                ShardedCatchLogService) для збереження записів
+            batch_size: Максимальна кількість виловів в одній транзакції
+            max_pending: Максимальна кількість виловів у черзі до запису в БД
+            flush_interval: Час у секундах, після якого неповний пакет записується
+            sync: Викликати fsync після кожного запису (захист від втрати живлення)
+            retry_delay: Пауза у секундах перед повтором невдалого запису в БД
+        """
+        self.path = path
+        self.journal_id = os.path.abspath(path)
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.sync = sync
+        self.retry_delay = retry_delay
+        self._service = service
+        self._queue: 'queue.Queue' = queue.Queue(maxsize=max_pending)
+        self._lock = threading.Lock()
+        self._committed = threading.Condition()
+        self._closed = False
+        self._stopping = False
+        self._abandoned = False
+
+        self._committed_seq = self._service.get_journal_checkpoint(self.journal_id)
+        self._seq = max(self._committed_seq, self._replay())
+        self._committed_seq = self._seq
+        self._file = open(path, "w", encoding="utf-8")
+
+        self._flusher = threading.Thread(target=self._flush_loop,
+                                         name="catch-journal-flusher", daemon=True)
+        self._flusher.start()
+
+    def _replay(self) -> int:
+        """
+        Збереження в БД записів журналу, яких там ще немає.
+
+        Незавершений останній рядок (обірваний збоєм запис) пропускається.
+
+        Повертає:
+            Номер останнього запису у файлі журналу (0 для порожнього журналу)
+        """
+        if not os.path.exists(self.path):
+            return 0
+        last_seq = 0
+        pending: List[Tuple[int, JournalRecord]] = []
+        with open(self.path, encoding="utf-8") as journal_file:
+            for line in journal_file:
+                try:
+                    seq, *record = json.loads(line)
+                except ValueError:
+                    logger.warning("[CatchJournal] Пропущено пошкоджений запис журналу '%s'",
+                                   self.path)
+                    continue
+                last_seq = max(last_seq, seq)
+                if seq > self._committed_seq:
+                    pending.append((seq, tuple(record)))
+        for start in range(0, len(pending), self.batch_size):
+            batch = pending[start:start + self.batch_size]
+            if not self._service.save_journal_batch(self.journal_id, batch[-1][0], batch):
+                raise RuntimeError(f"Не вдалося повторити журнал '{self.path}'")
+        if pending:
+            logger.info("[CatchJournal] Повторено %d виловів з журналу '%s'",
+                        len(pending), self.path)
+        return last_seq
+
+    def append(self, record: JournalRecord) -> int:
+        """
+        Дописування вилову в журнал.
+
+        Метод повертається, щойно запис потрапив у файл журналу; запис у
+        БД виконується у фоні. Якщо черга заповнена, метод чекає.
+
+        Параметри:
+            record: Кортеж (ім'я рибалки, вид риби, вага, експедиція, точка кльову)
+
+        Повертає:
+            Номер запису в журналі
+        """
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("Журнал виловів закрито")
+            self._seq += 1
+            self._file.write(json.dumps([self._seq, *record], ensure_ascii=False) + "\n")
+            self._file.flush()
+            if self.sync:
+                os.fsync(self._file.fileno())
+            # Додавання до черги під блокуванням зберігає порядок номерів записів
+            self._queue.put((self._seq, record))
+            return self._seq
+
+    def _flush_loop(self) -> None:
+        """
+        Основний цикл фонового потоку: збирає пакети з черги та зберігає їх у БД.
+        """
+        running = True
+        while running:
+            try:
+                item = self._queue.get(timeout=self.flush_interval)
+            except queue.Empty:
+                self._compact()
+                continue
+            batch = []
+            while True:
+                if item is _STOP:
+                    running = False
+                else:
+                    batch.append(item)
+                if not running or len(batch) >= self.batch_size:
+                    break
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+            if batch:
+                self._commit(batch)
+        self._compact()
+
+    def _commit(self, batch: List[Tuple[int, JournalRecord]]) -> None:
+        """
+        Збереження пакета в БД з повторами у разі помилки.
+
+        Якщо журнал закривається, а БД недоступна, записи залишаються у
+        файлі журналу і будуть повторені при наступному запуску.
+
+        Параметри:
+            batch: Пари (номер запису, запис)
+        """
+        if self._abandoned:
+            return
+        while not self._service.save_journal_batch(self.journal_id, batch[-1][0], batch):
+            if self._stopping:
+                # Наступні пакети теж не зберігаються, щоб позначка журналу
+                # не перескочила через незбережені записи
+                self._abandoned = True
+                logger.error("[CatchJournal] Незбережені вилови залишено в журналі '%s' "
+                             "до наступного запуску", self.path)
+                return
+            time.sleep(self.retry_delay)
+        with self._committed:
+            self._committed_seq = batch[-1][0]
+            self._committed.notify_all()
+
+    def _compact(self) -> None:
+        """
+        Очищення файлу журналу, якщо всі його записи вже збережено в БД.
+        """
+        if not self._lock.acquire(blocking=False):
+            return
+        try:
+            if self._committed_seq == self._seq and self._file.tell():
+                self._file.seek(0)
+                self._file.truncate()
+        finally:
+            self._lock.release()
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Очікування збереження в БД усіх дописаних виловів.
+
+        Параметри:
+            timeout: Максимальний час очікування у секундах (None - без обмеження)
+
+        Повертає:
+            True, якщо всі вилови збережено, інакше False
+        """
+        target = self._seq
+        with self._committed:
+            return self._committed.wait_for(lambda: self._committed_seq >= target, timeout)
+
+    @property
+    def pending(self) -> int:
+        """
+        Кількість виловів, ще не збережених у БД.
+
+        Повертає:
+            Кількість записів журналу після останнього збереженого
+        """
+        return self._seq - self._committed_seq
+
+    def close(self) -> None:
+        """
+        Запис усіх виловів з черги, зупинка фонового потоку та закриття файлу.
+        """
+        if self._closed:
+            return
+        self._stopping = True
+        self._queue.put(_STOP)
+        self._flusher.join()
+        with self._lock:
+            self._closed = True
+            self._file.close()
+        logger.info("[CatchJournal] Журнал '%s' закрито", self.path)
+
+    def __enter__(self) -> 'CatchJournal':
+        """
+        Вхід у контекстний менеджер журналу.
+
+        Повертає:
+            Поточний журнал
+        """
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        """
+        Вихід з контекстного менеджера із закриттям журналу.
+        """
+        self.close()
@@ -5,7 +5,111 @@
 без звернення до бази даних.
 """
 
-from typing import List
+from array import array
+from typing import Dict, List, Optional, Sequence
+from logging_config import get_logger
+
+logger = get_logger("catch_log")
+
+
+class ColumnView(Sequence):
+    """
+    Представлення колонки журналу тільки для читання без копіювання даних.
+    
+    Відображає поточний вміст колонки, включно з записами, доданими
+    після створення представлення.
+    """
+
+    def __init__(self, column: Sequence) -> None:
+        """
+        Ініціалізація представлення колонки.
+        
+        Параметри:
+            column: Масив значень колонки
+        """
+        self._column = column
+
+    def __len__(self) -> int:
+        """
+        Отримання кількості значень у колонці.
+        
+        Повертає:
+            Кількість значень
+        """
+        return len(self._column)
+
+    def __getitem__(self, index):
+        """
+        Отримання значення (або списку значень для зрізу) за індексом.
+        
+        Параметри:
+            index: Індекс або зріз
+            
+        Повертає:
+            Значення колонки
+        """
+        if isinstance(index, slice):
+            return self._column[index].tolist()
+        return self._column[index]
+
+
+class CatchEntriesView(Sequence):
+    """
+    Представлення записів журналу у вигляді словників тільки для читання.
+    
+    Словники {'species', 'weight'} створюються під час звернення до запису,
+    тому представлення не копіює дані журналу.
+    """
+
+    def __init__(self, catch_log: 'CatchLog') -> None:
+        """
+        Ініціалізація представлення записів.
+        
+        Параметри:
+            catch_log: Журнал виловів, записи якого відображаються
+        """
+        self._catch_log = catch_log
+
+    def __len__(self) -> int:
+        """
+        Отримання кількості записів.
+        
+        Повертає:
+            Кількість записів у журналі
+        """
+        return len(self._catch_log._weights)
+
+    def __getitem__(self, index):
+        """
+        Отримання запису (або списку записів для зрізу) за індексом.
+        
+        Параметри:
+            index: Індекс або зріз
+            
+        Повертає:
+            Словник з видом та вагою риби
+        """
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        log = self._catch_log
+        return {
+            'species': log._species_names[log._species_codes[index]],
+            'weight': log._weights[index]
+        }
+
+    def __eq__(self, other: object) -> bool:
+        """
+        Порівняння записів з іншою послідовністю.
+        
+        Параметри:
+            other: Послідовність для порівняння
+            
+        Повертає:
+            True, якщо записи збігаються, інакше False
+        """
+        if isinstance(other, (list, tuple, CatchEntriesView)):
+            return list(self) == list(other)
+        return NotImplemented
 
 
 class CatchLog:
@@ -13,14 +117,22 @@ class CatchLog:
     Локальний журнал виловів у пам'яті.
     
     Накопичує записи про виловлену рибу під час рибальської експедиції
-    перед їх збереженням у базу даних.
+    перед їх збереженням у базу даних. Записи зберігаються по колонках:
+    коди видів риби у масиві array('H') та ваги у масиві array('d').
     """
 
     def __init__(self) -> None:
         """
         Ініціалізація порожнього журналу виловів.
         """
-        self.entries: List[dict] = []
+        self._species_codes = array('H')
+        self._weights = array('d')
+        self._species_names: List[str] = []
+        self._species_index: Dict[str, int] = {}
+        self._total_weight = 0.0
+        self._min_weight: Optional[float] = None
+        self._max_weight: Optional[float] = None
+        self._species_totals: Dict[str, float] = {}
 
     def add_entry(self, fish_species: str, weight: float) -> None:
         """
@@ -30,21 +142,66 @@ class CatchLog:
             fish_species: Вид виловленої риби
             weight: Вага риби у кілограмах
         """
-        entry = {
-            'species': fish_species,
-            'weight': weight
-        }
-        self.entries.append(entry)
-        print(f"[CatchLog] Додано запис: {fish_species} ({weight} кг)")
+        code = self._species_index.get(fish_species)
+        if code is None:
+            code = len(self._species_names)
+            self._species_names.append(fish_species)
+            self._species_index[fish_species] = code
+        self._species_codes.append(code)
+        self._weights.append(weight)
+        self._total_weight += weight
+        if self._min_weight is None or weight < self._min_weight:
+            self._min_weight = weight
+        if self._max_weight is None or weight > self._max_weight:
+            self._max_weight = weight
+        self._species_totals[fish_species] = self._species_totals.get(fish_species, 0.0) + weight
+        logger.info("[CatchLog] Додано запис: %s (%s кг)", fish_species, weight)
+
+    @property
+    def entries(self) -> CatchEntriesView:
+        """
+        Записи журналу у вигляді словників.
+        
+        Повертає:
+            Представлення записів тільки для читання
+        """
+        return CatchEntriesView(self)
 
-    def get_entries(self) -> List[dict]:
+    def get_entries(self) -> CatchEntriesView:
         """
         Отримання всіх записів з журналу.
         
         Повертає:
-            Список записів виловів
+            Представлення записів виловів тільки для читання
         """
-        return self.entries.copy()
+        return CatchEntriesView(self)
+
+    def get_weights(self) -> ColumnView:
+        """
+        Отримання ваг усіх записів без копіювання.
+        
+        Повертає:
+            Представлення колонки ваг тільки для читання
+        """
+        return ColumnView(self._weights)
+
+    def get_species_codes(self) -> ColumnView:
+        """
+        Отримання кодів видів риби для всіх записів без копіювання.
+        
+        Повертає:
+            Представлення колонки кодів тільки для читання
+        """
+        return ColumnView(self._species_codes)
+
+    def get_species_names(self) -> List[str]:
+        """
+        Отримання таблиці назв видів риби, індексованої кодом виду.
+        
+        Повертає:
+            Список назв видів риби
+        """
+        return list(self._species_names)
 
     def get_total_weight(self) -> float:
         """
@@ -53,7 +210,34 @@ class CatchLog:
         Повертає:
             Сума ваги всіх записаних риб у кілограмах
         """
-        return sum(entry['weight'] for entry in self.entries)
+        return self._total_weight
+
+    def get_min_weight(self) -> Optional[float]:
+        """
+        Отримання ваги найлегшої риби у журналі.
+        
+        Повертає:
+            Мінімальна вага у кілограмах або None, якщо журнал порожній
+        """
+        return self._min_weight
+
+    def get_max_weight(self) -> Optional[float]:
+        """
+        Отримання ваги найважчої риби у журналі.
+        
+        Повертає:
+            Максимальна вага у кілограмах або None, якщо журнал порожній
+        """
+        return self._max_weight
+
+    def get_species_totals(self) -> Dict[str, float]:
+        """
+        Отримання загальної ваги виловів за кожним видом риби.
+        
+        Повертає:
+            Словник {вид риби: загальна вага у кілограмах}
+        """
+        return dict(self._species_totals)
 
     def get_catch_count(self) -> int:
         """
@@ -62,14 +246,19 @@ class CatchLog:
         Повертає:
             Кількість риб у журналі
         """
-        return len(self.entries)
+        return len(self._weights)
 
     def clear(self) -> None:
         """
         Очищення журналу від усіх записів.
         """
-        self.entries.clear()
-        print("[CatchLog] Журнал очищено")
+        del self._species_codes[:]
+        del self._weights[:]
+        self._total_weight = 0.0
+        self._min_weight = None
+        self._max_weight = None
+        self._species_totals.clear()
+        logger.info("[CatchLog] Журнал очищено")
 
     def display_summary(self) -> None:
         """
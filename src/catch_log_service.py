@@ -6,8 +6,257 @@
 """
 
 import sqlite3
-from typing import List
+from typing import Iterable, Iterator, List, Optional, Tuple
 from datetime import datetime
+from connection_pool import ConnectionPool
+from logging_config import get_logger
+
+logger = get_logger("catch_log_service")
+
+
+# Міграції схеми бази даних; номер версії відповідає позиції у списку
+SCHEMA_MIGRATIONS: List[List[str]] = [
+    [
+        """
+        CREATE TABLE IF NOT EXISTS catches (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            fisherman_name TEXT NOT NULL,
+            fish_species TEXT NOT NULL,
+            weight REAL NOT NULL,
+            timestamp DATETIME DEFAULT CURRENT_TIMESTAMP
+        )
+        """,
+    ],
+    [
+        """
+        CREATE INDEX IF NOT EXISTS idx_catches_fisherman_timestamp
+        ON catches (fisherman_name, timestamp)
+        """,
+        """
+        CREATE INDEX IF NOT EXISTS idx_catches_species
+        ON catches (fish_species)
+        """,
+    ],
+    [
+        """
+        CREATE TABLE IF NOT EXISTS catch_summaries (
+            fisherman_name TEXT PRIMARY KEY,
+            catch_count INTEGER NOT NULL DEFAULT 0,
+            total_weight REAL NOT NULL DEFAULT 0.0
+        )
+        """,
+        """
+        INSERT OR REPLACE INTO catch_summaries (fisherman_name, catch_count, total_weight)
+        SELECT fisherman_name, COUNT(*), SUM(weight) FROM catches GROUP BY fisherman_name
+        """,
+        """
+        CREATE TRIGGER IF NOT EXISTS trg_catches_summary_insert
+        AFTER INSERT ON catches
+        BEGIN
+            INSERT INTO catch_summaries (fisherman_name, catch_count, total_weight)
+            VALUES (NEW.fisherman_name, 1, NEW.weight)
+            ON CONFLICT (fisherman_name) DO UPDATE SET
+                catch_count = catch_count + 1,
+                total_weight = total_weight + NEW.weight;
+        END
+        """,
+        """
+        CREATE TRIGGER IF NOT EXISTS trg_catches_summary_delete
+        AFTER DELETE ON catches
+        BEGIN
+            UPDATE catch_summaries
+            SET catch_count = catch_count - 1,
+                total_weight = total_weight - OLD.weight
+            WHERE fisherman_name = OLD.fisherman_name;
+        END
+        """,
+        """
+        CREATE TRIGGER IF NOT EXISTS trg_catches_summary_update
+        AFTER UPDATE OF fisherman_name, weight ON catches
+        BEGIN
+            UPDATE catch_summaries
+            SET catch_count = catch_count - 1,
+                total_weight = total_weight - OLD.weight
+            WHERE fisherman_name = OLD.fisherman_name;
+            INSERT INTO catch_summaries (fisherman_name, catch_count, total_weight)
+            VALUES (NEW.fisherman_name, 1, NEW.weight)
+            ON CONFLICT (fisherman_name) DO UPDATE SET
+                catch_count = catch_count + 1,
+                total_weight = total_weight + NEW.weight;
+        END
+        """,
+    ],
+    [
+        """
+        CREATE TABLE IF NOT EXISTS catch_daily_species (
+            day TEXT NOT NULL,
+            fish_species TEXT NOT NULL,
+            catch_count INTEGER NOT NULL DEFAULT 0,
+            total_weight REAL NOT NULL DEFAULT 0.0,
+            PRIMARY KEY (day, fish_species)
+        ) WITHOUT ROWID
+        """,
+        """
+        CREATE TABLE IF NOT EXISTS catch_daily_fishermen (
+            day TEXT NOT NULL,
+            fisherman_name TEXT NOT NULL,
+            catch_count INTEGER NOT NULL DEFAULT 0,
+            total_weight REAL NOT NULL DEFAULT 0.0,
+            PRIMARY KEY (day, fisherman_name)
+        ) WITHOUT ROWID
+        """,
+        """
+        CREATE TABLE IF NOT EXISTS catch_daily_weight_buckets (
+            day TEXT NOT NULL,
+            fish_species TEXT NOT NULL,
+            bucket INTEGER NOT NULL,
+            catch_count INTEGER NOT NULL DEFAULT 0,
+            PRIMARY KEY (day, fish_species, bucket)
+        ) WITHOUT ROWID
+        """,
+        """
+        INSERT OR REPLACE INTO catch_daily_species (day, fish_species, catch_count, total_weight)
+        SELECT date(timestamp), fish_species, COUNT(*), SUM(weight)
+        FROM catches WHERE timestamp IS NOT NULL GROUP BY date(timestamp), fish_species
+        """,
+        """
+        INSERT OR REPLACE INTO catch_daily_fishermen (day, fisherman_name, catch_count, total_weight)
+        SELECT date(timestamp), fisherman_name, COUNT(*), SUM(weight)
+        FROM catches WHERE timestamp IS NOT NULL GROUP BY date(timestamp), fisherman_name
+        """,
+        """
+        INSERT OR REPLACE INTO catch_daily_weight_buckets (day, fish_species, bucket, catch_count)
+        SELECT date(timestamp), fish_species, CAST(weight / 0.5 AS INTEGER), COUNT(*)
+        FROM catches WHERE timestamp IS NOT NULL
+        GROUP BY date(timestamp), fish_species, CAST(weight / 0.5 AS INTEGER)
+        """,
+        """
+        CREATE TRIGGER IF NOT EXISTS trg_catches_daily_insert
+        AFTER INSERT ON catches WHEN NEW.timestamp IS NOT NULL
+        BEGIN
+            INSERT INTO catch_daily_species (day, fish_species, catch_count, total_weight)
+            VALUES (date(NEW.timestamp), NEW.fish_species, 1, NEW.weight)
+            ON CONFLICT (day, fish_species) DO UPDATE SET
+                catch_count = catch_count + 1,
+                total_weight = total_weight + NEW.weight;
+            INSERT INTO catch_daily_fishermen (day, fisherman_name, catch_count, total_weight)
+            VALUES (date(NEW.timestamp), NEW.fisherman_name, 1, NEW.weight)
+            ON CONFLICT (day, fisherman_name) DO UPDATE SET
+                catch_count = catch_count + 1,
+                total_weight = total_weight + NEW.weight;
+            INSERT INTO catch_daily_weight_buckets (day, fish_species, bucket, catch_count)
+            VALUES (date(NEW.timestamp), NEW.fish_species, CAST(NEW.weight / 0.5 AS INTEGER), 1)
+            ON CONFLICT (day, fish_species, bucket) DO UPDATE SET
+                catch_count = catch_count + 1;
+        END
+        """,
+        """
+        CREATE TRIGGER IF NOT EXISTS trg_catches_daily_delete
+        AFTER DELETE ON catches WHEN OLD.timestamp IS NOT NULL
+        BEGIN
+            UPDATE catch_daily_species
+            SET catch_count = catch_count - 1,
+                total_weight = total_weight - OLD.weight
+            WHERE day = date(OLD.timestamp) AND fish_species = OLD.fish_species;
+            UPDATE catch_daily_fishermen
+            SET catch_count = catch_count - 1,
+                total_weight = total_weight - OLD.weight
+            WHERE day = date(OLD.timestamp) AND fisherman_name = OLD.fisherman_name;
+            UPDATE catch_daily_weight_buckets
+            SET catch_count = catch_count - 1
+            WHERE day = date(OLD.timestamp) AND fish_species = OLD.fish_species
+                AND bucket = CAST(OLD.weight / 0.5 AS INTEGER);
+        END
+        """,
+        """
+        CREATE TRIGGER IF NOT EXISTS trg_catches_daily_update_old
+        AFTER UPDATE OF fisherman_name, fish_species, weight, timestamp ON catches
+        WHEN OLD.timestamp IS NOT NULL
+        BEGIN
+            UPDATE catch_daily_species
+            SET catch_count = catch_count - 1,
+                total_weight = total_weight - OLD.weight
+            WHERE day = date(OLD.timestamp) AND fish_species = OLD.fish_species;
+            UPDATE catch_daily_fishermen
+            SET catch_count = catch_count - 1,
+                total_weight = total_weight - OLD.weight
+            WHERE day = date(OLD.timestamp) AND fisherman_name = OLD.fisherman_name;
+            UPDATE catch_daily_weight_buckets
+            SET catch_count = catch_count - 1
+            WHERE day = date(OLD.timestamp) AND fish_species = OLD.fish_species
+                AND bucket = CAST(OLD.weight / 0.5 AS INTEGER);
+        END
+        """,
+        """
+        CREATE TRIGGER IF NOT EXISTS trg_catches_daily_update_new
+        AFTER UPDATE OF fisherman_name, fish_species, weight, timestamp ON catches
+        WHEN NEW.timestamp IS NOT NULL
+        BEGIN
+            INSERT INTO catch_daily_species (day, fish_species, catch_count, total_weight)
+            VALUES (date(NEW.timestamp), NEW.fish_species, 1, NEW.weight)
+            ON CONFLICT (day, fish_species) DO UPDATE SET
+                catch_count = catch_count + 1,
+                total_weight = total_weight + NEW.weight;
+            INSERT INTO catch_daily_fishermen (day, fisherman_name, catch_count, total_weight)
+            VALUES (date(NEW.timestamp), NEW.fisherman_name, 1, NEW.weight)
+            ON CONFLICT (day, fisherman_name) DO UPDATE SET
+                catch_count = catch_count + 1,
+                total_weight = total_weight + NEW.weight;
+            INSERT INTO catch_daily_weight_buckets (day, fish_species, bucket, catch_count)
+            VALUES (date(NEW.timestamp), NEW.fish_species, CAST(NEW.weight / 0.5 AS INTEGER), 1)
+            ON CONFLICT (day, fish_species, bucket) DO UPDATE SET
+                catch_count = catch_count + 1;
+        END
+        """,
+    ],
+    [
+        """
+        CREATE TABLE IF NOT EXISTS trips (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            fisherman_name TEXT NOT NULL,
+            location TEXT NOT NULL,
+            depth_map TEXT,
+            start_time DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP,
+            end_time DATETIME
+        )
+        """,
+        """
+        CREATE INDEX IF NOT EXISTS idx_trips_fisherman_start
+        ON trips (fisherman_name, start_time)
+        """,
+        """
+        ALTER TABLE catches ADD COLUMN trip_id INTEGER REFERENCES trips (id)
+        """,
+        """
+        CREATE INDEX IF NOT EXISTS idx_catches_trip
+        ON catches (trip_id, weight)
+        """,
+    ],
+    [
+        """
+        ALTER TABLE catches ADD COLUMN spot TEXT
+        """,
+    ],
+    [
+        """
+        CREATE TABLE IF NOT EXISTS journal_checkpoints (
+            journal TEXT PRIMARY KEY,
+            seq INTEGER NOT NULL
+        )
+        """,
+    ],
+]
+
+# Ширина кошика розподілу ваги у кілограмах (зафіксована в міграції 4)
+WEIGHT_BUCKET_KG = 0.5
+
+# Формати strftime для групування щоденних агрегатів за періодами
+PERIOD_FORMATS = {
+    'day': '%Y-%m-%d',
+    'week': '%Y-W%W',
+    'month': '%Y-%m',
+    'year': '%Y',
+}
 
 
 class CatchLogService:
@@ -26,33 +275,53 @@ class CatchLogService:
             db_path: Шлях до файлу SQLite бази даних (за замовчуванням: fishing.db)
         """
         self.db_path = db_path
+        self._pool = ConnectionPool(db_path)
         self._initialize_database()
 
     def _initialize_database(self) -> None:
         """
-        Ініціалізація бази даних та створення таблиці виловів, якщо її немає.
+        Ініціалізація бази даних та застосування міграцій схеми.
+        
+        Поточна версія схеми зберігається у PRAGMA user_version, тому
+        кожна міграція виконується лише один раз. Для актуальної схеми
+        виконується лише читання user_version без транзакції запису.
         """
         try:
-            connection = sqlite3.connect(self.db_path)
-            cursor = connection.cursor()
-            
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS catches (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    fisherman_name TEXT NOT NULL,
-                    fish_species TEXT NOT NULL,
-                    weight REAL NOT NULL,
-                    timestamp DATETIME DEFAULT CURRENT_TIMESTAMP
-                )
-            """)
-            
-            connection.commit()
-            connection.close()
-            print("[Database] Таблицю 'catches' успішно ініціалізовано")
+            connection = self._pool.get_connection()
+            if connection.execute("PRAGMA user_version").fetchone()[0] == len(SCHEMA_MIGRATIONS):
+                return
+            with self._pool.transaction() as connection:
+                # Блокування запису до повторного читання версії: паралельні
+                # процеси не застосовують ту саму міграцію двічі
+                connection.execute("BEGIN IMMEDIATE")
+                version = connection.execute("PRAGMA user_version").fetchone()[0]
+                for target_version, statements in enumerate(SCHEMA_MIGRATIONS, 1):
+                    if target_version <= version:
+                        continue
+                    for statement in statements:
+                        connection.execute(statement)
+                    connection.execute(f"PRAGMA user_version = {target_version}")
+            logger.info("[Database] Таблицю 'catches' успішно ініціалізовано")
         except sqlite3.Error as e:
-            print(f"[Database Error] Помилка при ініціалізації бази даних: {e}")
+            logger.error("[Database Error] Помилка при ініціалізації бази даних: %s", e)
+
+    def explain_query_plan(self, query: str, params: tuple = ()) -> List[str]:
+        """
+        Отримання плану виконання запиту від планувальника SQLite.
+        
+        Параметри:
+            query: SQL-запит для аналізу
+            params: Параметри запиту
+            
+        Повертає:
+            Список рядків з описом кроків плану виконання
+        """
+        connection = self._pool.get_connection()
+        rows = connection.execute(f"EXPLAIN QUERY PLAN {query}", params).fetchall()
+        return [row['detail'] for row in rows]
 
-    def save_catch(self, fisherman_name: str, fish_species: str, weight: float) -> None:
+    def save_catch(self, fisherman_name: str, fish_species: str, weight: float,
+                   trip_id: Optional[int] = None, spot: Optional[str] = None) -> None:
         """
         Збереження запису про вилов риби в базу даних.
         
@@ -60,21 +329,101 @@ class CatchLogService:
             fisherman_name: Ім'я рибалки
             fish_species: Вид риби
             weight: Вага риби у кілограмах
+            trip_id: Ідентифікатор експедиції (опціонально)
+            spot: Точка кльову, де виловлено рибу (опціонально)
         """
         try:
-            connection = sqlite3.connect(self.db_path)
-            cursor = connection.cursor()
+            with self._pool.transaction() as connection:
+                connection.execute("""
+                    INSERT INTO catches (fisherman_name, fish_species, weight, trip_id, spot)
+                    VALUES (?, ?, ?, ?, ?)
+                """, (fisherman_name, fish_species, weight, trip_id, spot))
+            logger.info("[CatchLogService] Вилов '%s' (%s кг) для '%s' збережено в БД",
+                        fish_species, weight, fisherman_name)
+        except sqlite3.Error as e:
+            logger.error("[Database Error] Помилка при збереженні виловії: %s", e)
+
+    def save_catches_bulk(self, catches: Iterable[tuple]) -> int:
+        """
+        Пакетне збереження записів виловів в одній транзакції.
+        
+        Параметри:
+            catches: Послідовність кортежів (ім'я рибалки, вид риби, вага),
+                які можуть бути доповнені ідентифікатором експедиції та точкою кльову
             
-            cursor.execute("""
-                INSERT INTO catches (fisherman_name, fish_species, weight)
-                VALUES (?, ?, ?)
-            """, (fisherman_name, fish_species, weight))
+        Повертає:
+            Кількість збережених записів
+        """
+        rows = [catch if len(catch) == 5 else (*catch, *(None,) * (5 - len(catch)))
+                for catch in catches]
+        if not rows:
+            return 0
+        try:
+            with self._pool.transaction() as connection:
+                connection.executemany("""
+                    INSERT INTO catches (fisherman_name, fish_species, weight, trip_id, spot)
+                    VALUES (?, ?, ?, ?, ?)
+                """, rows)
+            logger.info("[CatchLogService] Пакет з %d виловів збережено в БД", len(rows))
+            return len(rows)
+        except sqlite3.Error as e:
+            logger.error("[Database Error] Помилка при пакетному збереженні виловів: %s", e)
+            return 0
+
+    def save_journal_batch(self, journal: str, seq: int,
+                           entries: Iterable[Tuple[int, tuple]]) -> bool:
+        """
+        Збереження пакета виловів з журналу разом з позначкою журналу.
+        
+        Записи та номер останнього збереженого запису журналу фіксуються
+        в одній транзакції, тому після збою пакет не буде ні втрачено,
+        ні збережено двічі. Записи з номером не більшим за збережену
+        позначку пропускаються, тому повтор пакета безпечний.
+        
+        Параметри:
+            journal: Ідентифікатор журналу
+            seq: Номер останнього запису журналу в пакеті
+            entries: Пари (номер запису, кортеж (ім'я рибалки, вид риби, вага,
+                експедиція, точка кльову)); можуть бути порожніми
             
-            connection.commit()
-            connection.close()
-            print(f"[CatchLogService] Вилов '{fish_species}' ({weight} кг) для '{fisherman_name}' збережено в БД")
+        Повертає:
+            True, якщо пакет збережено, інакше False
+        """
+        try:
+            with self._pool.transaction() as connection:
+                row = connection.execute("SELECT seq FROM journal_checkpoints WHERE journal = ?",
+                                         (journal,)).fetchone()
+                checkpoint = row[0] if row else 0
+                rows = [catch if len(catch) == 5 else (*catch, *(None,) * (5 - len(catch)))
+                        for entry_seq, catch in entries if entry_seq > checkpoint]
+                connection.executemany("""
+                    INSERT INTO catches (fisherman_name, fish_species, weight, trip_id, spot)
+                    VALUES (?, ?, ?, ?, ?)
+                """, rows)
+                connection.execute("""
+                    INSERT INTO journal_checkpoints (journal, seq) VALUES (?, ?)
+                    ON CONFLICT (journal) DO UPDATE SET seq = MAX(seq, excluded.seq)
+                """, (journal, seq))
+            logger.info("[CatchLogService] Пакет з %d виловів журналу збережено в БД", len(rows))
+            return True
         except sqlite3.Error as e:
-            print(f"[Database Error] Помилка при збереженні виловії: {e}")
+            logger.error("[Database Error] Помилка при збереженні пакета журналу: %s", e)
+            return False
+
+    def get_journal_checkpoint(self, journal: str) -> int:
+        """
+        Отримання номера останнього збереженого запису журналу.
+        
+        Параметри:
+            journal: Ідентифікатор журналу
+            
+        Повертає:
+            Номер запису або 0, якщо з журналу ще нічого не збережено
+        """
+        connection = self._pool.get_connection()
+        row = connection.execute("SELECT seq FROM journal_checkpoints WHERE journal = ?",
+                                 (journal,)).fetchone()
+        return row[0] if row else 0
 
     def get_all_catches(self, fisherman_name: str = None) -> List[dict]:
         """
@@ -87,8 +436,7 @@ class CatchLogService:
             Список словників з інформацією про виловів
         """
         try:
-            connection = sqlite3.connect(self.db_path)
-            connection.row_factory = sqlite3.Row
+            connection = self._pool.get_connection()
             cursor = connection.cursor()
             
             if fisherman_name:
@@ -99,17 +447,89 @@ class CatchLogService:
                 cursor.execute("SELECT * FROM catches ORDER BY timestamp DESC")
             
             rows = cursor.fetchall()
-            connection.close()
             
             return [dict(row) for row in rows]
         except sqlite3.Error as e:
-            print(f"[Database Error] Помилка при читанні даних: {e}")
+            logger.error("[Database Error] Помилка при читанні даних: %s", e)
             return []
 
+    def iter_catches(self, fisherman_name: Optional[str] = None,
+                     fish_species: Optional[str] = None,
+                     start_time: Optional[str] = None,
+                     end_time: Optional[str] = None,
+                     fetch_size: int = 500) -> Iterator[dict]:
+        """
+        Потокове читання записів виловів з посторінковою вибіркою.
+        
+        Записи повертаються від найновіших до найстаріших, записи без часу
+        вилову - в кінці. Кожна сторінка вибирається окремим запитом за
+        ключем (timestamp, id), тому в пам'яті одночасно зберігається не
+        більше fetch_size записів.
+        
+        Параметри:
+            fisherman_name: Фільтр за іменем рибалки (опціонально)
+            fish_species: Фільтр за видом риби (опціонально)
+            start_time: Початок періоду, включно, у форматі 'YYYY-MM-DD HH:MM:SS' (опціонально)
+            end_time: Кінець періоду, не включно, у тому ж форматі (опціонально)
+            fetch_size: Кількість записів, що вибираються за один запит
+            
+        Повертає:
+            Генератор словників з інформацією про виловів
+        """
+        conditions = []
+        params: list = []
+        if fisherman_name:
+            conditions.append("fisherman_name = ?")
+            params.append(fisherman_name)
+        if fish_species:
+            conditions.append("fish_species = ?")
+            params.append(fish_species)
+        if start_time:
+            conditions.append("timestamp >= ?")
+            params.append(start_time)
+        if end_time:
+            conditions.append("timestamp < ?")
+            params.append(end_time)
+        
+        # Рядок з NULL у timestamp не порівнюється з ключем (timestamp, id),
+        # тому записи без часу вибираються окремо після решти, як і в
+        # ORDER BY timestamp DESC; фільтр за періодом їх і так відкидає
+        phases = [("timestamp IS NOT NULL", ("timestamp", "id"), "timestamp DESC, id DESC")]
+        if not start_time and not end_time:
+            phases.append(("timestamp IS NULL", ("id",), "id DESC"))
+        
+        for phase_condition, key_columns, order in phases:
+            last_key: Optional[tuple] = None
+            while True:
+                page_conditions = [*conditions, phase_condition]
+                page_params = list(params)
+                if last_key is not None:
+                    placeholders = ", ".join("?" for _ in key_columns)
+                    page_conditions.append(f"({', '.join(key_columns)}) < ({placeholders})")
+                    page_params.extend(last_key)
+                try:
+                    connection = self._pool.get_connection()
+                    rows = connection.execute(f"""
+                        SELECT * FROM catches WHERE {' AND '.join(page_conditions)}
+                        ORDER BY {order} LIMIT ?
+                    """, (*page_params, fetch_size)).fetchall()
+                except sqlite3.Error as e:
+                    logger.error("[Database Error] Помилка при читанні даних: %s", e)
+                    return
+                
+                for row in rows:
+                    yield dict(row)
+                if len(rows) < fetch_size:
+                    break
+                last_key = tuple(rows[-1][column] for column in key_columns)
+
     def get_catch_summary(self, fisherman_name: str) -> dict:
         """
         Отримання зведеної інформації про виловів конкретного рибалки.
         
+        Зведення читається з таблиці catch_summaries, яку тригери оновлюють
+        при кожній зміні таблиці catches.
+        
         Параметри:
             fisherman_name: Ім'я рибалки
             
@@ -117,21 +537,404 @@ class CatchLogService:
             Словник з кількістю та загальною вагою виловів
         """
         try:
-            connection = sqlite3.connect(self.db_path)
+            connection = self._pool.get_connection()
             cursor = connection.cursor()
             
             cursor.execute("""
-                SELECT COUNT(*) as count, SUM(weight) as total_weight
-                FROM catches WHERE fisherman_name = ?
+                SELECT catch_count, total_weight
+                FROM catch_summaries WHERE fisherman_name = ?
             """, (fisherman_name,))
             
             result = cursor.fetchone()
-            connection.close()
+            if result is None:
+                return {'count': 0, 'total_weight': 0.0}
             
             return {
                 'count': result[0] or 0,
                 'total_weight': result[1] or 0.0
             }
         except sqlite3.Error as e:
-            print(f"[Database Error] Помилка при отриманні зведення: {e}")
+            logger.error("[Database Error] Помилка при отриманні зведення: %s", e)
             return {'count': 0, 'total_weight': 0.0}
+
+    def start_trip(self, fisherman_name: str, location: str,
+                   depth_map: Optional[str] = None) -> Optional[int]:
+        """
+        Збереження початку рибальської експедиції.
+        
+        Параметри:
+            fisherman_name: Ім'я рибалки-організатора
+            location: Назва водойми/місцезнаходження
+            depth_map: Інформація про карту глибин (опціонально)
+            
+        Повертає:
+            Ідентифікатор експедиції або None у разі помилки
+        """
+        try:
+            with self._pool.transaction() as connection:
+                cursor = connection.execute("""
+                    INSERT INTO trips (fisherman_name, location, depth_map)
+                    VALUES (?, ?, ?)
+                """, (fisherman_name, location, depth_map))
+            logger.info("[CatchLogService] Експедицію #%d рибалки '%s' збережено в БД",
+                        cursor.lastrowid, fisherman_name)
+            return cursor.lastrowid
+        except sqlite3.Error as e:
+            logger.error("[Database Error] Помилка при збереженні експедиції: %s", e)
+            return None
+
+    def end_trip(self, trip_id: int) -> None:
+        """
+        Збереження завершення рибальської експедиції.
+        
+        Параметри:
+            trip_id: Ідентифікатор експедиції
+        """
+        try:
+            with self._pool.transaction() as connection:
+                connection.execute("""
+                    UPDATE trips SET end_time = CURRENT_TIMESTAMP
+                    WHERE id = ? AND end_time IS NULL
+                """, (trip_id,))
+            logger.info("[CatchLogService] Експедицію #%d завершено", trip_id)
+        except sqlite3.Error as e:
+            logger.error("[Database Error] Помилка при завершенні експедиції: %s", e)
+
+    def _query_trip_stats(self, where: str, params: tuple) -> List[dict]:
+        """
+        Вибірка експедицій разом з підсумками їх виловів одним запитом.
+        
+        Параметри:
+            where: Умова відбору експедицій
+            params: Параметри запиту
+            
+        Повертає:
+            Список словників зі статистикою експедицій
+        """
+        connection = self._pool.get_connection()
+        rows = connection.execute(f"""
+            SELECT t.id AS trip_id, t.fisherman_name, t.location, t.depth_map,
+                   t.start_time, t.end_time,
+                   COUNT(c.id) AS catch_count,
+                   COALESCE(SUM(c.weight), 0.0) AS total_weight,
+                   (julianday(COALESCE(t.end_time, CURRENT_TIMESTAMP))
+                    - julianday(t.start_time)) * 1440.0 AS duration_minutes
+            FROM trips t LEFT JOIN catches c ON c.trip_id = t.id
+            WHERE {where}
+            GROUP BY t.id ORDER BY t.start_time DESC, t.id DESC
+        """, params).fetchall()
+        stats = []
+        for row in rows:
+            trip = dict(row)
+            hours = trip['duration_minutes'] / 60
+            trip['yield_per_hour'] = trip['total_weight'] / hours if hours > 0 else 0.0
+            stats.append(trip)
+        return stats
+
+    def get_trip_stats(self, trip_id: int) -> Optional[dict]:
+        """
+        Отримання статистики однієї експедиції.
+        
+        Параметри:
+            trip_id: Ідентифікатор експедиції
+            
+        Повертає:
+            Словник з локацією, часом, тривалістю у хвилинах, кількістю,
+            загальною вагою та врожайністю (кг/год) виловів або None
+        """
+        try:
+            stats = self._query_trip_stats("t.id = ?", (trip_id,))
+            return stats[0] if stats else None
+        except sqlite3.Error as e:
+            logger.error("[Database Error] Помилка при отриманні статистики експедиції: %s", e)
+            return None
+
+    def get_trips(self, fisherman_name: str) -> List[dict]:
+        """
+        Отримання всіх експедицій рибалки зі статистикою.
+        
+        Параметри:
+            fisherman_name: Ім'я рибалки
+            
+        Повертає:
+            Список словників зі статистикою експедицій, від найновіших
+        """
+        try:
+            return self._query_trip_stats("t.fisherman_name = ?", (fisherman_name,))
+        except sqlite3.Error as e:
+            logger.error("[Database Error] Помилка при отриманні експедицій: %s", e)
+            return []
+
+    @staticmethod
+    def _day_range_condition(start_day: Optional[str], end_day: Optional[str],
+                             conditions: List[str], params: list) -> None:
+        """
+        Додавання умов діапазону днів до запиту по щоденних агрегатах.
+        
+        Параметри:
+            start_day: Перший день періоду у форматі 'YYYY-MM-DD', включно (опціонально)
+            end_day: Останній день періоду у тому ж форматі, включно (опціонально)
+            conditions: Список умов WHERE, що доповнюється
+            params: Список параметрів запиту, що доповнюється
+        """
+        if start_day:
+            conditions.append("day >= ?")
+            params.append(start_day)
+        if end_day:
+            conditions.append("day <= ?")
+            params.append(end_day)
+
+    def get_species_rollup(self, period: str = 'day', fish_species: Optional[str] = None,
+                           start_day: Optional[str] = None,
+                           end_day: Optional[str] = None) -> List[dict]:
+        """
+        Отримання кількості та ваги виловів за видами риби і періодами.
+        
+        Дані читаються з таблиці catch_daily_species, яку тригери оновлюють
+        при кожній зміні таблиці catches, тому сирі записи не переглядаються.
+        
+        Параметри:
+            period: Період групування: 'day', 'week', 'month' або 'year'
+            fish_species: Фільтр за видом риби (опціонально)
+            start_day: Перший день періоду у форматі 'YYYY-MM-DD', включно (опціонально)
+            end_day: Останній день періоду у тому ж форматі, включно (опціонально)
+            
+        Повертає:
+            Список словників з періодом, видом риби, кількістю та загальною вагою
+        """
+        if period not in PERIOD_FORMATS:
+            raise ValueError(f"Невідомий період '{period}', очікується один з {list(PERIOD_FORMATS)}")
+        conditions = ["catch_count > 0"]
+        params: list = []
+        if fish_species:
+            conditions.append("fish_species = ?")
+            params.append(fish_species)
+        self._day_range_condition(start_day, end_day, conditions, params)
+        try:
+            connection = self._pool.get_connection()
+            rows = connection.execute(f"""
+                SELECT strftime(?, day) AS period, fish_species,
+                       SUM(catch_count) AS count, SUM(total_weight) AS total_weight
+                FROM catch_daily_species WHERE {' AND '.join(conditions)}
+                GROUP BY period, fish_species ORDER BY period, fish_species
+            """, (PERIOD_FORMATS[period], *params)).fetchall()
+            return [dict(row) for row in rows]
+        except sqlite3.Error as e:
+            logger.error("[Database Error] Помилка при отриманні агрегатів за видами: %s", e)
+            return []
+
+    def get_top_fishermen(self, limit: int = 10, start_day: Optional[str] = None,
+                          end_day: Optional[str] = None) -> List[dict]:
+        """
+        Отримання рибалок з найбільшою загальною вагою виловів.
+        
+        Без обмеження періоду використовується таблиця catch_summaries,
+        інакше - щоденні агрегати catch_daily_fishermen.
+        
+        Параметри:
+            limit: Кількість рибалок у результаті
+            start_day: Перший день періоду у форматі 'YYYY-MM-DD', включно (опціонально)
+            end_day: Останній день періоду у тому ж форматі, включно (опціонально)
+            
+        Повертає:
+            Список словників з іменем рибалки, кількістю та загальною вагою виловів
+        """
+        conditions: List[str] = []
+        params: list = []
+        self._day_range_condition(start_day, end_day, conditions, params)
+        try:
+            connection = self._pool.get_connection()
+            if conditions:
+                rows = connection.execute(f"""
+                    SELECT fisherman_name, SUM(catch_count) AS count,
+                           SUM(total_weight) AS total_weight
+                    FROM catch_daily_fishermen WHERE {' AND '.join(conditions)}
+                    GROUP BY fisherman_name HAVING count > 0
+                    ORDER BY total_weight DESC, fisherman_name LIMIT ?
+                """, (*params, limit)).fetchall()
+            else:
+                rows = connection.execute("""
+                    SELECT fisherman_name, catch_count AS count, total_weight
+                    FROM catch_summaries WHERE catch_count > 0
+                    ORDER BY total_weight DESC, fisherman_name LIMIT ?
+                """, (limit,)).fetchall()
+            return [dict(row) for row in rows]
+        except sqlite3.Error as e:
+            logger.error("[Database Error] Помилка при отриманні рейтингу рибалок: %s", e)
+            return []
+
+    def get_weight_distribution(self, fish_species: Optional[str] = None,
+                                start_day: Optional[str] = None,
+                                end_day: Optional[str] = None) -> List[dict]:
+        """
+        Отримання розподілу ваги виловів за кошиками шириною WEIGHT_BUCKET_KG.
+        
+        Параметри:
+            fish_species: Фільтр за видом риби (опціонально)
+            start_day: Перший день періоду у форматі 'YYYY-MM-DD', включно (опціонально)
+            end_day: Останній день періоду у тому ж форматі, включно (опціонально)
+            
+        Повертає:
+            Список словників з межами кошика ваги (min_weight включно,
+            max_weight не включно) та кількістю виловів
+        """
+        conditions = ["catch_count > 0"]
+        params: list = []
+        if fish_species:
+            conditions.append("fish_species = ?")
+            params.append(fish_species)
+        self._day_range_condition(start_day, end_day, conditions, params)
+        try:
+            connection = self._pool.get_connection()
+            rows = connection.execute(f"""
+                SELECT bucket, SUM(catch_count) AS count
+                FROM catch_daily_weight_buckets WHERE {' AND '.join(conditions)}
+                GROUP BY bucket HAVING count > 0 ORDER BY bucket
+            """, params).fetchall()
+            return [{
+                'min_weight': row['bucket'] * WEIGHT_BUCKET_KG,
+                'max_weight': (row['bucket'] + 1) * WEIGHT_BUCKET_KG,
+                'count': row['count']
+            } for row in rows]
+        except sqlite3.Error as e:
+            logger.error("[Database Error] Помилка при отриманні розподілу ваги: %s", e)
+            return []
+
+    def iter_catch_chunks(self, chunk_size: int = 10000) -> Iterator[List[tuple]]:
+        """
+        Потокове читання всієї таблиці catches частинами у порядку id.
+        
+        Параметри:
+            chunk_size: Кількість записів в одній частині
+            
+        Повертає:
+            Генератор списків кортежів
+            (id, fisherman_name, fish_species, weight, timestamp, trip_id, spot)
+        """
+        last_id = 0
+        while True:
+            try:
+                connection = self._pool.get_connection()
+                rows = connection.execute("""
+                    SELECT id, fisherman_name, fish_species, weight, timestamp, trip_id, spot
+                    FROM catches WHERE id > ? ORDER BY id LIMIT ?
+                """, (last_id, chunk_size)).fetchall()
+            except sqlite3.Error as e:
+                logger.error("[Database Error] Помилка при читанні даних: %s", e)
+                return
+            if not rows:
+                return
+            yield [tuple(row) for row in rows]
+            last_id = rows[-1][0]
+
+    def get_all_trips(self) -> List[tuple]:
+        """
+        Отримання всіх експедицій у порядку id для експорту.
+        
+        Повертає:
+            Список кортежів (id, fisherman_name, location, depth_map, start_time, end_time)
+        """
+        try:
+            connection = self._pool.get_connection()
+            rows = connection.execute("""
+                SELECT id, fisherman_name, location, depth_map, start_time, end_time
+                FROM trips ORDER BY id
+            """).fetchall()
+            return [tuple(row) for row in rows]
+        except sqlite3.Error as e:
+            logger.error("[Database Error] Помилка при отриманні експедицій: %s", e)
+            return []
+
+    def import_catches(self, chunks: Iterable[Iterable[tuple]],
+                       trips: Iterable[tuple] = ()) -> int:
+        """
+        Масове завантаження експедицій та записів виловів в одній транзакції.
+        
+        Записи зберігають свої id та мітки часу, тому цей метод
+        використовується для відновлення бази даних з експорту.
+        
+        Параметри:
+            chunks: Частини записів - кортежі
+                (id, fisherman_name, fish_species, weight, timestamp[, trip_id, spot])
+            trips: Експедиції - кортежі
+                (id, fisherman_name, location, depth_map, start_time, end_time)
+            
+        Повертає:
+            Кількість завантажених записів виловів (0 у разі помилки)
+        """
+        imported = 0
+        try:
+            with self._pool.transaction() as connection:
+                connection.executemany("""
+                    INSERT INTO trips (id, fisherman_name, location, depth_map, start_time, end_time)
+                    VALUES (?, ?, ?, ?, ?, ?)
+                """, trips)
+                for chunk in chunks:
+                    rows = [row if len(row) == 7 else (*row, *(None,) * (7 - len(row)))
+                            for row in chunk]
+                    connection.executemany("""
+                        INSERT INTO catches (id, fisherman_name, fish_species, weight, timestamp,
+                                             trip_id, spot)
+                        VALUES (?, ?, ?, ?, ?, ?, ?)
+                    """, rows)
+                    imported += len(rows)
+            logger.info("[CatchLogService] Завантажено %d виловів у БД", imported)
+            return imported
+        except sqlite3.Error as e:
+            logger.error("[Database Error] Помилка при масовому завантаженні виловів: %s", e)
+            return 0
+
+    def iter_spot_observations(self, after_id: int = 0,
+                               chunk_size: int = 10000) -> Iterator[List[tuple]]:
+        """
+        Потокове читання виловів з відомою локацією та точкою кльову.
+        
+        Локація береться з експедиції вилову. Читаються лише записи з id
+        більшим за after_id, що дозволяє оновлювати похідні індекси
+        інкрементально.
+        
+        Параметри:
+            after_id: Ідентифікатор останнього вже обробленого вилову
+            chunk_size: Кількість записів в одній частині
+            
+        Повертає:
+            Генератор списків кортежів (id, location, spot, fish_species, weight, timestamp)
+        """
+        last_id = after_id
+        while True:
+            try:
+                connection = self._pool.get_connection()
+                rows = connection.execute("""
+                    SELECT c.id, t.location, c.spot, c.fish_species, c.weight, c.timestamp
+                    FROM catches c JOIN trips t ON t.id = c.trip_id
+                    WHERE c.id > ? AND c.spot IS NOT NULL ORDER BY c.id LIMIT ?
+                """, (last_id, chunk_size)).fetchall()
+            except sqlite3.Error as e:
+                logger.error("[Database Error] Помилка при читанні даних: %s", e)
+                return
+            if not rows:
+                return
+            yield [tuple(row) for row in rows]
+            last_id = rows[-1][0]
+
+    def close(self) -> None:
+        """
+        Закриття всіх з'єднань сервісу з базою даних.
+        """
+        self._pool.close()
+        logger.info("[Database] З'єднання з базою даних закрито")
+
+    def __enter__(self) -> 'CatchLogService':
+        """
+        Вхід у контекстний менеджер сервісу.
+
+        Повертає:
+            Поточний сервіс журналу виловів
+        """
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        """
+        Вихід з контекстного менеджера із закриттям з'єднань.
+        """
+        self.close()
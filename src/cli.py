@@ -0,0 +1,193 @@
+"""
+Модуль командного рядка системи управління рибальством.
+
+Цей модуль описує підкоманди для коротких запусків (cron, скрипти):
+- plan: прогноз погоди та рейтинг придатних локацій
+- log: реєстрація вилову в базі даних
+- report: зведення виловів з бази даних
+- export: колонковий експорт виловів у файли .npy
+
+Модулі системи імпортуються всередині обробників підкоманд, тому кожен
+запуск завантажує лише те, що потрібно обраній підкоманді.
+"""
+
+import argparse
+from typing import List, Optional
+
+
+def _open_service(args: argparse.Namespace):
+    """
+    Відкриття сервісу журналу виловів за аргументами командного рядка.
+
+    Параметри:
+        args: Аргументи підкоманди з db та shards
+
+    Повертає:
+        CatchLogService або ShardedCatchLogService (для shards > 1)
+    """
+    if args.shards > 1:
+        from sharded_catch_log_service import ShardedCatchLogService
+        return ShardedCatchLogService(args.db, args.shards)
+    from catch_log_service import CatchLogService
+    return CatchLogService(args.db)
+
+
+def _cmd_plan(args: argparse.Namespace) -> int:
+    """
+    Виведення прогнозу погоди та рейтингу придатних локацій.
+
+    Параметри:
+        args: Аргументи підкоманди
+
+    Повертає:
+        Код завершення: 0 - є придатні локації, 1 - немає
+    """
+    from weather_service import WeatherService
+
+    ranking = WeatherService.plan_locations(args.locations)
+    if not ranking:
+        print("[Planning] Погода непридатна в усіх локаціях")
+        return 1
+    print("[Planning] Придатні локації:")
+    for row in ranking:
+        print(f"  {row['location']}: {row['temperature']}°C, вітер {row['wind_speed']} км/год, "
+              f"оцінка {row['score']}")
+    return 0
+
+
+def _cmd_log(args: argparse.Namespace) -> int:
+    """
+    Збереження одного вилову в базі даних.
+
+    Параметри:
+        args: Аргументи підкоманди
+
+    Повертає:
+        Код завершення: 0 - вилов збережено, 1 - помилка БД
+    """
+    with _open_service(args) as service:
+        saved = service.save_catches_bulk([(args.fisherman, args.species, args.weight,
+                                            args.trip, args.spot)])
+    if not saved:
+        return 1
+    print(f"[CatchLog] Вилов збережено: {args.species} - {args.weight} кг ({args.fisherman})")
+    return 0
+
+
+def _cmd_report(args: argparse.Namespace) -> int:
+    """
+    Виведення зведення виловів рибалки або рейтингу рибалок.
+
+    Параметри:
+        args: Аргументи підкоманди
+
+    Повертає:
+        Код завершення 0
+    """
+    with _open_service(args) as service:
+        if args.fisherman:
+            summary = service.get_catch_summary(args.fisherman)
+            print(f"[Report] {args.fisherman}: {summary['count']} рибин, "
+                  f"{summary['total_weight']} кг")
+        else:
+            print("[Report] Найкращі рибалки:")
+            for row in service.get_top_fishermen(args.top, args.start, args.end):
+                print(f"  {row['fisherman_name']}: {row['count']} рибин, "
+                      f"{row['total_weight']} кг")
+        if args.period:
+            print(f"[Report] Вилови за видами ({args.period}):")
+            for row in service.get_species_rollup(args.period, args.species,
+                                                  args.start, args.end):
+                print(f"  {row['period']} {row['fish_species']}: {row['count']} рибин, "
+                      f"{row['total_weight']} кг")
+    return 0
+
+
+def _cmd_export(args: argparse.Namespace) -> int:
+    """
+    Експорт таблиці виловів у колонкові файли .npy.
+
+    Параметри:
+        args: Аргументи підкоманди
+
+    Повертає:
+        Код завершення 0
+    """
+    from catch_export import export_catches
+    with _open_service(args) as service:
+        manifest = export_catches(service, args.directory, args.chunk_size)
+    print(f"[Export] Експортовано {manifest['rows']} виловів у '{args.directory}'")
+    return 0
+
+
+def add_subcommands(parser: argparse.ArgumentParser) -> None:
+    """
+    Додавання підкоманд plan, log, report та export до парсера аргументів.
+
+    Обрана підкоманда зберігається в args.handler.
+
+    Параметри:
+        parser: Парсер аргументів програми
+    """
+    subparsers = parser.add_subparsers(dest="command", metavar="КОМАНДА")
+
+    plan = subparsers.add_parser("plan", help="Прогноз погоди та рейтинг локацій")
+    plan.add_argument("locations", nargs="+", help="Назви локацій")
+    plan.set_defaults(handler=_cmd_plan)
+
+    log = subparsers.add_parser("log", help="Зареєструвати вилов")
+    log.add_argument("fisherman", help="Ім'я рибалки")
+    log.add_argument("species", help="Вид риби")
+    log.add_argument("weight", type=float, help="Вага риби у кілограмах")
+    log.add_argument("--trip", type=int, help="Номер експедиції")
+    log.add_argument("--spot", help="Точка кльову")
+    log.set_defaults(handler=_cmd_log)
+
+    report = subparsers.add_parser("report", help="Зведення виловів")
+    report.add_argument("fisherman", nargs="?", help="Ім'я рибалки (за замовчуванням: рейтинг)")
+    report.add_argument("--top", type=int, default=10, help="Кількість рибалок у рейтингу")
+    report.add_argument("--period", choices=["day", "week", "month", "year"],
+                        help="Додати вилови за видами з групуванням за періодом")
+    report.add_argument("--species", help="Вид риби для групування за періодом")
+    report.add_argument("--start", help="Перший день періоду (YYYY-MM-DD)")
+    report.add_argument("--end", help="Останній день періоду (YYYY-MM-DD)")
+    report.set_defaults(handler=_cmd_report)
+
+    export = subparsers.add_parser("export", help="Колонковий експорт виловів (.npy)")
+    export.add_argument("directory", help="Каталог для файлів експорту")
+    export.add_argument("--chunk-size", type=int, default=50000,
+                        help="Кількість записів, що обробляються за один крок")
+    export.set_defaults(handler=_cmd_export)
+
+    for subparser in (log, report, export):
+        subparser.add_argument("--db", default="fishing.db", help="Файл бази даних SQLite")
+        subparser.add_argument("--shards", type=int, default=1,
+                               help="Кількість шардів (файли <db>_0 ... <db>_N-1)")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Запуск підкоманди з командного рядка.
+
+    Параметри:
+        argv: Аргументи командного рядка (за замовчуванням: sys.argv)
+
+    Повертає:
+        Код завершення підкоманди
+    """
+    from logging_config import configure_logging, shutdown_logging
+
+    parser = argparse.ArgumentParser(prog="fishing",
+                                     description="Система управління рибальством")
+    parser.add_argument("--quiet", action="store_true",
+                        help="Тихий режим: не виводити повідомлення компонентів")
+    add_subcommands(parser)
+    args = parser.parse_args(argv)
+    if args.command is None:
+        parser.print_help()
+        return 2
+    configure_logging(quiet=args.quiet)
+    try:
+        return args.handler(args)
+    finally:
+        shutdown_logging()
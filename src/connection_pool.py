@@ -0,0 +1,148 @@
+"""
+Модуль пулу з'єднань з SQLite базою даних.
+
+Цей модуль забезпечує довготривалі з'єднання з базою даних (одне на потік),
+щоб уникнути відкриття та закриття файлу бази даних при кожному запиті.
+"""
+
+import sqlite3
+import threading
+import weakref
+from contextlib import contextmanager
+from typing import Iterator, List
+
+
+class _ThreadConnection:
+    """
+    Обгортка з'єднання у локальних даних потоку.
+
+    Локальні дані потоку звільняються після його завершення, і разом з
+    обгорткою закривається з'єднання потоку.
+    """
+
+    __slots__ = ('connection', '__weakref__')
+
+    def __init__(self, connection: sqlite3.Connection) -> None:
+        """
+        Ініціалізація обгортки з'єднання.
+
+        Параметри:
+            connection: З'єднання потоку з базою даних
+        """
+        self.connection = connection
+
+
+def _release_connection(lock: threading.RLock, connections: List[sqlite3.Connection],
+                        connection: sqlite3.Connection) -> None:
+    """
+    Закриття з'єднання завершеного потоку та вилучення його з пулу.
+
+    Параметри:
+        lock: Блокування списку з'єднань пулу
+        connections: Відкриті з'єднання пулу
+        connection: З'єднання завершеного потоку
+    """
+    with lock:
+        if connection in connections:
+            connections.remove(connection)
+            connection.close()
+
+
+class ConnectionPool:
+    """
+    Пул з'єднань з SQLite базою даних з окремим з'єднанням для кожного потоку.
+
+    З'єднання створюється при першому зверненні з потоку та повторно
+    використовується до завершення потоку або виклику close(). Прагми
+    журналювання застосовуються один раз при створенні з'єднання.
+    """
+
+    def __init__(self, db_path: str, journal_mode: str = "WAL",
+                 synchronous: str = "NORMAL") -> None:
+        """
+        Ініціалізація пулу з'єднань.
+
+        Параметри:
+            db_path: Шлях до файлу SQLite бази даних
+            journal_mode: Режим журналу SQLite (за замовчуванням: WAL)
+            synchronous: Рівень синхронізації запису (за замовчуванням: NORMAL)
+        """
+        self.db_path = db_path
+        self.journal_mode = journal_mode
+        self.synchronous = synchronous
+        self._local = threading.local()
+        self._lock = threading.RLock()
+        self._connections: List[sqlite3.Connection] = []
+        self._closed = False
+
+    def _create_connection(self) -> sqlite3.Connection:
+        """
+        Створення нового з'єднання та застосування прагм.
+
+        Повертає:
+            Нове з'єднання з базою даних
+        """
+        connection = sqlite3.connect(self.db_path, check_same_thread=False)
+        connection.row_factory = sqlite3.Row
+        connection.execute(f"PRAGMA journal_mode={self.journal_mode}")
+        connection.execute(f"PRAGMA synchronous={self.synchronous}")
+        return connection
+
+    def get_connection(self) -> sqlite3.Connection:
+        """
+        Отримання з'єднання для поточного потоку.
+
+        Повертає:
+            З'єднання з базою даних, закріплене за поточним потоком
+        """
+        holder = getattr(self._local, 'holder', None)
+        if holder is None:
+            with self._lock:
+                if self._closed:
+                    raise sqlite3.ProgrammingError("Пул з'єднань уже закрито")
+                connection = self._create_connection()
+                self._connections.append(connection)
+            holder = _ThreadConnection(connection)
+            weakref.finalize(holder, _release_connection, self._lock, self._connections,
+                             connection)
+            self._local.holder = holder
+        return holder.connection
+
+    @contextmanager
+    def transaction(self) -> Iterator[sqlite3.Connection]:
+        """
+        Виконання блоку операцій в одній транзакції.
+
+        Фіксує транзакцію при успішному завершенні блоку та відкочує її
+        у разі помилки.
+
+        Повертає:
+            З'єднання з базою даних для поточного потоку
+        """
+        connection = self.get_connection()
+        try:
+            yield connection
+            connection.commit()
+        except Exception:
+            connection.rollback()
+            raise
+
+    def close(self) -> None:
+        """
+        Закриття всіх з'єднань пулу.
+        """
+        with self._lock:
+            self._closed = True
+            for connection in self._connections:
+                connection.close()
+            self._connections.clear()
+
+    @property
+    def closed(self) -> bool:
+        """
+        Перевірка, чи пул уже закрито.
+
+        Повертає:
+            True, якщо пул закрито, інакше False
+        """
+        return self._closed
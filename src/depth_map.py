@@ -0,0 +1,391 @@
+"""
+Модуль карт глибин водойм.
+
+Цей модуль зберігає батиметричну сітку водойми у файлі .npy, поділеному
+на квадратні плитки (форма масиву: рядки плиток × стовпці плиток ×
+плитка × плитка, float32). Файл відкривається через mmap, тому в пам'ять
+потрапляють лише ті плитки, до яких звертаються запити. Мінімальна та
+максимальна глибина кожної плитки зберігаються в метаданих, що дозволяє
+пропускати плитки, які не можуть містити шукану глибину.
+"""
+
+import json
+import math
+import mmap
+import os
+import random
+import sys
+from array import array
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from logging_config import get_logger
+from npy_format import npy_header, read_npy_header
+
+logger = get_logger("depth_map")
+
+# Значення клітинки без води (берег, острів)
+NO_DATA = float("nan")
+
+
+def _metadata_path(path: str) -> str:
+    """
+    Отримання шляху до файлу метаданих карти.
+
+    Параметри:
+        path: Шлях до файлу .npy карти
+
+    Повертає:
+        Шлях до файлу .json з метаданими
+    """
+    return os.path.splitext(path)[0] + ".json"
+
+
+class DepthMap:
+    """
+    Карта глибин однієї водойми з плитковим зберіганням у файлі.
+
+    Координати задаються в метрах від північно-західного кута карти:
+    x - на схід, y - на південь. Глибини - у метрах, NaN означає сушу.
+    """
+
+    def __init__(self, path: str) -> None:
+        """
+        Відкриття карти глибин.
+
+        Параметри:
+            path: Шлях до файлу .npy карти
+        """
+        self.path = path
+        with open(_metadata_path(path), encoding="utf-8") as metadata_file:
+            metadata = json.load(metadata_file)
+        self.location: Optional[str] = metadata['location']
+        self.width: int = metadata['width']
+        self.height: int = metadata['height']
+        self.tile_size: int = metadata['tile_size']
+        self.cell_size: float = metadata['cell_size']
+        self._tile_min: List[Optional[float]] = metadata['tile_min']
+        self._tile_max: List[Optional[float]] = metadata['tile_max']
+        self._tile_cells: List[int] = metadata['tile_cells']
+
+        self._file = open(path, "rb")
+        dtype, shape, offset = read_npy_header(self._file)
+        if dtype != '<f4':
+            raise ValueError(f"Непідтримуваний тип карти глибин: {dtype}")
+        self.tiles_y, self.tiles_x = shape[0], shape[1]
+        self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        self._values = memoryview(self._mmap)[offset:].cast('f')
+
+    @classmethod
+    def create(cls, path: str, rows: Iterable[Sequence[float]], width: int, height: int,
+               tile_size: int = 256, cell_size: float = 1.0,
+               location: Optional[str] = None) -> 'DepthMap':
+        """
+        Створення файлу карти глибин з потоку рядків сітки.
+
+        У пам'яті одночасно зберігається лише одна смуга з tile_size рядків.
+
+        Параметри:
+            path: Шлях до файлу .npy карти
+            rows: Рядки сітки з півночі на південь, кожен з width глибин (NaN - суша)
+            width: Кількість клітинок у рядку
+            height: Кількість рядків
+            tile_size: Розмір сторони плитки у клітинках
+            cell_size: Розмір сторони клітинки у метрах
+            location: Назва водойми (опціонально)
+
+        Повертає:
+            Відкрита карта глибин
+        """
+        tiles_x = math.ceil(width / tile_size)
+        tiles_y = math.ceil(height / tile_size)
+        tile_min: List[Optional[float]] = []
+        tile_max: List[Optional[float]] = []
+        tile_cells: List[int] = []
+        padding = array('f', [NO_DATA]) * (tiles_x * tile_size - width)
+        empty_row = array('f', [NO_DATA]) * (tiles_x * tile_size)
+
+        row_iterator = iter(rows)
+        with open(path, "wb") as grid_file:
+            grid_file.write(npy_header('<f4', (tiles_y, tiles_x, tile_size, tile_size)))
+            for tile_row in range(tiles_y):
+                band = []
+                for row_index in range(tile_row * tile_size, (tile_row + 1) * tile_size):
+                    if row_index < height:
+                        values = array('f', next(row_iterator))
+                        if len(values) != width:
+                            raise ValueError(f"Рядок {row_index} має {len(values)} клітинок "
+                                             f"замість {width}")
+                        values.extend(padding)
+                    else:
+                        values = empty_row
+                    band.append(values)
+                for tile_column in range(tiles_x):
+                    start = tile_column * tile_size
+                    tile = array('f')
+                    for values in band:
+                        tile.extend(values[start:start + tile_size])
+                    water = [value for value in tile if value == value]
+                    tile_min.append(min(water) if water else None)
+                    tile_max.append(max(water) if water else None)
+                    tile_cells.append(len(water))
+                    if sys.byteorder == "big":
+                        tile.byteswap()
+                    tile.tofile(grid_file)
+
+        metadata = {
+            'location': location,
+            'width': width,
+            'height': height,
+            'tile_size': tile_size,
+            'cell_size': cell_size,
+            'tile_min': tile_min,
+            'tile_max': tile_max,
+            'tile_cells': tile_cells
+        }
+        with open(_metadata_path(path), "w", encoding="utf-8") as metadata_file:
+            json.dump(metadata, metadata_file, ensure_ascii=False)
+        logger.info("[DepthMap] Створено карту глибин %dx%d ('%s')", width, height, path)
+        return cls(path)
+
+    def _tile(self, tile_x: int, tile_y: int) -> Sequence[float]:
+        """
+        Отримання значень плитки без копіювання даних.
+
+        Параметри:
+            tile_x: Номер стовпця плиток
+            tile_y: Номер рядка плиток
+
+        Повертає:
+            Послідовність tile_size × tile_size глибин за рядками
+        """
+        cells = self.tile_size * self.tile_size
+        start = (tile_y * self.tiles_x + tile_x) * cells
+        values = self._values[start:start + cells]
+        if sys.byteorder == "big":
+            values = array('f', values.tobytes())
+            values.byteswap()
+        return values
+
+    def depth_at(self, x: float, y: float) -> Optional[float]:
+        """
+        Отримання глибини в точці.
+
+        Параметри:
+            x: Відстань на схід від західного краю карти у метрах
+            y: Відстань на південь від північного краю карти у метрах
+
+        Повертає:
+            Глибина у метрах або None для суші та точок поза картою
+        """
+        column = int(x // self.cell_size)
+        row = int(y // self.cell_size)
+        if not (0 <= column < self.width and 0 <= row < self.height):
+            return None
+        tile = self._tile(column // self.tile_size, row // self.tile_size)
+        depth = tile[(row % self.tile_size) * self.tile_size + column % self.tile_size]
+        return None if depth != depth else depth
+
+    def _tiles_in_range(self, min_depth: float,
+                        max_depth: float) -> Iterator[Tuple[int, int, Optional[Sequence[float]]]]:
+        """
+        Перебір плиток, що можуть містити глибини з діапазону.
+
+        Параметри:
+            min_depth: Мінімальна глибина, включно
+            max_depth: Максимальна глибина, включно
+
+        Повертає:
+            Генератор кортежів (tile_x, tile_y, значення плитки або None,
+            якщо вся вода плитки належить діапазону і читати її не потрібно)
+        """
+        for index, (low, high) in enumerate(zip(self._tile_min, self._tile_max)):
+            if low is None or high < min_depth or low > max_depth:
+                continue
+            tile_y, tile_x = divmod(index, self.tiles_x)
+            if min_depth <= low and high <= max_depth:
+                yield tile_x, tile_y, None
+            else:
+                yield tile_x, tile_y, self._tile(tile_x, tile_y)
+
+    def area_in_range(self, min_depth: float, max_depth: float) -> float:
+        """
+        Обчислення площі водойми з глибиною в заданому діапазоні.
+
+        Параметри:
+            min_depth: Мінімальна глибина у метрах, включно
+            max_depth: Максимальна глибина у метрах, включно
+
+        Повертає:
+            Площа у квадратних метрах
+        """
+        cells = 0
+        for tile_x, tile_y, tile in self._tiles_in_range(min_depth, max_depth):
+            if tile is None:
+                cells += self._tile_cells[tile_y * self.tiles_x + tile_x]
+            else:
+                cells += sum(1 for depth in tile if min_depth <= depth <= max_depth)
+        return cells * self.cell_size * self.cell_size
+
+    def optimal_zones(self, min_depth: float = 2.0, max_depth: float = 3.0,
+                      k: int = 5) -> List[dict]:
+        """
+        Пошук зон (плиток) з найбільшою площею потрібної глибини.
+
+        Параметри:
+            min_depth: Мінімальна глибина у метрах, включно
+            max_depth: Максимальна глибина у метрах, включно
+            k: Кількість зон у результаті
+
+        Повертає:
+            Список словників з центром зони (x, y у метрах), площею у м²
+            та середньою глибиною, від найбільшої зони
+        """
+        zones = []
+        for tile_x, tile_y, tile in self._tiles_in_range(min_depth, max_depth):
+            if tile is None:
+                tile = self._tile(tile_x, tile_y)
+            depths = [depth for depth in tile if min_depth <= depth <= max_depth]
+            if not depths:
+                continue
+            span = self.tile_size * self.cell_size
+            zones.append({
+                'x': min((tile_x + 0.5) * span, self.width * self.cell_size),
+                'y': min((tile_y + 0.5) * span, self.height * self.cell_size),
+                'area_m2': len(depths) * self.cell_size * self.cell_size,
+                'mean_depth': round(sum(depths) / len(depths), 2)
+            })
+        zones.sort(key=lambda zone: -zone['area_m2'])
+        return zones[:k]
+
+    def get_summary(self) -> dict:
+        """
+        Отримання загальних відомостей про карту за метаданими плиток.
+
+        Повертає:
+            Словник з мінімальною та максимальною глибиною і площею води
+        """
+        depths_min = [value for value in self._tile_min if value is not None]
+        depths_max = [value for value in self._tile_max if value is not None]
+        return {
+            'location': self.location,
+            'min_depth': min(depths_min) if depths_min else None,
+            'max_depth': max(depths_max) if depths_max else None,
+            'water_area_m2': sum(self._tile_cells) * self.cell_size * self.cell_size
+        }
+
+    def close(self) -> None:
+        """
+        Звільнення відображення файлу в пам'ять.
+        """
+        self._values.release()
+        self._mmap.close()
+        self._file.close()
+
+    def __enter__(self) -> 'DepthMap':
+        """
+        Вхід у контекстний менеджер карти.
+
+        Повертає:
+            Поточна карта глибин
+        """
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        """
+        Вихід з контекстного менеджера із закриттям файлу.
+        """
+        self.close()
+
+    def __str__(self) -> str:
+        """
+        Рядкова репрезентація карти.
+
+        Повертає:
+            Рядок з назвою водойми та розмірами сітки
+        """
+        return (f"DepthMap(location={self.location}, size={self.width}x{self.height}, "
+                f"cell={self.cell_size} м)")
+
+
+class DepthMapCatalog:
+    """
+    Каталог карт глибин водойм, що відкриваються за першим запитом.
+    """
+
+    def __init__(self, directory: str) -> None:
+        """
+        Ініціалізація каталогу.
+
+        Параметри:
+            directory: Каталог з файлами карт (<локація>.npy та <локація>.json)
+        """
+        self.directory = directory
+        self._maps: Dict[str, DepthMap] = {}
+
+    def path_for(self, location: str) -> str:
+        """
+        Отримання шляху до файлу карти локації.
+
+        Параметри:
+            location: Назва водойми
+
+        Повертає:
+            Шлях до файлу .npy карти
+        """
+        return os.path.join(self.directory, f"{location}.npy")
+
+    def get(self, location: str) -> Optional[DepthMap]:
+        """
+        Отримання карти глибин локації.
+
+        Параметри:
+            location: Назва водойми
+
+        Повертає:
+            Карта глибин або None, якщо карти немає
+        """
+        depth_map = self._maps.get(location)
+        if depth_map is None:
+            path = self.path_for(location)
+            if not os.path.exists(path):
+                return None
+            depth_map = self._maps[location] = DepthMap(path)
+        return depth_map
+
+    def close(self) -> None:
+        """
+        Закриття всіх відкритих карт.
+        """
+        for depth_map in self._maps.values():
+            depth_map.close()
+        self._maps.clear()
+
+
+def generate_lake_rows(width: int, height: int, max_depth: float = 5.0,
+                       seed: Optional[int] = None) -> Iterator[List[float]]:
+    """
+    Генерація сітки глибин еліптичної водойми рядок за рядком.
+
+    Параметри:
+        width: Кількість клітинок у рядку
+        height: Кількість рядків
+        max_depth: Глибина в центрі водойми у метрах
+        seed: Початкове значення генератора випадкових чисел
+
+    Повертає:
+        Генератор рядків глибин (NaN - берег)
+    """
+    rng = random.Random(seed)
+    center_x, center_y = (width - 1) / 2, (height - 1) / 2
+    for row in range(height):
+        dy = (row - center_y) / (height / 2)
+        values = []
+        for column in range(width):
+            dx = (column - center_x) / (width / 2)
+            distance = dx * dx + dy * dy
+            if distance >= 1.0:
+                values.append(NO_DATA)
+            else:
+                depth = max_depth * (1.0 - distance) + rng.uniform(-0.2, 0.2)
+                values.append(round(max(0.1, depth), 2))
+        yield values
@@ -5,10 +5,15 @@
 на основі даних сенсорів.
 """
 
-from typing import TYPE_CHECKING
+import statistics
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, List, Optional, TYPE_CHECKING
+from sensor import QUALITY_LEVELS, Sensor
+from water_report import LocationReport
 
 if TYPE_CHECKING:
-    from sensor import Sensor
+    from sensor_reading_store import SensorReadingStore
 
 
 class Ecologist:
@@ -49,6 +54,46 @@ class Ecologist:
         self._analyze_conditions(temperature, quality)
         print()
 
+    def get_period_report(self, store: 'SensorReadingStore', sensor: 'Sensor',
+                          start_time: float, end_time: float) -> dict:
+        """
+        Отримання звіту про умови води за період зі сховища вимірів.
+        
+        Статистика читається з попередньо обчислених агрегатів сховища,
+        тому довгі періоди не потребують перегляду всіх сирих вимірів.
+        
+        Параметри:
+            store: Сховище вимірів датчиків
+            sensor: Датчик, для якого складається звіт
+            start_time: Початок періоду, включно (секунди Unix)
+            end_time: Кінець періоду, не включно (секунди Unix)
+            
+        Повертає:
+            Словник зі статистикою температури та якості води
+        """
+        temperature = store.get_window_stats(sensor.sensor_id, 'temperature', start_time, end_time)
+        quality = store.get_window_stats(sensor.sensor_id, 'quality', start_time, end_time)
+        
+        print(f"\n[Period Report - {self.name}]")
+        print(f"  Місцезнаходження: {sensor.location}")
+        if temperature['count']:
+            print(f"  Кількість вимірів температури: {temperature['count']}")
+            print(f"  Температура води: середня {temperature['mean']:.1f}°C, "
+                  f"мін. {temperature['min']}°C, макс. {temperature['max']}°C")
+        else:
+            print(f"  Вимірів температури за період немає")
+        if quality['count']:
+            print(f"  Середня якість води: {QUALITY_LEVELS[round(quality['mean'])]}")
+            print(f"  Найгірша якість води: {QUALITY_LEVELS[int(quality['max'])]}")
+        print()
+        
+        return {
+            'sensor_id': sensor.sensor_id,
+            'location': sensor.location,
+            'temperature': temperature,
+            'quality': quality
+        }
+
     def analyze_environment(self, location: str) -> None:
         """
         Загальний аналіз стану навколишнього середовища в локації.
@@ -64,26 +109,153 @@ class Ecologist:
         print(f"  Рекомендація: Дотримуватися нормативів вилову")
         print()
 
-    def _analyze_conditions(self, temperature: float, quality: str) -> None:
+    def aggregate_reports(self, sensors: Iterable['Sensor'], samples: int = 10,
+                          max_workers: Optional[int] = None,
+                          z_threshold: float = 2.0) -> Dict[str, LocationReport]:
         """
-        Внутрішній аналіз умов води на основі виміру.
+        Зведені звіти про умови води для багатьох датчиків, згруповані за локацією.
+        
+        Усі датчики опитуються пакетно (за потреби паралельно в пулі потоків),
+        після чого для кожної локації обчислюється статистика температури,
+        розподіл якості води та аномальні датчики. Нічого не виводиться в консоль.
         
         Параметри:
-            temperature: Виміряна температура
-            quality: Виміряна якість води
+            sensors: Датчики для опитування
+            samples: Кількість вимірів на кожен датчик
+            max_workers: Кількість потоків для опитування (None - без пулу потоків)
+            z_threshold: Поріг відхилення середньої температури датчика від
+                середньої по локації (у стандартних відхиленнях) для позначення аномалії
+            
+        Повертає:
+            Словник {локація: звіт LocationReport}
+            
+        Викликає ValueError, якщо samples менше 1 або ідентифікатори
+        датчиків повторюються.
         """
-        print(f"  Аналіз:")
+        if samples < 1:
+            raise ValueError("Кількість вимірів на датчик має бути не меншою за 1")
+        sensors = list(sensors)
+        sensor_counts = Counter(sensor.sensor_id for sensor in sensors)
+        duplicates = sorted(sensor_id for sensor_id, count in sensor_counts.items() if count > 1)
+        if duplicates:
+            raise ValueError(f"Ідентифікатори датчиків повторюються: {', '.join(duplicates)}")
+        if max_workers and max_workers > 1:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                batches = executor.map(lambda sensor: Sensor.sample_many([sensor], samples), sensors)
+                readings = {}
+                for batch in batches:
+                    readings.update(batch)
+        else:
+            readings = Sensor.sample_many(sensors, samples)
+        
+        by_location: Dict[str, List['Sensor']] = {}
+        for sensor in sensors:
+            by_location.setdefault(sensor.location, []).append(sensor)
+        
+        return {
+            location: self._build_location_report(location, location_sensors, readings, z_threshold)
+            for location, location_sensors in by_location.items()
+        }
+
+    def _build_location_report(self, location: str, sensors: List['Sensor'],
+                               readings: dict, z_threshold: float) -> LocationReport:
+        """
+        Обчислення зведеного звіту для датчиків однієї локації.
+        
+        Параметри:
+            location: Назва локації
+            sensors: Датчики локації
+            readings: Виміри {ідентифікатор датчика: (температури, коди якості)}
+            z_threshold: Поріг відхилення для позначення аномалії
+            
+        Повертає:
+            Звіт LocationReport
+        """
+        sensor_means = [sum(readings[sensor.sensor_id][0]) / len(readings[sensor.sensor_id][0])
+                        for sensor in sensors]
+        sensor_quality = [sum(readings[sensor.sensor_id][1]) / len(readings[sensor.sensor_id][1])
+                          for sensor in sensors]
+        temperature_min = min(min(readings[sensor.sensor_id][0]) for sensor in sensors)
+        temperature_max = max(max(readings[sensor.sensor_id][0]) for sensor in sensors)
+        sample_count = sum(len(readings[sensor.sensor_id][0]) for sensor in sensors)
+        temperature_mean = sum(sum(readings[sensor.sensor_id][0]) for sensor in sensors) / sample_count
+        
+        quality_counts = [0] * len(QUALITY_LEVELS)
+        for sensor in sensors:
+            for code in readings[sensor.sensor_id][1]:
+                quality_counts[code] += 1
+        quality_distribution = dict(zip(QUALITY_LEVELS, quality_counts))
+        dominant_quality = QUALITY_LEVELS[quality_counts.index(max(quality_counts))]
+        
+        anomalies = []
+        if len(sensor_means) >= 3:
+            spread = statistics.pstdev(sensor_means)
+            if spread > 0:
+                for sensor, mean in zip(sensors, sensor_means):
+                    if abs(mean - temperature_mean) / spread > z_threshold:
+                        anomalies.append({'sensor_id': sensor.sensor_id,
+                                          'reason': 'temperature', 'value': round(mean, 1)})
+        worst_code = len(QUALITY_LEVELS) - 1
+        for sensor, quality in zip(sensors, sensor_quality):
+            if quality >= worst_code:
+                anomalies.append({'sensor_id': sensor.sensor_id,
+                                  'reason': 'quality', 'value': QUALITY_LEVELS[worst_code]})
+        
+        return LocationReport(
+            location=location,
+            sensor_count=len(sensors),
+            sample_count=sample_count,
+            temperature_mean=temperature_mean,
+            temperature_min=temperature_min,
+            temperature_max=temperature_max,
+            quality_distribution=quality_distribution,
+            temperature_assessment=self._assess_temperature(temperature_mean),
+            quality_assessment=self._assess_quality(dominant_quality),
+            anomalies=anomalies
+        )
+
+    @staticmethod
+    def _assess_temperature(temperature: float) -> str:
+        """
+        Висновок щодо температури води.
         
+        Параметри:
+            temperature: Температура води
+            
+        Повертає:
+            Текст висновку
+        """
         if temperature < 10:
-            print(f"    - Температура низька, риба буде менш активною")
+            return "Температура низька, риба буде менш активною"
         elif temperature > 20:
-            print(f"    - Температура висока, умови сприятливі для більшості видів")
-        else:
-            print(f"    - Температура оптимальна для риболовлі")
+            return "Температура висока, умови сприятливі для більшості видів"
+        return "Температура оптимальна для риболовлі"
+
+    @staticmethod
+    def _assess_quality(quality: str) -> str:
+        """
+        Висновок щодо якості води.
         
+        Параметри:
+            quality: Рівень якості води
+            
+        Повертає:
+            Текст висновку
+        """
         if quality == 'Відмінна':
-            print(f"    - Якість води відмінна, умови сприятливі для екосистеми")
+            return "Якість води відмінна, умови сприятливі для екосистеми"
         elif quality == 'Хороша':
-            print(f"    - Якість води хороша, стан екосистеми задовільний")
-        else:
-            print(f"    - Якість води задовільна, необхідний моніторинг")
+            return "Якість води хороша, стан екосистеми задовільний"
+        return "Якість води задовільна, необхідний моніторинг"
+
+    def _analyze_conditions(self, temperature: float, quality: str) -> None:
+        """
+        Внутрішній аналіз умов води на основі виміру.
+        
+        Параметри:
+            temperature: Виміряна температура
+            quality: Виміряна якість води
+        """
+        print(f"  Аналіз:")
+        print(f"    - {self._assess_temperature(temperature)}")
+        print(f"    - {self._assess_quality(quality)}")
@@ -5,9 +5,36 @@
 планування, риболовлі та реєстрації виловів.
 """
 
-from typing import Optional
+import asyncio
+import inspect
+import time
+from typing import Any, List, Optional, Tuple, TYPE_CHECKING
 from catch_log import CatchLog
 from catch_log_service import CatchLogService
+from fishing_trip import FishingTrip
+
+if TYPE_CHECKING:
+    from catch_journal import CatchJournal
+    from depth_map import DepthMap
+    from spot_recommender import SpotRecommender
+
+# Буферизований вилов: (ім'я рибалки, вид риби, вага, експедиція, точка кльову)
+PendingCatch = Tuple[str, str, float, Optional[int], Optional[str]]
+
+
+async def _await_if_needed(result: Any) -> Any:
+    """
+    Очікування результату, якщо сервіс повернув корутину.
+    
+    Параметри:
+        result: Результат виклику синхронного або асинхронного сервісу
+        
+    Повертає:
+        Остаточний результат виклику
+    """
+    if inspect.isawaitable(result):
+        return await result
+    return result
 
 
 class Fisherman:
@@ -18,19 +45,38 @@ class Fisherman:
     реєструє виловів у журналі та базі даних.
     """
 
-    def __init__(self, name: str, catch_log_service: CatchLogService) -> None:
+    def __init__(self, name: str, catch_log_service: CatchLogService,
+                 buffer_size: int = 0, flush_interval: Optional[float] = None,
+                 journal: Optional['CatchJournal'] = None) -> None:
         """
         Ініціалізація рибалки.
         
         Параметри:
             name: Ім'я рибалки
             catch_log_service: Сервіс для збереження журналу виловів
+            buffer_size: Розмір буфера виловів перед записом у БД
+                (0 - кожен вилов записується одразу)
+            flush_interval: Максимальний вік буфера у секундах (None - без
+                обмеження за часом); перевіряється лише при реєстрації
+                вилову, тому окремого таймера немає і останні вилови
+                записуються при завершенні риболовлі, отриманні зведення
+                або виклику flush_catches
+            journal: Журнал попереднього запису; якщо задано, вилови
+                дописуються в журнал, а в БД їх записує фоновий потік
         """
         self.name = name
         self.location: Optional[str] = None
         self.catch_log = CatchLog()
         self._catch_log_service = catch_log_service
         self.is_fishing = False
+        self.buffer_size = buffer_size
+        self.flush_interval = flush_interval
+        self._pending_catches: List[PendingCatch] = []
+        self._pending_since: Optional[float] = None
+        self.trip_id: Optional[int] = None
+        self._owns_trip = False
+        self.spot: Optional[str] = None
+        self._journal = journal
 
     def set_catch_log_service(self, service: CatchLogService) -> None:
         """
@@ -39,42 +85,139 @@ class Fisherman:
         Параметри:
             service: Новий сервіс журналу виловів
         """
+        self.flush_catches()
         self._catch_log_service = service
         print(f"[Fisherman {self.name}] Встановлено новий сервіс журналу виловів")
 
-    def check_depth_map(self) -> None:
+    def check_depth_map(self, depth_map: Optional['DepthMap'] = None) -> None:
         """
         Перевірка карти глибин водойми.
+        
+        Параметри:
+            depth_map: Карта глибин водойми (опціонально)
         """
         print(f"\n[Fisherman {self.name}] Перевіряю карту глибин")
-        print(f"  Глибина в місцезнаходженні '{self.location}': від 1 до 5 метрів")
-        print(f"  Рекомендація: Оптимально для риболовлі на глибині 2-3 метри")
+        if depth_map is None:
+            print(f"  Глибина в місцезнаходженні '{self.location}': від 1 до 5 метрів")
+            print(f"  Рекомендація: Оптимально для риболовлі на глибині 2-3 метри")
+            print()
+            return
+        summary = depth_map.get_summary()
+        print(f"  Глибина в місцезнаходженні '{self.location}': "
+              f"від {summary['min_depth']:.1f} до {summary['max_depth']:.1f} метрів")
+        print(f"  Площа глибин 2-3 метри: {depth_map.area_in_range(2.0, 3.0):.0f} м²")
+        for zone in depth_map.optimal_zones(2.0, 3.0, k=3):
+            print(f"  Рекомендація: зона ({zone['x']:.0f} м, {zone['y']:.0f} м), "
+                  f"{zone['area_m2']:.0f} м², середня глибина {zone['mean_depth']} м")
         print()
 
-    def check_fishing_spots(self) -> None:
+    def check_fishing_spots(self, recommender: Optional['SpotRecommender'] = None,
+                            fish_species: Optional[str] = None,
+                            temperature: Optional[float] = None) -> None:
         """
         Перевірка точок кльову на водоймі.
+        
+        Параметри:
+            recommender: Індекс врожайності точок для рекомендацій (опціонально)
+            fish_species: Бажаний вид риби (опціонально)
+            temperature: Поточна температура води (опціонально)
         """
         print(f"\n[Fisherman {self.name}] Перевіряю точки кльову")
-        spots = ['Біля берега', 'В центрі водойми', 'Біля рослинності', 'На російськ', 'Біля острова']
-        for spot in spots:
-            print(f"  ✓ {spot}")
+        recommendations = (recommender.recommend(self.location, fish_species, temperature, k=5)
+                           if recommender and self.location else [])
+        if recommendations:
+            for item in recommendations:
+                print(f"  ✓ {item['spot']} ({item['catch_count']} виловів, "
+                      f"{item['total_weight']} кг)")
+        else:
+            spots = ['Біля берега', 'В центрі водойми', 'Біля рослинності', 'На російськ', 'Біля острова']
+            for spot in spots:
+                print(f"  ✓ {spot}")
         print()
 
-    def start_fishing(self, location: str) -> None:
+    def start_fishing(self, location: str, trip: Optional[FishingTrip] = None,
+                      spot: Optional[str] = None) -> None:
         """
         Розпочати риболовлю в конкретній локації.
         
+        Вилови прив'язуються до експедиції в базі даних: до переданої
+        збереженої експедиції або до нової, яку створює сам рибалка.
+        
         Параметри:
             location: Назва водойми/місцезнаходження
+            trip: Розпочата експедиція, до якої належать вилови (опціонально)
+            spot: Точка кльову (за замовчуванням: перша точка експедиції)
+        """
+        if self._begin_fishing(location, trip, spot):
+            self.trip_id = self._catch_log_service.start_trip(self.name, location)
+            self._owns_trip = self.trip_id is not None
+        self._announce_start(location)
+
+    async def start_fishing_async(self, location: str, trip: Optional[FishingTrip] = None,
+                                  spot: Optional[str] = None) -> None:
+        """
+        Асинхронно розпочати риболовлю в конкретній локації.
+        
+        Працює як з CatchLogService, так і з AsyncCatchLogService.
+        
+        Параметри:
+            location: Назва водойми/місцезнаходження
+            trip: Розпочата експедиція, до якої належать вилови (опціонально)
+            spot: Точка кльову (за замовчуванням: перша точка експедиції)
+        """
+        if self._begin_fishing(location, trip, spot):
+            self.trip_id = await _await_if_needed(
+                self._catch_log_service.start_trip(self.name, location))
+            self._owns_trip = self.trip_id is not None
+        self._announce_start(location)
+
+    def _begin_fishing(self, location: str, trip: Optional[FishingTrip],
+                       spot: Optional[str]) -> bool:
+        """
+        Оновлення стану рибалки на початку риболовлі.
+        
+        Параметри:
+            location: Назва водойми/місцезнаходження
+            trip: Розпочата експедиція (опціонально)
+            spot: Точка кльову (опціонально)
+            
+        Повертає:
+            True, якщо рибалка має сам створити експедицію в БД, інакше False
         """
         self.location = location
+        if spot is None and trip is not None and trip.fishing_spots:
+            spot = trip.fishing_spots[0]
+        self.spot = spot
         self.is_fishing = True
         self.catch_log.clear()  # Очистити журнал перед новою експедицією
+        self._owns_trip = False
+        if trip is not None and trip.trip_id is not None:
+            self.trip_id = trip.trip_id
+            return False
+        self.trip_id = None
+        return bool(self._catch_log_service)
+
+    def _announce_start(self, location: str) -> None:
+        """
+        Виведення повідомлення про початок риболовлі.
+        
+        Параметри:
+            location: Назва водойми/місцезнаходження
+        """
         print(f"\n[Fisherman {self.name}] Розпочинаю риболовлю в місцезнаходженні '{location}'")
         print(f"  Статус: Активно риблю")
         print()
 
+    def move_to_spot(self, spot: str) -> None:
+        """
+        Перехід на іншу точку кльову в межах поточної риболовлі.
+        
+        Параметри:
+            spot: Назва точки кльову
+        """
+        self.spot = spot
+        print(f"[Fisherman {self.name}] Переходжу на точку '{spot}'")
+
     def log_catch(self, fish_species: str, weight: float) -> None:
         """
         Реєстрація виловленої риби у журналі та базі даних.
@@ -91,8 +234,191 @@ class Fisherman:
         self.catch_log.add_entry(fish_species, weight)
         
         # Зберегти в базу даних
-        if self._catch_log_service:
-            self._catch_log_service.save_catch(self.name, fish_species, weight)
+        if self._journal:
+            self._journal.append((self.name, fish_species, weight, self.trip_id, self.spot))
+            return
+        if not self._catch_log_service:
+            return
+        if not self._is_buffered():
+            self._catch_log_service.save_catch(self.name, fish_species, weight,
+                                               self.trip_id, self.spot)
+            return
+        
+        self._buffer_catch(fish_species, weight)
+        if self._should_flush():
+            self.flush_catches()
+
+    async def log_catch_async(self, fish_species: str, weight: float) -> None:
+        """
+        Асинхронна реєстрація виловленої риби у журналі та базі даних.
+        
+        Працює як з CatchLogService, так і з AsyncCatchLogService.
+        
+        Параметри:
+            fish_species: Вид риби
+            weight: Вага риби у кілограмах
+        """
+        if not self.is_fishing:
+            print(f"[Fisherman {self.name}] Ошибка: Вы не на рыбалке!")
+            return
+        
+        self.catch_log.add_entry(fish_species, weight)
+        
+        if self._journal:
+            self._journal.append((self.name, fish_species, weight, self.trip_id, self.spot))
+            return
+        if not self._catch_log_service:
+            return
+        if not self._is_buffered():
+            await _await_if_needed(
+                self._catch_log_service.save_catch(self.name, fish_species, weight,
+                                                   self.trip_id, self.spot))
+            return
+        
+        self._buffer_catch(fish_species, weight)
+        if self._should_flush():
+            await self.flush_catches_async()
+
+    def _is_buffered(self) -> bool:
+        """
+        Перевірка, чи увімкнено буферизацію виловів.
+        
+        Повертає:
+            True, якщо задано поріг розміру або часу буфера, інакше False
+        """
+        return self.buffer_size > 0 or self.flush_interval is not None
+
+    def _buffer_catch(self, fish_species: str, weight: float) -> None:
+        """
+        Додавання вилову до буфера очікування запису в БД.
+        
+        Параметри:
+            fish_species: Вид риби
+            weight: Вага риби у кілограмах
+        """
+        if not self._pending_catches:
+            self._pending_since = time.monotonic()
+        self._pending_catches.append((self.name, fish_species, weight, self.trip_id, self.spot))
+
+    def _should_flush(self) -> bool:
+        """
+        Перевірка, чи досягнуто порогу розміру або часу буфера виловів.
+        
+        Викликається лише з log_catch та log_catch_async.
+        
+        Повертає:
+            True, якщо буфер потрібно записати в БД, інакше False
+        """
+        if self.buffer_size > 0 and len(self._pending_catches) >= self.buffer_size:
+            return True
+        if self.flush_interval is not None and self._pending_since is not None:
+            return time.monotonic() - self._pending_since >= self.flush_interval
+        return False
+
+    def _take_pending(self) -> List[PendingCatch]:
+        """
+        Вилучення всіх записів з буфера.
+        
+        Повертає:
+            Список буферизованих виловів
+        """
+        pending = self._pending_catches
+        self._pending_catches = []
+        self._pending_since = None
+        return pending
+
+    def _restore_pending(self, pending: List[PendingCatch]) -> None:
+        """
+        Повернення незбережених записів до буфера, щоб не втратити їх
+        при помилці БД.
+        
+        Параметри:
+            pending: Записи, які не вдалося зберегти
+        """
+        self._pending_catches = pending + self._pending_catches
+        self._pending_since = time.monotonic()
+
+    def flush_catches(self) -> int:
+        """
+        Запис усіх буферизованих виловів у базу даних однією транзакцією.
+        
+        З AsyncCatchLogService буфер потрібно записувати через
+        flush_catches_async або end_fishing_async.
+        
+        Повертає:
+            Кількість записаних виловів
+        
+        Викликає TypeError, якщо сервіс асинхронний (буфер не змінюється).
+        """
+        if not self._pending_catches or not self._catch_log_service:
+            return 0
+        pending = self._take_pending()
+        try:
+            saved = self._catch_log_service.save_catches_bulk(pending)
+        except Exception:
+            self._restore_pending(pending)
+            raise
+        if inspect.isawaitable(saved):
+            if inspect.iscoroutine(saved):
+                saved.close()
+            self._restore_pending(pending)
+            raise TypeError(f"[Fisherman {self.name}] Асинхронний сервіс журналу виловів: "
+                            f"використовуйте flush_catches_async або end_fishing_async")
+        if not saved:
+            self._restore_pending(pending)
+        return saved
+
+    async def flush_catches_async(self) -> int:
+        """
+        Асинхронний запис усіх буферизованих виловів у базу даних.
+        
+        Повертає:
+            Кількість записаних виловів
+        """
+        if not self._pending_catches or not self._catch_log_service:
+            return 0
+        pending = self._take_pending()
+        try:
+            saved = await _await_if_needed(self._catch_log_service.save_catches_bulk(pending))
+        except Exception:
+            self._restore_pending(pending)
+            raise
+        if not saved:
+            self._restore_pending(pending)
+        return saved
+
+    def _wait_for_journal(self) -> None:
+        """
+        Очікування запису в БД усіх виловів, дописаних у журнал.
+        """
+        if self._journal:
+            self._journal.flush()
+
+    async def _wait_for_journal_async(self) -> None:
+        """
+        Асинхронне очікування запису в БД усіх виловів, дописаних у журнал.
+        
+        Очікування виконується в пулі потоків, щоб не блокувати цикл подій.
+        """
+        if self._journal:
+            loop = asyncio.get_running_loop()
+            await loop.run_in_executor(None, self._journal.flush)
+
+    def _end_own_trip(self) -> None:
+        """
+        Збереження завершення експедиції, яку створив сам рибалка.
+        """
+        if self._owns_trip and self._catch_log_service:
+            self._catch_log_service.end_trip(self.trip_id)
+        self._owns_trip = False
+
+    async def _end_own_trip_async(self) -> None:
+        """
+        Асинхронне збереження завершення експедиції, яку створив сам рибалка.
+        """
+        if self._owns_trip and self._catch_log_service:
+            await _await_if_needed(self._catch_log_service.end_trip(self.trip_id))
+        self._owns_trip = False
 
     def end_fishing(self) -> None:
         """
@@ -103,6 +429,24 @@ class Fisherman:
             return
         
         self.is_fishing = False
+        self.flush_catches()
+        self._wait_for_journal()
+        self._end_own_trip()
+        print(f"\n[Fisherman {self.name}] Завершую риболовлю в місцезнаходженні '{self.location}'")
+        self.catch_log.display_summary()
+
+    async def end_fishing_async(self) -> None:
+        """
+        Асинхронно завершити риболовлю та вивести звіт про виловів.
+        """
+        if not self.is_fishing:
+            print(f"[Fisherman {self.name}] Вже не на рибалці")
+            return
+        
+        self.is_fishing = False
+        await self.flush_catches_async()
+        await self._wait_for_journal_async()
+        await self._end_own_trip_async()
         print(f"\n[Fisherman {self.name}] Завершую риболовлю в місцезнаходженні '{self.location}'")
         self.catch_log.display_summary()
 
@@ -113,8 +457,24 @@ class Fisherman:
         Повертає:
             Словник з кількістю та загальною вагою виловів
         """
+        self.flush_catches()
+        self._wait_for_journal()
         return self._catch_log_service.get_catch_summary(self.name)
 
+    def get_trip_stats(self) -> Optional[dict]:
+        """
+        Отримання статистики поточної або останньої експедиції.
+        
+        Повертає:
+            Словник з тривалістю, кількістю, загальною вагою та врожайністю
+            виловів або None, якщо експедицію не збережено
+        """
+        if self.trip_id is None or not self._catch_log_service:
+            return None
+        self.flush_catches()
+        self._wait_for_journal()
+        return self._catch_log_service.get_trip_stats(self.trip_id)
+
     def display_info(self) -> None:
         """
         Виведення інформації про рибалку в консоль.
@@ -5,8 +5,10 @@
 учасників та діяльність.
 """
 
+import inspect
 from typing import List, Optional
 from datetime import datetime
+from catch_log_service import CatchLogService
 
 
 class FishingTrip:
@@ -18,7 +20,8 @@ class FishingTrip:
     """
 
     def __init__(self, location: str, fisherman_name: str, 
-                 depth_map: str, fishing_spots: List[str]) -> None:
+                 depth_map: str, fishing_spots: List[str],
+                 catch_log_service: Optional[CatchLogService] = None) -> None:
         """
         Ініціалізація рибальської експедиції.
         
@@ -27,6 +30,8 @@ class FishingTrip:
             fisherman_name: Ім'я рибалки-організатора
             depth_map: Інформація про карту глибин
             fishing_spots: Список точок кльову
+            catch_log_service: Сервіс журналу виловів для збереження
+                експедиції в таблиці trips (опціонально)
         """
         self.location = location
         self.fisherman_name = fisherman_name
@@ -35,6 +40,8 @@ class FishingTrip:
         self.start_time = datetime.now()
         self.end_time: Optional[datetime] = None
         self.is_active = False
+        self.trip_id: Optional[int] = None
+        self._catch_log_service = catch_log_service
 
     def start(self) -> None:
         """
@@ -42,6 +49,29 @@ class FishingTrip:
         """
         self.is_active = True
         self.start_time = datetime.now()
+        if self._catch_log_service:
+            self.trip_id = self._catch_log_service.start_trip(
+                self.fisherman_name, self.location, self.depth_map)
+        self._announce_start()
+
+    async def start_async(self) -> None:
+        """
+        Асинхронно розпочати рибальську експедицію.
+
+        Працює як з CatchLogService, так і з AsyncCatchLogService.
+        """
+        self.is_active = True
+        self.start_time = datetime.now()
+        if self._catch_log_service:
+            trip_id = self._catch_log_service.start_trip(
+                self.fisherman_name, self.location, self.depth_map)
+            self.trip_id = await trip_id if inspect.isawaitable(trip_id) else trip_id
+        self._announce_start()
+
+    def _announce_start(self) -> None:
+        """
+        Виведення повідомлення про початок експедиції.
+        """
         print(f"\n[FishingTrip] Експедиція розпочата в місцезнаходженні '{self.location}'")
         print(f"  Рибалка: {self.fisherman_name}")
         print(f"  Карта глибин: {self.depth_map}")
@@ -54,12 +84,46 @@ class FishingTrip:
         """
         self.is_active = False
         self.end_time = datetime.now()
+        if self._catch_log_service and self.trip_id is not None:
+            self._catch_log_service.end_trip(self.trip_id)
+        self._announce_end()
+
+    async def end_async(self) -> None:
+        """
+        Асинхронно завершити рибальську експедицію.
+
+        Працює як з CatchLogService, так і з AsyncCatchLogService.
+        """
+        self.is_active = False
+        self.end_time = datetime.now()
+        if self._catch_log_service and self.trip_id is not None:
+            result = self._catch_log_service.end_trip(self.trip_id)
+            if inspect.isawaitable(result):
+                await result
+        self._announce_end()
+
+    def _announce_end(self) -> None:
+        """
+        Виведення повідомлення про завершення експедиції.
+        """
         duration = (self.end_time - self.start_time).total_seconds() / 60
         print(f"\n[FishingTrip] Експедиція завершена")
         print(f"  Місцезнаходження: {self.location}")
         print(f"  Тривалість: {duration:.0f} хвилин")
         print()
 
+    def get_stats(self) -> Optional[dict]:
+        """
+        Отримання статистики експедиції з бази даних.
+        
+        Повертає:
+            Словник з тривалістю, кількістю, загальною вагою та врожайністю
+            виловів або None, якщо експедицію не збережено
+        """
+        if not self._catch_log_service or self.trip_id is None:
+            return None
+        return self._catch_log_service.get_trip_stats(self.trip_id)
+
     def get_fishing_plan(self) -> str:
         """
         Отримання плану рибальської експедиції.
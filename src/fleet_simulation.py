@@ -0,0 +1,303 @@
+"""
+Модуль паралельної симуляції рибальського флоту.
+
+Цей модуль запускає цикл "планування - риболовля - завершення" для
+багатьох рибалок у пулі процесів. Рибалки розподіляються між процесами
+(шардами), кожен шард пише у власну базу даних, а результати об'єднуються
+у звіт з пропускною здатністю та перцентилями затримок.
+"""
+
+import json
+import math
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import redirect_stdout
+from typing import Iterable, List, Optional
+
+from catch_log_service import CatchLogService
+from fisherman import Fisherman
+from fishing_trip import FishingTrip
+from logging_config import configure_logging
+from sensor import Sensor
+from weather_service import WeatherService
+
+
+FISH_SPECIES = ['Окунь', 'Щука', 'Карась', 'Сом', 'Короп', 'Лящ']
+
+
+class FleetConfig:
+    """
+    Параметри симуляції рибальського флоту.
+    """
+
+    def __init__(self, fishermen: int = 10, catches_per_fisherman: int = 100,
+                 workers: Optional[int] = None, buffer_size: int = 0,
+                 sensors_per_fisherman: int = 1, locations: Optional[List[str]] = None,
+                 db_dir: str = "fleet_data", seed: int = 0) -> None:
+        """
+        Ініціалізація параметрів симуляції.
+
+        Параметри:
+            fishermen: Кількість рибалок у флоті
+            catches_per_fisherman: Кількість виловів на одного рибалку
+            workers: Кількість процесів (за замовчуванням: кількість ядер)
+            buffer_size: Розмір буфера виловів рибалки (0 - запис кожного вилову)
+            sensors_per_fisherman: Кількість сенсорів на одну експедицію
+            locations: Назви водойм, між якими розподіляються рибалки
+            db_dir: Каталог для баз даних шардів
+            seed: Початкове значення генераторів випадкових чисел
+        """
+        self.fishermen = fishermen
+        self.catches_per_fisherman = catches_per_fisherman
+        self.workers = workers or os.cpu_count() or 1
+        self.buffer_size = buffer_size
+        self.sensors_per_fisherman = sensors_per_fisherman
+        self.locations = locations or ["Озеро Победы", "Річка Грабовець"]
+        self.db_dir = db_dir
+        self.seed = seed
+
+    @classmethod
+    def from_dict(cls, data: dict) -> 'FleetConfig':
+        """
+        Створення параметрів симуляції зі словника.
+
+        Параметри:
+            data: Словник з параметрами (ключі збігаються з аргументами конструктора)
+
+        Повертає:
+            Параметри симуляції
+        """
+        return cls(**data)
+
+    @classmethod
+    def from_json_file(cls, path: str) -> 'FleetConfig':
+        """
+        Завантаження параметрів симуляції з JSON-файлу.
+
+        Параметри:
+            path: Шлях до JSON-файлу
+
+        Повертає:
+            Параметри симуляції
+        """
+        with open(path, encoding="utf-8") as config_file:
+            return cls.from_dict(json.load(config_file))
+
+
+class _CountingCatchLogService(CatchLogService):
+    """
+    Сервіс журналу виловів з підрахунком транзакцій запису.
+    """
+
+    def __init__(self, db_path: str) -> None:
+        """
+        Ініціалізація сервісу з нульовим лічильником транзакцій.
+
+        Параметри:
+            db_path: Шлях до файлу SQLite бази даних
+        """
+        self.transactions = 0
+        super().__init__(db_path)
+
+    def save_catch(self, fisherman_name: str, fish_species: str, weight: float,
+                   trip_id: Optional[int] = None, spot: Optional[str] = None) -> None:
+        """
+        Збереження одного вилову з підрахунком транзакції.
+        """
+        self.transactions += 1
+        super().save_catch(fisherman_name, fish_species, weight, trip_id, spot)
+
+    def save_catches_bulk(self, catches) -> int:
+        """
+        Пакетне збереження виловів з підрахунком транзакції.
+        """
+        self.transactions += 1
+        return super().save_catches_bulk(catches)
+
+    def start_trip(self, fisherman_name: str, location: str,
+                   depth_map: Optional[str] = None) -> Optional[int]:
+        """
+        Збереження початку експедиції з підрахунком транзакції.
+        """
+        self.transactions += 1
+        return super().start_trip(fisherman_name, location, depth_map)
+
+    def end_trip(self, trip_id: int) -> None:
+        """
+        Збереження завершення експедиції з підрахунком транзакції.
+        """
+        self.transactions += 1
+        super().end_trip(trip_id)
+
+
+def _run_shard(config: FleetConfig, shard_index: int, fisherman_indexes: List[int]) -> dict:
+    """
+    Виконання циклу риболовлі для рибалок одного шарда.
+
+    Функція виконується в окремому процесі, тому виводить повідомлення
+    лише в тихому режимі.
+
+    Параметри:
+        config: Параметри симуляції
+        shard_index: Номер шарда
+        fisherman_indexes: Номери рибалок цього шарда
+
+    Повертає:
+        Словник з кількістю виловів, транзакцій, відкладених експедицій
+        та затримками
+    """
+    configure_logging(quiet=True)
+    rng = random.Random(config.seed * 1000003 + shard_index)
+    db_path = os.path.join(config.db_dir, f"fleet_shard_{shard_index}.db")
+    catch_latencies: List[float] = []
+    cycle_latencies: List[float] = []
+    catches = 0
+    postponed = 0
+
+    with open(os.devnull, "w") as devnull, redirect_stdout(devnull):
+        service = _CountingCatchLogService(db_path)
+        try:
+            for index in fisherman_indexes:
+                cycle_start = time.perf_counter()
+                location = config.locations[index % len(config.locations)]
+                fisherman = Fisherman(f"Рибалка {index}", service,
+                                      buffer_size=config.buffer_size)
+                sensors = [Sensor(f"SENSOR_{index}_{i}", location, seed=rng.randrange(2 ** 32))
+                           for i in range(config.sensors_per_fisherman)]
+
+                # Планування: за непридатної погоди експедицію відкладено,
+                # як і в основній програмі
+                forecast = WeatherService.get_weather_forecast(location)
+                if not WeatherService.is_suitable_for_fishing(forecast):
+                    postponed += 1
+                    continue
+                trip = FishingTrip(location, fisherman.name, "Карта 2024", ["Біля берега"],
+                                   service)
+                trip.start()
+
+                # Риболовля
+                fisherman.start_fishing(location, trip)
+                for sensor in sensors:
+                    sensor.measure_temperature()
+                    sensor.measure_water_quality()
+                for _ in range(config.catches_per_fisherman):
+                    species = rng.choice(FISH_SPECIES)
+                    weight = round(rng.uniform(0.2, 5.0), 2)
+                    start = time.perf_counter()
+                    fisherman.log_catch(species, weight)
+                    catch_latencies.append(time.perf_counter() - start)
+                    catches += 1
+
+                # Завершення
+                fisherman.end_fishing()
+                trip.end()
+                cycle_latencies.append(time.perf_counter() - cycle_start)
+        finally:
+            service.close()
+
+    return {
+        'catches': catches,
+        'postponed': postponed,
+        'transactions': service.transactions,
+        'catch_latencies': catch_latencies,
+        'cycle_latencies': cycle_latencies
+    }
+
+
+def percentile(sorted_values: List[float], fraction: float) -> float:
+    """
+    Обчислення перцентиля відсортованої вибірки методом найближчого рангу.
+
+    Параметри:
+        sorted_values: Відсортовані значення
+        fraction: Частка від 0 до 1 (наприклад, 0.95 для p95)
+
+    Повертає:
+        Значення перцентиля або 0.0 для порожньої вибірки
+    """
+    if not sorted_values:
+        return 0.0
+    rank = max(0, min(len(sorted_values) - 1, math.ceil(fraction * len(sorted_values)) - 1))
+    return sorted_values[rank]
+
+
+def _latency_summary(values: Iterable[float]) -> dict:
+    """
+    Обчислення перцентилів затримок у мілісекундах.
+
+    Параметри:
+        values: Затримки у секундах
+
+    Повертає:
+        Словник з p50, p95, p99 та максимумом у мілісекундах
+    """
+    ordered = sorted(values)
+    return {
+        'p50_ms': round(percentile(ordered, 0.50) * 1000, 3),
+        'p95_ms': round(percentile(ordered, 0.95) * 1000, 3),
+        'p99_ms': round(percentile(ordered, 0.99) * 1000, 3),
+        'max_ms': round((ordered[-1] if ordered else 0.0) * 1000, 3)
+    }
+
+
+def run_fleet_simulation(config: FleetConfig) -> dict:
+    """
+    Запуск паралельної симуляції флоту та об'єднання результатів шардів.
+
+    Параметри:
+        config: Параметри симуляції
+
+    Повертає:
+        Звіт з пропускною здатністю та перцентилями затримок
+    """
+    os.makedirs(config.db_dir, exist_ok=True)
+    shard_count = max(1, min(config.workers, config.fishermen))
+    shards = [list(range(shard, config.fishermen, shard_count)) for shard in range(shard_count)]
+
+    start = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=shard_count) as executor:
+        futures = [executor.submit(_run_shard, config, shard_index, indexes)
+                   for shard_index, indexes in enumerate(shards)]
+        results = [future.result() for future in futures]
+    elapsed = time.perf_counter() - start
+
+    catches = sum(result['catches'] for result in results)
+    postponed = sum(result['postponed'] for result in results)
+    transactions = sum(result['transactions'] for result in results)
+    return {
+        'fishermen': config.fishermen,
+        'workers': shard_count,
+        'postponed_trips': postponed,
+        'elapsed_s': round(elapsed, 3),
+        'catches': catches,
+        'db_transactions': transactions,
+        'catches_per_s': round(catches / elapsed, 1) if elapsed else 0.0,
+        'db_writes_per_s': round(transactions / elapsed, 1) if elapsed else 0.0,
+        'log_catch_latency': _latency_summary(
+            latency for result in results for latency in result['catch_latencies']),
+        'cycle_latency': _latency_summary(
+            latency for result in results for latency in result['cycle_latencies'])
+    }
+
+
+def print_fleet_report(report: dict) -> None:
+    """
+    Виведення звіту симуляції флоту в консоль.
+
+    Параметри:
+        report: Звіт, отриманий від run_fleet_simulation
+    """
+    print("\n[Fleet Simulation Report]")
+    print(f"  Рибалок: {report['fishermen']}, процесів: {report['workers']}")
+    print(f"  Відкладено експедицій через погоду: {report['postponed_trips']}")
+    print(f"  Тривалість: {report['elapsed_s']} с")
+    print(f"  Виловів: {report['catches']} ({report['catches_per_s']} за секунду)")
+    print(f"  Транзакцій БД: {report['db_transactions']} ({report['db_writes_per_s']} за секунду)")
+    for title, key in (("Затримка log_catch", 'log_catch_latency'),
+                       ("Тривалість циклу рибалки", 'cycle_latency')):
+        latency = report[key]
+        print(f"  {title}: p50 {latency['p50_ms']} мс, p95 {latency['p95_ms']} мс, "
+              f"p99 {latency['p99_ms']} мс, макс. {latency['max_ms']} мс")
+    print()
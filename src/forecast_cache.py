@@ -0,0 +1,142 @@
+"""
+Модуль кешу прогнозів погоди.
+
+Цей модуль забезпечує кешування прогнозів погоди за локацією з обмеженим
+часом життя записів, витісненням найдавніше використаних записів та
+об'єднанням одночасних запитів до однієї локації.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+from typing import Callable, Dict, Tuple
+
+
+class ForecastCache:
+    """
+    Кеш прогнозів погоди з TTL та LRU-витісненням.
+
+    Якщо кілька потоків одночасно запитують прогноз для локації, якої немає
+    в кеші, виконується лише один запит до джерела прогнозів, а решта
+    потоків очікують його результат.
+    """
+
+    def __init__(self, fetch: Callable[[str], dict], ttl: float = 300.0,
+                 max_entries: int = 256,
+                 clock: Callable[[], float] = time.monotonic) -> None:
+        """
+        Ініціалізація кешу прогнозів.
+
+        Параметри:
+            fetch: Функція отримання прогнозу для локації
+            ttl: Час життя запису кешу у секундах
+            max_entries: Максимальна кількість локацій у кеші
+            clock: Джерело поточного часу (за замовчуванням: time.monotonic)
+        """
+        self._fetch = fetch
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries: 'OrderedDict[str, Tuple[float, dict]]' = OrderedDict()
+        self._in_flight: Dict[str, Future] = {}
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.coalesced = 0
+
+    def get(self, location: str) -> dict:
+        """
+        Отримання прогнозу для локації з кешу або з джерела прогнозів.
+
+        Параметри:
+            location: Назва локації
+
+        Повертає:
+            Словник з прогнозом погоди
+        """
+        with self._lock:
+            entry = self._entries.get(location)
+            if entry is not None:
+                if entry[0] > self._clock():
+                    self._entries.move_to_end(location)
+                    self.hits += 1
+                    return entry[1]
+                del self._entries[location]
+                self.expirations += 1
+
+            pending = self._in_flight.get(location)
+            is_owner = pending is None
+            if is_owner:
+                pending = Future()
+                self._in_flight[location] = pending
+                self.misses += 1
+            else:
+                self.coalesced += 1
+
+        if not is_owner:
+            return pending.result()
+
+        try:
+            forecast = self._fetch(location)
+        except BaseException as e:
+            with self._lock:
+                del self._in_flight[location]
+            pending.set_exception(e)
+            raise
+
+        with self._lock:
+            self._entries[location] = (self._clock() + self.ttl, forecast)
+            self._entries.move_to_end(location)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+            del self._in_flight[location]
+        pending.set_result(forecast)
+        return forecast
+
+    def invalidate(self, location: str) -> None:
+        """
+        Видалення прогнозу для локації з кешу.
+
+        Параметри:
+            location: Назва локації
+        """
+        with self._lock:
+            self._entries.pop(location, None)
+
+    def clear(self) -> None:
+        """
+        Очищення кешу від усіх записів.
+        """
+        with self._lock:
+            self._entries.clear()
+
+    def get_stats(self) -> dict:
+        """
+        Отримання лічильників роботи кешу.
+
+        Повертає:
+            Словник з кількістю влучань, промахів, витіснень, прострочених
+            записів, об'єднаних запитів та поточним розміром кешу
+        """
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'expirations': self.expirations,
+                'coalesced': self.coalesced,
+                'size': len(self._entries)
+            }
+
+    def __len__(self) -> int:
+        """
+        Отримання кількості локацій у кеші.
+
+        Повертає:
+            Кількість записів кешу
+        """
+        return len(self._entries)
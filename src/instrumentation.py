@@ -0,0 +1,339 @@
+"""
+Модуль інструментування гарячих шляхів системи.
+
+Цей модуль вимірює час і кількість викликів основних операцій
+(запитів CatchLogService та AsyncCatchLogService, реєстрації виловів,
+вимірювань датчиків, звітів еколога та запитів прогнозу погоди) і
+зберігає їх у гістограмах.
+Інструментування вмикається явно: методи класів замінюються обгортками
+з вимірюванням часу лише після виклику enable_instrumentation(), тому
+у вимкненому стані додаткових витрат немає.
+"""
+
+import bisect
+import functools
+import inspect
+import json
+import threading
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+
+from async_catch_log_service import AsyncCatchLogService
+from catch_log_service import CatchLogService
+from ecologist import Ecologist
+from fisherman import Fisherman
+from sensor import Sensor
+from weather_service import WeatherService
+
+
+# Межі кошиків гістограми у секундах: від 10 мкс до ~7 с з кроком √2
+BUCKET_BOUNDS: List[float] = [0.00001 * 2 ** (i / 2) for i in range(40)]
+
+# Методи, що інструментуються: (клас, метод, метрика, мітки)
+INSTRUMENTED_METHODS: List[Tuple[type, str, str, Dict[str, str]]] = [
+    (CatchLogService, 'save_catch', 'catch_log_service_query_seconds',
+     {'method': 'save_catch', 'statement': 'INSERT'}),
+    (CatchLogService, 'save_catches_bulk', 'catch_log_service_query_seconds',
+     {'method': 'save_catches_bulk', 'statement': 'INSERT'}),
+    (CatchLogService, 'save_journal_batch', 'catch_log_service_query_seconds',
+     {'method': 'save_journal_batch', 'statement': 'INSERT'}),
+    (CatchLogService, 'import_catches', 'catch_log_service_query_seconds',
+     {'method': 'import_catches', 'statement': 'INSERT'}),
+    (CatchLogService, 'start_trip', 'catch_log_service_query_seconds',
+     {'method': 'start_trip', 'statement': 'INSERT'}),
+    (CatchLogService, 'end_trip', 'catch_log_service_query_seconds',
+     {'method': 'end_trip', 'statement': 'UPDATE'}),
+    (CatchLogService, 'get_all_catches', 'catch_log_service_query_seconds',
+     {'method': 'get_all_catches', 'statement': 'SELECT'}),
+    (CatchLogService, 'iter_catches', 'catch_log_service_query_seconds',
+     {'method': 'iter_catches', 'statement': 'SELECT'}),
+    (CatchLogService, 'get_trip_stats', 'catch_log_service_query_seconds',
+     {'method': 'get_trip_stats', 'statement': 'SELECT'}),
+    (CatchLogService, 'get_catch_summary', 'catch_log_service_query_seconds',
+     {'method': 'get_catch_summary', 'statement': 'SELECT'}),
+    (CatchLogService, 'get_species_rollup', 'catch_log_service_query_seconds',
+     {'method': 'get_species_rollup', 'statement': 'SELECT'}),
+    (CatchLogService, 'get_top_fishermen', 'catch_log_service_query_seconds',
+     {'method': 'get_top_fishermen', 'statement': 'SELECT'}),
+    (CatchLogService, 'get_weight_distribution', 'catch_log_service_query_seconds',
+     {'method': 'get_weight_distribution', 'statement': 'SELECT'}),
+    (AsyncCatchLogService, 'save_catch', 'async_catch_log_service_seconds',
+     {'method': 'save_catch'}),
+    (AsyncCatchLogService, 'save_catches_bulk', 'async_catch_log_service_seconds',
+     {'method': 'save_catches_bulk'}),
+    (AsyncCatchLogService, 'start_trip', 'async_catch_log_service_seconds',
+     {'method': 'start_trip'}),
+    (AsyncCatchLogService, 'end_trip', 'async_catch_log_service_seconds',
+     {'method': 'end_trip'}),
+    (AsyncCatchLogService, 'get_all_catches', 'async_catch_log_service_seconds',
+     {'method': 'get_all_catches'}),
+    (AsyncCatchLogService, 'get_catch_summary', 'async_catch_log_service_seconds',
+     {'method': 'get_catch_summary'}),
+    (AsyncCatchLogService, 'get_trip_stats', 'async_catch_log_service_seconds',
+     {'method': 'get_trip_stats'}),
+    (Fisherman, 'log_catch', 'fisherman_log_catch_seconds', {}),
+    (Sensor, 'measure_temperature', 'sensor_measure_seconds', {'metric': 'temperature'}),
+    (Sensor, 'measure_water_quality', 'sensor_measure_seconds', {'metric': 'quality'}),
+    (Ecologist, 'get_water_condition_report', 'ecologist_report_seconds', {}),
+    (WeatherService, 'get_weather_forecast', 'weather_service_seconds',
+     {'method': 'get_weather_forecast'}),
+    (WeatherService, 'get_weather_forecasts', 'weather_service_seconds',
+     {'method': 'get_weather_forecasts'}),
+    (WeatherService, 'is_suitable_for_fishing', 'weather_service_seconds',
+     {'method': 'is_suitable_for_fishing'}),
+]
+
+
+class Histogram:
+    """
+    Гістограма тривалостей з фіксованими межами кошиків.
+
+    Зберігає лише лічильники кошиків, суму та кількість спостережень,
+    тому пам'ять не залежить від кількості вимірів.
+    """
+
+    def __init__(self) -> None:
+        """
+        Ініціалізація порожньої гістограми.
+        """
+        self.bucket_counts = [0] * (len(BUCKET_BOUNDS) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        """
+        Додавання спостереження до гістограми.
+
+        Параметри:
+            value: Тривалість у секундах
+        """
+        self.bucket_counts[bisect.bisect_left(BUCKET_BOUNDS, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def quantile(self, fraction: float) -> float:
+        """
+        Оцінка квантиля за лічильниками кошиків з лінійною інтерполяцією.
+
+        Параметри:
+            fraction: Частка від 0 до 1 (наприклад, 0.99 для p99)
+
+        Повертає:
+            Оцінка квантиля у секундах або 0.0 для порожньої гістограми
+        """
+        if not self.count:
+            return 0.0
+        target = fraction * self.count
+        cumulative = 0
+        for index, bucket_count in enumerate(self.bucket_counts):
+            if cumulative + bucket_count >= target and bucket_count:
+                lower = BUCKET_BOUNDS[index - 1] if index > 0 else 0.0
+                upper = BUCKET_BOUNDS[index] if index < len(BUCKET_BOUNDS) else lower * 2
+                return lower + (upper - lower) * (target - cumulative) / bucket_count
+            cumulative += bucket_count
+        return BUCKET_BOUNDS[-1]
+
+
+class MetricsRegistry:
+    """
+    Реєстр гістограм, згрупованих за назвою метрики та мітками.
+    """
+
+    def __init__(self) -> None:
+        """
+        Ініціалізація порожнього реєстру.
+        """
+        self._lock = threading.Lock()
+        self._histograms: Dict[Tuple[str, Tuple[Tuple[str, str], ...]], Histogram] = {}
+
+    def observe(self, name: str, labels: Dict[str, str], value: float) -> None:
+        """
+        Запис тривалості операції.
+
+        Параметри:
+            name: Назва метрики
+            labels: Мітки метрики
+            value: Тривалість у секундах
+        """
+        key = (name, tuple(sorted(labels.items())))
+        with self._lock:
+            histogram = self._histograms.get(key)
+            if histogram is None:
+                histogram = self._histograms[key] = Histogram()
+            histogram.observe(value)
+
+    def reset(self) -> None:
+        """
+        Видалення всіх накопичених вимірів.
+        """
+        with self._lock:
+            self._histograms.clear()
+
+    def snapshot(self) -> Dict[str, List[dict]]:
+        """
+        Отримання знімка всіх метрик.
+
+        Повертає:
+            Словник {метрика: [мітки, кількість, сума, p50, p95, p99]}
+        """
+        result: Dict[str, List[dict]] = {}
+        with self._lock:
+            for (name, labels), histogram in sorted(self._histograms.items()):
+                result.setdefault(name, []).append({
+                    'labels': dict(labels),
+                    'count': histogram.count,
+                    'sum_s': histogram.sum,
+                    'p50_s': histogram.quantile(0.50),
+                    'p95_s': histogram.quantile(0.95),
+                    'p99_s': histogram.quantile(0.99)
+                })
+        return result
+
+    def to_json(self) -> str:
+        """
+        Експорт знімка метрик у JSON.
+
+        Повертає:
+            Рядок JSON
+        """
+        return json.dumps(self.snapshot(), ensure_ascii=False, indent=2)
+
+    def to_prometheus(self, prefix: str = "fishing_") -> str:
+        """
+        Експорт метрик у текстовому форматі Prometheus.
+
+        Параметри:
+            prefix: Префікс назв метрик
+
+        Повертає:
+            Текст з гістограмами у форматі експозиції Prometheus
+        """
+        lines: List[str] = []
+        seen = set()
+        with self._lock:
+            for (name, labels), histogram in sorted(self._histograms.items()):
+                metric = prefix + name
+                if metric not in seen:
+                    lines.append(f"# TYPE {metric} histogram")
+                    seen.add(metric)
+                label_text = ",".join(f'{key}="{value}"' for key, value in labels)
+                separator = "," if label_text else ""
+                cumulative = 0
+                for bound, bucket_count in zip(BUCKET_BOUNDS + [float("inf")],
+                                               histogram.bucket_counts):
+                    cumulative += bucket_count
+                    le = "+Inf" if bound == float("inf") else f"{bound:.6g}"
+                    lines.append(f'{metric}_bucket{{{label_text}{separator}le="{le}"}} {cumulative}')
+                suffix = f"{{{label_text}}}" if label_text else ""
+                lines.append(f"{metric}_sum{suffix} {histogram.sum}")
+                lines.append(f"{metric}_count{suffix} {histogram.count}")
+        return "\n".join(lines) + "\n"
+
+
+# Глобальний реєстр метрик системи
+metrics = MetricsRegistry()
+
+_originals: List[Tuple[type, str, object]] = []
+
+
+def _timed(func: Callable, registry: MetricsRegistry, name: str,
+           labels: Dict[str, str]) -> Callable:
+    """
+    Створення обгортки, що вимірює тривалість виклику функції.
+
+    Для корутин вимірюється час до отримання результату (для
+    AsyncCatchLogService - разом з очікуванням у черзі запису), а для
+    генераторів - сумарний час усередині генератора за всю ітерацію,
+    без часу обробки записів споживачем.
+
+    Параметри:
+        func: Функція для вимірювання
+        registry: Реєстр метрик
+        name: Назва метрики
+        labels: Мітки метрики
+
+    Повертає:
+        Обгортка з тим самим інтерфейсом, що й func
+    """
+    perf_counter = time.perf_counter
+
+    if inspect.iscoroutinefunction(func):
+        @functools.wraps(func)
+        async def coroutine_wrapper(*args, **kwargs):
+            start = perf_counter()
+            try:
+                return await func(*args, **kwargs)
+            finally:
+                registry.observe(name, labels, perf_counter() - start)
+        return coroutine_wrapper
+
+    if inspect.isgeneratorfunction(func):
+        @functools.wraps(func)
+        def generator_wrapper(*args, **kwargs):
+            iterator = func(*args, **kwargs)
+            elapsed = 0.0
+            try:
+                while True:
+                    start = perf_counter()
+                    try:
+                        item = next(iterator)
+                    except StopIteration as stop:
+                        return stop.value
+                    finally:
+                        elapsed += perf_counter() - start
+                    yield item
+            finally:
+                iterator.close()
+                registry.observe(name, labels, elapsed)
+        return generator_wrapper
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        start = perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            registry.observe(name, labels, perf_counter() - start)
+    return wrapper
+
+
+def enable_instrumentation(registry: Optional[MetricsRegistry] = None) -> MetricsRegistry:
+    """
+    Увімкнення вимірювання гарячих шляхів.
+
+    Параметри:
+        registry: Реєстр для запису метрик (за замовчуванням: глобальний metrics)
+
+    Повертає:
+        Реєстр, у який записуються метрики
+    """
+    registry = registry or metrics
+    disable_instrumentation()
+    for cls, attribute, name, labels in INSTRUMENTED_METHODS:
+        original = cls.__dict__[attribute]
+        if isinstance(original, (classmethod, staticmethod)):
+            wrapped = type(original)(_timed(original.__func__, registry, name, labels))
+        else:
+            wrapped = _timed(original, registry, name, labels)
+        _originals.append((cls, attribute, original))
+        setattr(cls, attribute, wrapped)
+    return registry
+
+
+def disable_instrumentation() -> None:
+    """
+    Вимкнення вимірювання та відновлення початкових методів.
+    """
+    while _originals:
+        cls, attribute, original = _originals.pop()
+        setattr(cls, attribute, original)
+
+
+def is_instrumentation_enabled() -> bool:
+    """
+    Перевірка, чи увімкнено вимірювання.
+
+    Повертає:
+        True, якщо методи замінено обгортками вимірювання
+    """
+    return bool(_originals)
@@ -0,0 +1,82 @@
+"""
+Модуль налаштування журналювання системи.
+
+Цей модуль налаштовує журналювання через стандартний модуль logging:
+консольний режим з тим самим виводом, що й раніше, тихий режим для
+пакетних запусків і бенчмарків та необов'язкову чергу для запису
+повідомлень в окремому потоці.
+"""
+
+import logging
+import logging.handlers
+import queue
+import sys
+from typing import Optional, TextIO
+
+
+# Кореневий логер системи; модулі використовують дочірні логери fishing.<модуль>
+LOGGER_NAME = "fishing"
+
+_listener: Optional[logging.handlers.QueueListener] = None
+
+
+def get_logger(module_name: str) -> logging.Logger:
+    """
+    Отримання логера для модуля системи.
+
+    Параметри:
+        module_name: Назва модуля
+
+    Повертає:
+        Дочірній логер кореневого логера системи
+    """
+    return logging.getLogger(f"{LOGGER_NAME}.{module_name}")
+
+
+def configure_logging(quiet: bool = False, use_queue: bool = False,
+                      stream: Optional[TextIO] = None) -> logging.Logger:
+    """
+    Налаштування журналювання системи.
+
+    У консольному режимі повідомлення виводяться в stdout без префіксів,
+    як звичайний вивід програми. У тихому режимі інформаційні повідомлення
+    відкидаються ще до форматування рядків.
+
+    Параметри:
+        quiet: Тихий режим - виводяться лише попередження та помилки
+        use_queue: Передавати повідомлення в окремий потік через чергу
+        stream: Потік для виводу (за замовчуванням: sys.stdout)
+
+    Повертає:
+        Кореневий логер системи
+    """
+    shutdown_logging()
+
+    logger = logging.getLogger(LOGGER_NAME)
+    for handler in list(logger.handlers):
+        logger.removeHandler(handler)
+    logger.setLevel(logging.WARNING if quiet else logging.INFO)
+    logger.propagate = False
+
+    console_handler = logging.StreamHandler(stream or sys.stdout)
+    console_handler.setFormatter(logging.Formatter("%(message)s"))
+
+    if use_queue:
+        global _listener
+        message_queue: 'queue.SimpleQueue' = queue.SimpleQueue()
+        logger.addHandler(logging.handlers.QueueHandler(message_queue))
+        _listener = logging.handlers.QueueListener(message_queue, console_handler)
+        _listener.start()
+    else:
+        logger.addHandler(console_handler)
+    return logger
+
+
+def shutdown_logging() -> None:
+    """
+    Зупинка потоку журналювання з виводом усіх повідомлень з черги.
+    """
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
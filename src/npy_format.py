@@ -0,0 +1,56 @@
+"""
+Модуль запису та читання заголовків файлів формату NumPy .npy.
+
+Цей модуль дозволяє створювати файли .npy засобами стандартної бібліотеки
+(модулі array та mmap), які потім можна відкрити через numpy.load,
+зокрема з mmap_mode='r'.
+"""
+
+import ast
+from typing import BinaryIO, Tuple
+
+NPY_MAGIC = b"\x93NUMPY"
+# Повна довжина заголовка .npy; фіксована, щоб можна було переписати розміри масиву
+NPY_HEADER_SIZE = 128
+
+
+def npy_header(dtype: str, shape: Tuple[int, ...]) -> bytes:
+    """
+    Побудова заголовка .npy (версія 1.0) фіксованої довжини.
+
+    Параметри:
+        dtype: Опис типу NumPy (наприклад, '<f8')
+        shape: Розміри масиву
+
+    Повертає:
+        Заголовок довжиною NPY_HEADER_SIZE байтів
+    """
+    header = f"{{'descr': '{dtype}', 'fortran_order': False, 'shape': {tuple(shape)!r}, }}"
+    padding = NPY_HEADER_SIZE - len(NPY_MAGIC) - 4 - len(header) - 1
+    if padding < 0:
+        raise ValueError("Заголовок .npy не вміщується у фіксовану довжину")
+    header = header + " " * padding + "\n"
+    return NPY_MAGIC + b"\x01\x00" + len(header).to_bytes(2, "little") + header.encode("latin1")
+
+
+def read_npy_header(file: BinaryIO) -> Tuple[str, Tuple[int, ...], int]:
+    """
+    Читання заголовка .npy з початку файлу.
+
+    Параметри:
+        file: Файл, відкритий у двійковому режимі
+
+    Повертає:
+        Кортеж (dtype, розміри масиву, зміщення початку даних у байтах)
+    """
+    file.seek(0)
+    if file.read(len(NPY_MAGIC)) != NPY_MAGIC:
+        raise ValueError(f"Файл {getattr(file, 'name', '')} не є файлом .npy")
+    major = file.read(2)[0]
+    header_length_size = 2 if major == 1 else 4
+    header_length = int.from_bytes(file.read(header_length_size), "little")
+    header = ast.literal_eval(file.read(header_length).decode("latin1"))
+    if header.get('fortran_order'):
+        raise ValueError("Масиви у порядку Fortran не підтримуються")
+    offset = len(NPY_MAGIC) + 2 + header_length_size + header_length
+    return header['descr'], tuple(header['shape']), offset
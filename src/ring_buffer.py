@@ -0,0 +1,112 @@
+"""
+Модуль кільцевого буфера для часових рядів вимірів.
+
+Цей модуль забезпечує зберігання останніх N вимірів з мітками часу
+у масивах обмеженого розміру.
+"""
+
+from array import array
+from typing import Iterable, Tuple
+
+
+class RingBuffer:
+    """
+    Кільцевий буфер фіксованої ємності для часового ряду.
+
+    Зберігає значення та мітки часу у двох масивах array. Масиви зростають
+    до ємності буфера, після чого нові записи перезаписують найстаріші.
+    """
+
+    def __init__(self, capacity: int, typecode: str = 'd') -> None:
+        """
+        Ініціалізація порожнього буфера.
+
+        Параметри:
+            capacity: Максимальна кількість записів у буфері
+            typecode: Код типу значень для array (за замовчуванням: 'd')
+        """
+        if capacity <= 0:
+            raise ValueError("Ємність буфера має бути додатною")
+        self.capacity = capacity
+        self.typecode = typecode
+        self._values = array(typecode)
+        self._timestamps = array('d')
+        self._head = 0
+
+    def append(self, timestamp: float, value) -> None:
+        """
+        Додавання одного запису до буфера.
+
+        Параметри:
+            timestamp: Мітка часу запису (секунди Unix)
+            value: Значення запису
+        """
+        if len(self._values) < self.capacity:
+            self._values.append(value)
+            self._timestamps.append(timestamp)
+        else:
+            self._values[self._head] = value
+            self._timestamps[self._head] = timestamp
+        self._head = (self._head + 1) % self.capacity
+
+    def extend(self, timestamps: Iterable[float], values: Iterable) -> None:
+        """
+        Додавання пакета записів до буфера.
+
+        Параметри:
+            timestamps: Мітки часу записів
+            values: Значення записів
+        """
+        timestamps = array('d', timestamps)
+        values = array(self.typecode, values)
+        count = len(values)
+        if count != len(timestamps):
+            raise ValueError("Кількість значень і міток часу не збігається")
+
+        room = self.capacity - len(self._values)
+        if room > 0:
+            # Буфер ще не заповнено: дописати записи в кінець масивів
+            self._values.extend(values[:room])
+            self._timestamps.extend(timestamps[:room])
+            values = values[room:]
+            timestamps = timestamps[room:]
+            count = len(values)
+            self._head = len(self._values) % self.capacity
+            if not count:
+                return
+        if count >= self.capacity:
+            # Зберігаються лише останні capacity записів пакета
+            self._values[:] = values[count - self.capacity:]
+            self._timestamps[:] = timestamps[count - self.capacity:]
+            self._head = 0
+            return
+
+        first = min(count, self.capacity - self._head)
+        self._values[self._head:self._head + first] = values[:first]
+        self._timestamps[self._head:self._head + first] = timestamps[:first]
+        rest = count - first
+        if rest:
+            self._values[:rest] = values[first:]
+            self._timestamps[:rest] = timestamps[first:]
+        self._head = (self._head + count) % self.capacity
+
+    def to_arrays(self) -> Tuple[array, array]:
+        """
+        Отримання записів буфера у хронологічному порядку.
+
+        Повертає:
+            Кортеж (мітки часу, значення) у вигляді масивів array
+        """
+        if len(self._values) < self.capacity:
+            return self._timestamps[:], self._values[:]
+        return (self._timestamps[self._head:] + self._timestamps[:self._head],
+                self._values[self._head:] + self._values[:self._head])
+
+    def __len__(self) -> int:
+        """
+        Отримання кількості записів у буфері.
+
+        Повертає:
+            Кількість збережених записів
+        """
+        return len(self._values)
@@ -5,8 +5,24 @@
 температури та якості води.
 """
 
+import operator
 import random
-from typing import Optional
+import sys
+import time
+from array import array
+from itertools import repeat
+from typing import Dict, Iterable, Optional, Tuple
+from ring_buffer import RingBuffer
+from logging_config import get_logger
+
+logger = get_logger("sensor")
+
+
+# Рівні якості води; індекс у кортежі використовується як код якості
+QUALITY_LEVELS = ('Відмінна', 'Хороша', 'Задовільна')
+
+# Можливі значення температури води з точністю 0.1°C (від 5.0 до 25.0)
+TEMPERATURE_STEPS = tuple(round(5 + step / 10, 1) for step in range(201))
 
 
 class Sensor:
@@ -17,18 +33,24 @@ class Sensor:
     з деякою варіативністю.
     """
 
-    def __init__(self, sensor_id: str, location: str) -> None:
+    def __init__(self, sensor_id: str, location: str,
+                 history_size: int = 3600, seed: Optional[int] = None) -> None:
         """
         Ініціалізація датчика.
         
         Параметри:
             sensor_id: Унікальний ідентифікатор датчика
             location: Місцезнаходження датчика (назва водойми/ділянки)
+            history_size: Кількість останніх вимірів, що зберігаються в історії
+            seed: Початкове значення генератора випадкових чисел (опціонально)
         """
         self.sensor_id = sensor_id
         self.location = location
         self.last_temperature: Optional[float] = None
         self.last_quality: Optional[str] = None
+        self._rng = random.Random(seed)
+        self.temperature_history = RingBuffer(history_size, 'd')
+        self.quality_history = RingBuffer(history_size, 'B')
 
     def measure_temperature(self) -> float:
         """
@@ -38,9 +60,11 @@ class Sensor:
             Температура води у градусах Цельсія (від 5 до 25 градусів)
         """
         # Імітація вимірювання температури з варіативністю
-        temperature = round(random.uniform(5, 25), 1)
+        temperature = round(self._rng.uniform(5, 25), 1)
         self.last_temperature = temperature
-        print(f"[Sensor {self.sensor_id}] Температура води в місцезнаходженні '{self.location}': {temperature}°C")
+        self.temperature_history.append(time.time(), temperature)
+        logger.info("[Sensor %s] Температура води в місцезнаходженні '%s': %s°C",
+                    self.sensor_id, self.location, temperature)
         return temperature
 
     def measure_water_quality(self) -> str:
@@ -51,12 +75,120 @@ class Sensor:
             Оцінка якості води: 'Відмінна', 'Хороша' або 'Задовільна'
         """
         # Імітація вимірювання якості води
-        quality_options = ['Відмінна', 'Хороша', 'Задовільна']
-        quality = random.choice(quality_options)
+        code = self._rng.randrange(len(QUALITY_LEVELS))
+        quality = QUALITY_LEVELS[code]
         self.last_quality = quality
-        print(f"[Sensor {self.sensor_id}] Якість води в місцезнаходженні '{self.location}': {quality}")
+        self.quality_history.append(time.time(), code)
+        logger.info("[Sensor %s] Якість води в місцезнаходженні '%s': %s",
+                    self.sensor_id, self.location, quality)
         return quality
 
+    def _random_codes(self, levels: int, count: int) -> Iterable[int]:
+        """
+        Пакетна генерація випадкових цілих чисел від 0 до levels - 1.
+        
+        Усі випадкові біти пакета отримуються одним викликом getrandbits,
+        а остача від ділення обчислюється через map без циклу Python
+        (зміщення розподілу для 32-бітних чисел нехтовно мале).
+        
+        Параметри:
+            levels: Кількість можливих значень
+            count: Кількість чисел
+            
+        Повертає:
+            Ітератор випадкових чисел
+        """
+        words = array('I')
+        if count:
+            words.frombytes(self._rng.getrandbits(8 * words.itemsize * count)
+                            .to_bytes(words.itemsize * count, sys.byteorder))
+        return map(operator.mod, words, repeat(levels, count))
+
+    def sample_temperatures(self, count: int, interval: float = 1.0,
+                            start_time: Optional[float] = None) -> array:
+        """
+        Пакетне вимірювання температури води без виводу в консоль.
+        
+        Значення генеруються для всього пакета одразу (див. _random_codes)
+        з тим самим кроком 0.1°C, що й у measure_temperature.
+        
+        Параметри:
+            count: Кількість вимірів
+            interval: Інтервал між вимірами у секундах
+            start_time: Мітка часу першого виміру (за замовчуванням: поточний час)
+            
+        Повертає:
+            Масив array('d') температур у градусах Цельсія
+        """
+        temperatures = array('d', map(TEMPERATURE_STEPS.__getitem__,
+                                      self._random_codes(len(TEMPERATURE_STEPS), count)))
+        if count:
+            self.last_temperature = temperatures[-1]
+            self.temperature_history.extend(
+                self._timestamps(count, interval, start_time), temperatures)
+        return temperatures
+
+    def sample_water_quality(self, count: int, interval: float = 1.0,
+                             start_time: Optional[float] = None) -> array:
+        """
+        Пакетне вимірювання якості води без виводу в консоль.
+        
+        Коди якості генеруються для всього пакета одразу (див. _random_codes).
+        
+        Параметри:
+            count: Кількість вимірів
+            interval: Інтервал між вимірами у секундах
+            start_time: Мітка часу першого виміру (за замовчуванням: поточний час)
+            
+        Повертає:
+            Масив array('B') кодів якості (індекси у QUALITY_LEVELS)
+        """
+        codes = array('B', self._random_codes(len(QUALITY_LEVELS), count))
+        if count:
+            self.last_quality = QUALITY_LEVELS[codes[-1]]
+            self.quality_history.extend(
+                self._timestamps(count, interval, start_time), codes)
+        return codes
+
+    @staticmethod
+    def _timestamps(count: int, interval: float, start_time: Optional[float]) -> array:
+        """
+        Побудова міток часу для пакета вимірів.
+        
+        Параметри:
+            count: Кількість вимірів
+            interval: Інтервал між вимірами у секундах
+            start_time: Мітка часу першого виміру (None - поточний час)
+            
+        Повертає:
+            Масив array('d') міток часу
+        """
+        start = time.time() if start_time is None else start_time
+        return array('d', map(operator.add, repeat(start, count),
+                              map(operator.mul, range(count), repeat(interval, count))))
+
+    @staticmethod
+    def sample_many(sensors: Iterable['Sensor'], count: int = 1, interval: float = 1.0,
+                    start_time: Optional[float] = None) -> Dict[str, Tuple[array, array]]:
+        """
+        Пакетне вимірювання температури та якості води для групи датчиків.
+        
+        Параметри:
+            sensors: Датчики для вимірювання
+            count: Кількість вимірів на кожен датчик
+            interval: Інтервал між вимірами у секундах
+            start_time: Мітка часу першого виміру (за замовчуванням: поточний час)
+            
+        Повертає:
+            Словник {ідентифікатор датчика: (температури, коди якості)}
+        """
+        start = time.time() if start_time is None else start_time
+        return {
+            sensor.sensor_id: (sensor.sample_temperatures(count, interval, start),
+                               sensor.sample_water_quality(count, interval, start))
+            for sensor in sensors
+        }
+
     def get_sensor_data(self) -> dict:
         """
         Отримання останніх вимірів датчика.
@@ -0,0 +1,335 @@
+"""
+Модуль для зберігання часових рядів вимірів датчиків.
+
+Цей модуль забезпечує додавання вимірів датчиків у SQLite базу даних
+пакетами, вибірку за діапазоном часу та попередньо обчислені агрегати
+(мінімум, максимум, середнє) за хвилину та годину.
+"""
+
+import math
+import sqlite3
+from typing import Dict, Iterable, List, Optional, Tuple, TYPE_CHECKING
+from connection_pool import ConnectionPool
+from logging_config import get_logger
+
+if TYPE_CHECKING:
+    from sensor import Sensor
+
+logger = get_logger("sensor_reading_store")
+
+
+# Роздільності агрегатів у секундах
+ROLLUP_RESOLUTIONS: Dict[str, int] = {
+    'minute': 60,
+    'hour': 3600,
+}
+
+
+class SensorReadingStore:
+    """
+    Сховище вимірів датчиків у SQLite базі даних.
+
+    Сирі виміри тільки додаються в таблицю sensor_readings. Під час кожного
+    додавання оновлюються агрегати в таблиці sensor_rollups, тому статистика
+    за довгі періоди обчислюється без перегляду всіх сирих вимірів.
+    """
+
+    def __init__(self, db_path: str = "sensors.db") -> None:
+        """
+        Ініціалізація сховища вимірів.
+
+        Параметри:
+            db_path: Шлях до файлу SQLite бази даних (за замовчуванням: sensors.db)
+        """
+        self.db_path = db_path
+        self._pool = ConnectionPool(db_path)
+        self._initialize_database()
+
+    def _initialize_database(self) -> None:
+        """
+        Створення таблиць вимірів та агрегатів, якщо їх немає.
+        """
+        try:
+            with self._pool.transaction() as connection:
+                connection.execute("""
+                    CREATE TABLE IF NOT EXISTS sensor_readings (
+                        sensor_id TEXT NOT NULL,
+                        metric TEXT NOT NULL,
+                        timestamp REAL NOT NULL,
+                        value REAL NOT NULL
+                    )
+                """)
+                connection.execute("""
+                    CREATE INDEX IF NOT EXISTS idx_sensor_readings_sensor_timestamp
+                    ON sensor_readings (sensor_id, metric, timestamp)
+                """)
+                connection.execute("""
+                    CREATE TABLE IF NOT EXISTS sensor_rollups (
+                        sensor_id TEXT NOT NULL,
+                        metric TEXT NOT NULL,
+                        resolution INTEGER NOT NULL,
+                        bucket_start REAL NOT NULL,
+                        count INTEGER NOT NULL,
+                        min_value REAL NOT NULL,
+                        max_value REAL NOT NULL,
+                        sum_value REAL NOT NULL,
+                        PRIMARY KEY (sensor_id, metric, resolution, bucket_start)
+                    ) WITHOUT ROWID
+                """)
+            logger.info("[Database] Таблицю 'sensor_readings' успішно ініціалізовано")
+        except sqlite3.Error as e:
+            logger.error("[Database Error] Помилка при ініціалізації бази даних: %s", e)
+
+    def append_readings(self, sensor_id: str, metric: str,
+                        timestamps: Iterable[float], values: Iterable[float]) -> int:
+        """
+        Пакетне додавання вимірів одного датчика в одній транзакції.
+
+        Параметри:
+            sensor_id: Ідентифікатор датчика
+            metric: Назва показника ('temperature' або 'quality')
+            timestamps: Мітки часу вимірів (секунди Unix)
+            values: Значення вимірів
+
+        Повертає:
+            Кількість доданих вимірів
+        """
+        rows = [(sensor_id, metric, float(timestamp), float(value))
+                for timestamp, value in zip(timestamps, values)]
+        if not rows:
+            return 0
+
+        # Агрегати пакета за кожною роздільністю: {(роздільність, початок): [count, min, max, sum]}
+        buckets: Dict[Tuple[int, float], List[float]] = {}
+        for _, _, timestamp, value in rows:
+            for resolution in ROLLUP_RESOLUTIONS.values():
+                key = (resolution, math.floor(timestamp / resolution) * resolution)
+                bucket = buckets.get(key)
+                if bucket is None:
+                    buckets[key] = [1, value, value, value]
+                else:
+                    bucket[0] += 1
+                    bucket[1] = min(bucket[1], value)
+                    bucket[2] = max(bucket[2], value)
+                    bucket[3] += value
+
+        try:
+            with self._pool.transaction() as connection:
+                connection.executemany("""
+                    INSERT INTO sensor_readings (sensor_id, metric, timestamp, value)
+                    VALUES (?, ?, ?, ?)
+                """, rows)
+                connection.executemany("""
+                    INSERT INTO sensor_rollups
+                        (sensor_id, metric, resolution, bucket_start,
+                         count, min_value, max_value, sum_value)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                    ON CONFLICT (sensor_id, metric, resolution, bucket_start) DO UPDATE SET
+                        count = count + excluded.count,
+                        min_value = MIN(min_value, excluded.min_value),
+                        max_value = MAX(max_value, excluded.max_value),
+                        sum_value = sum_value + excluded.sum_value
+                """, [(sensor_id, metric, resolution, bucket_start, *aggregate)
+                      for (resolution, bucket_start), aggregate in buckets.items()])
+            return len(rows)
+        except sqlite3.Error as e:
+            logger.error("[Database Error] Помилка при збереженні вимірів: %s", e)
+            return 0
+
+    def save_sensor_history(self, sensor: 'Sensor') -> int:
+        """
+        Збереження нових вимірів з історії датчика.
+
+        Зберігаються лише виміри, новіші за останній збережений вимір
+        відповідного показника.
+
+        Параметри:
+            sensor: Датчик, історію якого потрібно зберегти
+
+        Повертає:
+            Кількість доданих вимірів
+        """
+        saved = 0
+        for metric, history in (('temperature', sensor.temperature_history),
+                                ('quality', sensor.quality_history)):
+            timestamps, values = history.to_arrays()
+            last_timestamp = self.get_last_timestamp(sensor.sensor_id, metric)
+            if last_timestamp is not None:
+                start = next((i for i, timestamp in enumerate(timestamps)
+                              if timestamp > last_timestamp), len(timestamps))
+                timestamps, values = timestamps[start:], values[start:]
+            saved += self.append_readings(sensor.sensor_id, metric, timestamps, values)
+        return saved
+
+    def get_last_timestamp(self, sensor_id: str, metric: str) -> Optional[float]:
+        """
+        Отримання мітки часу останнього збереженого виміру.
+
+        Параметри:
+            sensor_id: Ідентифікатор датчика
+            metric: Назва показника
+
+        Повертає:
+            Мітка часу або None, якщо вимірів немає
+        """
+        try:
+            connection = self._pool.get_connection()
+            result = connection.execute("""
+                SELECT MAX(timestamp) FROM sensor_readings
+                WHERE sensor_id = ? AND metric = ?
+            """, (sensor_id, metric)).fetchone()
+            return result[0]
+        except sqlite3.Error as e:
+            logger.error("[Database Error] Помилка при читанні даних: %s", e)
+            return None
+
+    def get_readings(self, sensor_id: str, metric: str,
+                     start_time: float, end_time: float) -> List[Tuple[float, float]]:
+        """
+        Отримання сирих вимірів за діапазоном часу.
+
+        Параметри:
+            sensor_id: Ідентифікатор датчика
+            metric: Назва показника
+            start_time: Початок періоду, включно (секунди Unix)
+            end_time: Кінець періоду, не включно (секунди Unix)
+
+        Повертає:
+            Список кортежів (мітка часу, значення) у хронологічному порядку
+        """
+        try:
+            connection = self._pool.get_connection()
+            rows = connection.execute("""
+                SELECT timestamp, value FROM sensor_readings
+                WHERE sensor_id = ? AND metric = ? AND timestamp >= ? AND timestamp < ?
+                ORDER BY timestamp
+            """, (sensor_id, metric, start_time, end_time)).fetchall()
+            return [(row[0], row[1]) for row in rows]
+        except sqlite3.Error as e:
+            logger.error("[Database Error] Помилка при читанні даних: %s", e)
+            return []
+
+    def get_rollups(self, sensor_id: str, metric: str, resolution: str,
+                    start_time: float, end_time: float) -> List[dict]:
+        """
+        Отримання агрегатів за хвилину або годину за діапазоном часу.
+
+        Параметри:
+            sensor_id: Ідентифікатор датчика
+            metric: Назва показника
+            resolution: Роздільність агрегатів ('minute' або 'hour')
+            start_time: Початок періоду, включно (секунди Unix)
+            end_time: Кінець періоду, не включно (секунди Unix)
+
+        Повертає:
+            Список словників з початком інтервалу, кількістю, мінімумом,
+            максимумом та середнім значенням
+        """
+        try:
+            connection = self._pool.get_connection()
+            rows = connection.execute("""
+                SELECT bucket_start, count, min_value, max_value, sum_value
+                FROM sensor_rollups
+                WHERE sensor_id = ? AND metric = ? AND resolution = ?
+                  AND bucket_start >= ? AND bucket_start < ?
+                ORDER BY bucket_start
+            """, (sensor_id, metric, ROLLUP_RESOLUTIONS[resolution],
+                  start_time, end_time)).fetchall()
+            return [{
+                'bucket_start': row[0],
+                'count': row[1],
+                'min': row[2],
+                'max': row[3],
+                'mean': row[4] / row[1]
+            } for row in rows]
+        except sqlite3.Error as e:
+            logger.error("[Database Error] Помилка при читанні даних: %s", e)
+            return []
+
+    def get_window_stats(self, sensor_id: str, metric: str,
+                         start_time: float, end_time: float) -> dict:
+        """
+        Обчислення статистики показника за довільний період.
+
+        Повні години беруться з годинних агрегатів, повні хвилини на краях
+        періоду - з хвилинних, і лише неповні хвилини - із сирих вимірів.
+
+        Параметри:
+            sensor_id: Ідентифікатор датчика
+            metric: Назва показника
+            start_time: Початок періоду, включно (секунди Unix)
+            end_time: Кінець періоду, не включно (секунди Unix)
+
+        Повертає:
+            Словник з кількістю, мінімумом, максимумом та середнім значенням
+        """
+        resolutions = sorted(ROLLUP_RESOLUTIONS.values(), reverse=True)
+        try:
+            connection = self._pool.get_connection()
+            parts = self._collect_window(connection, sensor_id, metric,
+                                         resolutions, start_time, end_time)
+        except sqlite3.Error as e:
+            logger.error("[Database Error] Помилка при отриманні статистики: %s", e)
+            parts = []
+
+        parts = [part for part in parts if part[0]]
+        count = sum(part[0] for part in parts)
+        if not count:
+            return {'count': 0, 'min': None, 'max': None, 'mean': None}
+        return {
+            'count': count,
+            'min': min(part[1] for part in parts),
+            'max': max(part[2] for part in parts),
+            'mean': sum(part[3] for part in parts) / count
+        }
+
+    def _collect_window(self, connection: sqlite3.Connection, sensor_id: str, metric: str,
+                        resolutions: List[int], start_time: float,
+                        end_time: float) -> List[tuple]:
+        """
+        Збір агрегатів (count, min, max, sum) для частин періоду.
+
+        Параметри:
+            connection: З'єднання з базою даних
+            sensor_id: Ідентифікатор датчика
+            metric: Назва показника
+            resolutions: Роздільності агрегатів від найгрубшої до найдрібнішої
+            start_time: Початок періоду, включно
+            end_time: Кінець періоду, не включно
+
+        Повертає:
+            Список кортежів (count, min, max, sum)
+        """
+        if start_time >= end_time:
+            return []
+        if not resolutions:
+            return [connection.execute("""
+                SELECT COUNT(*), MIN(value), MAX(value), SUM(value)
+                FROM sensor_readings
+                WHERE sensor_id = ? AND metric = ? AND timestamp >= ? AND timestamp < ?
+            """, (sensor_id, metric, start_time, end_time)).fetchone()]
+
+        resolution, finer = resolutions[0], resolutions[1:]
+        first_bucket = math.ceil(start_time / resolution) * resolution
+        last_bucket = math.floor(end_time / resolution) * resolution
+        if first_bucket >= last_bucket:
+            return self._collect_window(connection, sensor_id, metric,
+                                        finer, start_time, end_time)
+
+        parts = [connection.execute("""
+            SELECT SUM(count), MIN(min_value), MAX(max_value), SUM(sum_value)
+            FROM sensor_rollups
+            WHERE sensor_id = ? AND metric = ? AND resolution = ?
+              AND bucket_start >= ? AND bucket_start < ?
+        """, (sensor_id, metric, resolution, first_bucket, last_bucket)).fetchone()]
+        parts += self._collect_window(connection, sensor_id, metric,
+                                      finer, start_time, first_bucket)
+        parts += self._collect_window(connection, sensor_id, metric,
+                                      finer, last_bucket, end_time)
+        return parts
+
+    def close(self) -> None:
+        """
+        Закриття всіх з'єднань сховища з базою даних.
+        """
+        self._pool.close()
@@ -0,0 +1,619 @@
+"""
+Модуль шардованого сервісу журналу виловів.
+
+Цей модуль розподіляє записи виловів між кількома файлами SQLite
+за хешем імені рибалки, тому записи різних рибалок не конкурують за
+одне блокування бази даних. Читання та зведення по всіх рибалках
+виконуються паралельно в усіх шардах, а результати об'єднуються.
+Інтерфейс збігається з CatchLogService.
+"""
+
+import heapq
+import os
+import queue
+import zlib
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from catch_log_service import CatchLogService
+from logging_config import get_logger
+
+logger = get_logger("sharded_catch_log_service")
+
+# Позначка в черзі завантаження шарда: відкотити завантаження
+_ABORT_IMPORT = object()
+
+
+class _ImportAborted(Exception):
+    """
+    Завантаження перервано через помилку в записах іншого шарда.
+    """
+
+
+def shard_paths(db_path: str, shard_count: int) -> List[str]:
+    """
+    Побудова шляхів до файлів шардів.
+
+    Параметри:
+        db_path: Базовий шлях до бази даних (наприклад, fishing.db)
+        shard_count: Кількість шардів
+
+    Повертає:
+        Список шляхів виду fishing_0.db, fishing_1.db, ...
+    """
+    root, extension = os.path.splitext(db_path)
+    return [f"{root}_{index}{extension}" for index in range(shard_count)]
+
+
+class ShardedCatchLogService:
+    """
+    Сервіс журналу виловів, розподілений між кількома базами даних SQLite.
+
+    Усі вилови та експедиції одного рибалки зберігаються в одному шарді,
+    тому запити по конкретному рибалці звертаються лише до нього.
+    Ідентифікатори записів виловів унікальні лише в межах шарда, а
+    ідентифікатори експедицій містять номер шарда (local_id * N + shard).
+    Вилов з експедицією з іншого шарда зберігається без експедиції.
+    Для експорту ідентифікатори виловів кодуються так само.
+    """
+
+    def __init__(self, db_path: str = "fishing.db", shard_count: int = 4) -> None:
+        """
+        Ініціалізація шардованого сервісу.
+
+        Параметри:
+            db_path: Базовий шлях до бази даних; шарди зберігаються поруч
+            shard_count: Кількість шардів
+        """
+        if shard_count < 1:
+            raise ValueError("Кількість шардів має бути не меншою за 1")
+        self.db_path = db_path
+        self.shards = [CatchLogService(path) for path in shard_paths(db_path, shard_count)]
+        self._executor = ThreadPoolExecutor(max_workers=shard_count,
+                                            thread_name_prefix="catch-shard")
+
+    def shard_index(self, fisherman_name: str) -> int:
+        """
+        Визначення шарда для рибалки.
+
+        Використовується CRC32 замість hash(), щоб розподіл не залежав
+        від PYTHONHASHSEED і був однаковим між запусками.
+
+        Параметри:
+            fisherman_name: Ім'я рибалки
+
+        Повертає:
+            Номер шарда
+        """
+        return zlib.crc32(fisherman_name.encode("utf-8")) % len(self.shards)
+
+    def _shard_for(self, fisherman_name: str) -> CatchLogService:
+        """
+        Отримання сервісу шарда для рибалки.
+
+        Параметри:
+            fisherman_name: Ім'я рибалки
+
+        Повертає:
+            Сервіс журналу виловів шарда
+        """
+        return self.shards[self.shard_index(fisherman_name)]
+
+    def _fan_out(self, call: Callable[[CatchLogService], object]) -> list:
+        """
+        Паралельне виконання виклику в усіх шардах.
+
+        Параметри:
+            call: Функція, що приймає сервіс шарда
+
+        Повертає:
+            Список результатів у порядку шардів
+        """
+        if len(self.shards) == 1:
+            return [call(self.shards[0])]
+        return list(self._executor.map(call, self.shards))
+
+    def _global_trip_id(self, shard_index: int, trip_id: Optional[int]) -> Optional[int]:
+        """
+        Перетворення ідентифікатора експедиції шарда на глобальний.
+
+        Параметри:
+            shard_index: Номер шарда
+            trip_id: Ідентифікатор експедиції в шарді
+
+        Повертає:
+            Глобальний ідентифікатор експедиції або None
+        """
+        return None if trip_id is None else trip_id * len(self.shards) + shard_index
+
+    def _local_trip_id(self, shard_index: int, trip_id: Optional[int]) -> Optional[int]:
+        """
+        Перетворення глобального ідентифікатора експедиції на ідентифікатор у шарді.
+
+        Параметри:
+            shard_index: Номер шарда, у якому зберігається запис
+            trip_id: Глобальний ідентифікатор експедиції
+
+        Повертає:
+            Ідентифікатор експедиції в шарді або None
+        """
+        if trip_id is None:
+            return None
+        if trip_id % len(self.shards) != shard_index:
+            raise ValueError(f"Експедиція {trip_id} зберігається в шарді "
+                             f"{trip_id % len(self.shards)}, а не в шарді {shard_index}")
+        return trip_id // len(self.shards)
+
+    def _catch_trip_id(self, shard_index: int, trip_id: Optional[int]) -> Optional[int]:
+        """
+        Ідентифікатор експедиції в шарді рибалки для запису вилову.
+
+        Вилов з експедицією з іншого шарда зберігається без експедиції,
+        щоб не втратити сам вилов.
+
+        Параметри:
+            shard_index: Номер шарда рибалки
+            trip_id: Глобальний ідентифікатор експедиції
+
+        Повертає:
+            Ідентифікатор експедиції в шарді або None
+        """
+        try:
+            return self._local_trip_id(shard_index, trip_id)
+        except ValueError as e:
+            logger.error("[ShardedCatchLogService] Вилов збережено без експедиції: %s", e)
+            return None
+
+    def _with_global_trip_ids(self, shard_index: int, rows: Iterable[dict]) -> Iterator[dict]:
+        """
+        Заміна ідентифікаторів експедицій у записах шарда на глобальні.
+
+        Параметри:
+            shard_index: Номер шарда
+            rows: Записи виловів шарда
+
+        Повертає:
+            Генератор записів з глобальними ідентифікаторами експедицій
+        """
+        for row in rows:
+            row['trip_id'] = self._global_trip_id(shard_index, row.get('trip_id'))
+            yield row
+
+    def save_catch(self, fisherman_name: str, fish_species: str, weight: float,
+                   trip_id: Optional[int] = None, spot: Optional[str] = None) -> None:
+        """
+        Збереження запису про вилов у шард рибалки.
+
+        Параметри:
+            fisherman_name: Ім'я рибалки
+            fish_species: Вид риби
+            weight: Вага риби у кілограмах
+            trip_id: Глобальний ідентифікатор експедиції (опціонально; експедиція
+                з іншого шарда не зберігається)
+            spot: Точка кльову, де виловлено рибу (опціонально)
+        """
+        index = self.shard_index(fisherman_name)
+        self.shards[index].save_catch(fisherman_name, fish_species, weight,
+                                      self._catch_trip_id(index, trip_id), spot)
+
+    def save_catches_bulk(self, catches: Iterable[tuple]) -> int:
+        """
+        Пакетне збереження записів виловів, згрупованих за шардами.
+
+        Кожен шард записує свою частину в окремій транзакції паралельно
+        з іншими шардами.
+
+        Параметри:
+            catches: Послідовність кортежів (ім'я рибалки, вид риби, вага),
+                які можуть бути доповнені ідентифікатором експедиції та точкою кльову
+
+        Повертає:
+            Кількість збережених записів
+        """
+        groups: Dict[int, List[tuple]] = defaultdict(list)
+        for catch in catches:
+            index = self.shard_index(catch[0])
+            if len(catch) > 3:
+                catch = (*catch[:3], self._catch_trip_id(index, catch[3]), *catch[4:])
+            groups[index].append(catch)
+        if not groups:
+            return 0
+        if len(groups) == 1:
+            (index, rows), = groups.items()
+            return self.shards[index].save_catches_bulk(rows)
+        futures = [self._executor.submit(self.shards[index].save_catches_bulk, rows)
+                   for index, rows in groups.items()]
+        return sum(future.result() for future in futures)
+
+    def save_journal_batch(self, journal: str, seq: int,
+                           entries: Iterable[Tuple[int, tuple]]) -> bool:
+        """
+        Збереження пакета виловів з журналу попереднього запису в шарди.
+
+        Кожен шард зберігає свою частину пакета разом з власною позначкою
+        журналу, а позначка оновлюється в усіх шардах, навіть без записів.
+        Якщо частина шардів не зберегла пакет, повтор пакета не дублює
+        записи в інших шардах: вони пропускають уже збережені номери.
+        Вилов з експедицією з іншого шарда зберігається без експедиції.
+
+        Параметри:
+            journal: Ідентифікатор журналу
+            seq: Номер останнього запису журналу в пакеті
+            entries: Пари (номер запису, кортеж (ім'я рибалки, вид риби, вага,
+                глобальний ідентифікатор експедиції, точка кльову))
+
+        Повертає:
+            True, якщо пакет збережено в усіх шардах, інакше False
+        """
+        groups: Dict[str, List[Tuple[int, tuple]]] = {shard.db_path: [] for shard in self.shards}
+        for entry_seq, catch in entries:
+            index = self.shard_index(catch[0])
+            if len(catch) > 3:
+                catch = (*catch[:3], self._catch_trip_id(index, catch[3]), *catch[4:])
+            groups[self.shards[index].db_path].append((entry_seq, catch))
+        return all(self._fan_out(
+            lambda shard: shard.save_journal_batch(journal, seq, groups[shard.db_path])))
+
+    def get_journal_checkpoint(self, journal: str) -> int:
+        """
+        Отримання номера запису журналу, до якого включно всі шарди
+        зберегли вилови.
+
+        Параметри:
+            journal: Ідентифікатор журналу
+
+        Повертає:
+            Найменша з позначок журналу в шардах (0, якщо нічого не збережено)
+        """
+        return min(self._fan_out(lambda shard: shard.get_journal_checkpoint(journal)))
+
+    def get_all_catches(self, fisherman_name: str = None) -> List[dict]:
+        """
+        Отримання всіх записів виловів.
+
+        Параметри:
+            fisherman_name: Фільтр за іменем рибалки (опціонально)
+
+        Повертає:
+            Список словників з інформацією про виловів, від найновіших
+        """
+        if fisherman_name:
+            index = self.shard_index(fisherman_name)
+            return list(self._with_global_trip_ids(
+                index, self.shards[index].get_all_catches(fisherman_name)))
+        results = self._fan_out(lambda shard: shard.get_all_catches())
+        streams = [self._with_global_trip_ids(index, rows) for index, rows in enumerate(results)]
+        return list(heapq.merge(*streams, key=lambda row: row['timestamp'] or '', reverse=True))
+
+    def iter_catches(self, fisherman_name: Optional[str] = None,
+                     fish_species: Optional[str] = None,
+                     start_time: Optional[str] = None,
+                     end_time: Optional[str] = None,
+                     fetch_size: int = 500) -> Iterator[dict]:
+        """
+        Потокове читання записів виловів з об'єднанням шардів.
+
+        Параметри:
+            fisherman_name: Фільтр за іменем рибалки (опціонально)
+            fish_species: Фільтр за видом риби (опціонально)
+            start_time: Початок періоду, включно (опціонально)
+            end_time: Кінець періоду, не включно (опціонально)
+            fetch_size: Кількість записів, що вибираються з шарда за один запит
+
+        Повертає:
+            Генератор словників з інформацією про виловів, від найновіших
+        """
+        if fisherman_name:
+            index = self.shard_index(fisherman_name)
+            return self._with_global_trip_ids(index, self.shards[index].iter_catches(
+                fisherman_name, fish_species, start_time, end_time, fetch_size))
+        streams = [self._with_global_trip_ids(index, shard.iter_catches(
+                       None, fish_species, start_time, end_time, fetch_size))
+                   for index, shard in enumerate(self.shards)]
+        return heapq.merge(*streams, key=lambda row: row['timestamp'] or '', reverse=True)
+
+    def get_catch_summary(self, fisherman_name: str) -> dict:
+        """
+        Отримання зведеної інформації про виловів рибалки з його шарда.
+
+        Параметри:
+            fisherman_name: Ім'я рибалки
+
+        Повертає:
+            Словник з кількістю та загальною вагою виловів
+        """
+        return self._shard_for(fisherman_name).get_catch_summary(fisherman_name)
+
+    def start_trip(self, fisherman_name: str, location: str,
+                   depth_map: Optional[str] = None) -> Optional[int]:
+        """
+        Збереження початку експедиції у шарді рибалки.
+
+        Параметри:
+            fisherman_name: Ім'я рибалки-організатора
+            location: Назва водойми/місцезнаходження
+            depth_map: Інформація про карту глибин (опціонально)
+
+        Повертає:
+            Глобальний ідентифікатор експедиції або None у разі помилки
+        """
+        index = self.shard_index(fisherman_name)
+        trip_id = self.shards[index].start_trip(fisherman_name, location, depth_map)
+        return self._global_trip_id(index, trip_id)
+
+    def end_trip(self, trip_id: int) -> None:
+        """
+        Збереження завершення експедиції.
+
+        Параметри:
+            trip_id: Глобальний ідентифікатор експедиції
+        """
+        index = trip_id % len(self.shards)
+        self.shards[index].end_trip(self._local_trip_id(index, trip_id))
+
+    def get_trip_stats(self, trip_id: int) -> Optional[dict]:
+        """
+        Отримання статистики однієї експедиції.
+
+        Параметри:
+            trip_id: Глобальний ідентифікатор експедиції
+
+        Повертає:
+            Словник зі статистикою експедиції або None
+        """
+        index = trip_id % len(self.shards)
+        stats = self.shards[index].get_trip_stats(self._local_trip_id(index, trip_id))
+        if stats is not None:
+            stats['trip_id'] = trip_id
+        return stats
+
+    def get_trips(self, fisherman_name: str) -> List[dict]:
+        """
+        Отримання всіх експедицій рибалки зі статистикою.
+
+        Параметри:
+            fisherman_name: Ім'я рибалки
+
+        Повертає:
+            Список словників зі статистикою експедицій, від найновіших
+        """
+        index = self.shard_index(fisherman_name)
+        trips = self.shards[index].get_trips(fisherman_name)
+        for trip in trips:
+            trip['trip_id'] = self._global_trip_id(index, trip['trip_id'])
+        return trips
+
+    def get_species_rollup(self, period: str = 'day', fish_species: Optional[str] = None,
+                           start_day: Optional[str] = None,
+                           end_day: Optional[str] = None) -> List[dict]:
+        """
+        Отримання кількості та ваги виловів за видами риби і періодами з усіх шардів.
+
+        Параметри:
+            period: Період групування: 'day', 'week', 'month' або 'year'
+            fish_species: Фільтр за видом риби (опціонально)
+            start_day: Перший день періоду, включно (опціонально)
+            end_day: Останній день періоду, включно (опціонально)
+
+        Повертає:
+            Список словників з періодом, видом риби, кількістю та загальною вагою
+        """
+        results = self._fan_out(lambda shard: shard.get_species_rollup(
+            period, fish_species, start_day, end_day))
+        merged: Dict[Tuple[str, str], dict] = {}
+        for rows in results:
+            for row in rows:
+                key = (row['period'], row['fish_species'])
+                if key in merged:
+                    merged[key]['count'] += row['count']
+                    merged[key]['total_weight'] += row['total_weight']
+                else:
+                    merged[key] = dict(row)
+        return [merged[key] for key in sorted(merged)]
+
+    def get_top_fishermen(self, limit: int = 10, start_day: Optional[str] = None,
+                          end_day: Optional[str] = None) -> List[dict]:
+        """
+        Отримання рибалок з найбільшою загальною вагою виловів з усіх шардів.
+
+        Кожен рибалка зберігається лише в одному шарді, тому достатньо
+        об'єднати перші limit рибалок кожного шарда.
+
+        Параметри:
+            limit: Кількість рибалок у результаті
+            start_day: Перший день періоду, включно (опціонально)
+            end_day: Останній день періоду, включно (опціонально)
+
+        Повертає:
+            Список словників з іменем рибалки, кількістю та загальною вагою виловів
+        """
+        results = self._fan_out(lambda shard: shard.get_top_fishermen(limit, start_day, end_day))
+        rows = [row for shard_rows in results for row in shard_rows]
+        rows.sort(key=lambda row: (-row['total_weight'], row['fisherman_name']))
+        return rows[:limit]
+
+    def get_weight_distribution(self, fish_species: Optional[str] = None,
+                                start_day: Optional[str] = None,
+                                end_day: Optional[str] = None) -> List[dict]:
+        """
+        Отримання розподілу ваги виловів з усіх шардів.
+
+        Параметри:
+            fish_species: Фільтр за видом риби (опціонально)
+            start_day: Перший день періоду, включно (опціонально)
+            end_day: Останній день періоду, включно (опціонально)
+
+        Повертає:
+            Список словників з межами кошика ваги та кількістю виловів
+        """
+        results = self._fan_out(lambda shard: shard.get_weight_distribution(
+            fish_species, start_day, end_day))
+        merged: Dict[float, dict] = {}
+        for rows in results:
+            for row in rows:
+                if row['min_weight'] in merged:
+                    merged[row['min_weight']]['count'] += row['count']
+                else:
+                    merged[row['min_weight']] = dict(row)
+        return [merged[key] for key in sorted(merged)]
+
+    def explain_query_plan(self, query: str, params: tuple = ()) -> List[str]:
+        """
+        Отримання плану виконання запиту від планувальника SQLite.
+
+        Усі шарди мають однакову схему, тому план будується в першому шарді.
+
+        Параметри:
+            query: SQL-запит для аналізу
+            params: Параметри запиту
+
+        Повертає:
+            Список рядків з описом кроків плану виконання
+        """
+        return self.shards[0].explain_query_plan(query, params)
+
+    def iter_catch_chunks(self, chunk_size: int = 10000) -> Iterator[List[tuple]]:
+        """
+        Потокове читання всіх виловів частинами, шард за шардом.
+
+        Ідентифікатори виловів та експедицій перетворюються на глобальні.
+
+        Параметри:
+            chunk_size: Кількість записів в одній частині
+
+        Повертає:
+            Генератор списків кортежів
+            (id, fisherman_name, fish_species, weight, timestamp, trip_id, spot)
+        """
+        for index, shard in enumerate(self.shards):
+            for chunk in shard.iter_catch_chunks(chunk_size):
+                # Ідентифікатори виловів кодуються так само, як ідентифікатори експедицій
+                yield [(self._global_trip_id(index, row[0]), *row[1:5],
+                        self._global_trip_id(index, row[5]), *row[6:]) for row in chunk]
+
+    def get_all_trips(self) -> List[tuple]:
+        """
+        Отримання всіх експедицій з усіх шардів для експорту.
+
+        Повертає:
+            Список кортежів (id, fisherman_name, location, depth_map, start_time, end_time)
+            з глобальними ідентифікаторами, у порядку id
+        """
+        results = self._fan_out(lambda shard: shard.get_all_trips())
+        trips = [(self._global_trip_id(index, trip[0]), *trip[1:])
+                 for index, shard_trips in enumerate(results) for trip in shard_trips]
+        trips.sort()
+        return trips
+
+    def _import_shard(self, shard: CatchLogService, chunks: 'queue.Queue',
+                      trips: List[tuple]) -> int:
+        """
+        Завантаження частин виловів з черги в один шард.
+
+        Після помилки БД черга дочитується до кінця, щоб потік, який
+        розподіляє записи, не заблокувався.
+
+        Параметри:
+            shard: Сервіс шарда
+            chunks: Черга частин записів; None позначає кінець,
+                _ABORT_IMPORT - відкат транзакції шарда
+            trips: Експедиції шарда
+
+        Повертає:
+            Кількість завантажених записів виловів
+        """
+        def read_chunks() -> Iterator[List[tuple]]:
+            while True:
+                chunk = chunks.get()
+                if chunk is None:
+                    return
+                if chunk is _ABORT_IMPORT:
+                    raise _ImportAborted()
+                yield chunk
+
+        stream = read_chunks()
+        try:
+            imported = shard.import_catches(stream, trips)
+        except _ImportAborted:
+            return 0
+        try:
+            for _ in stream:
+                pass
+        except _ImportAborted:
+            pass
+        return imported
+
+    def import_catches(self, chunks: Iterable[Iterable[tuple]],
+                       trips: Iterable[tuple] = ()) -> int:
+        """
+        Масове завантаження експорту шардованого сховища.
+
+        Ідентифікатори в записах мають бути глобальними для тієї самої
+        кількості шардів (як у експорті з iter_catch_chunks). Кожен шард
+        завантажує свою частину в одній транзакції паралельно з іншими;
+        якщо записи не відповідають шардам, усі транзакції відкочуються
+        і викликається ValueError.
+
+        Параметри:
+            chunks: Частини записів - кортежі
+                (id, fisherman_name, fish_species, weight, timestamp[, trip_id, spot])
+            trips: Експедиції - кортежі
+                (id, fisherman_name, location, depth_map, start_time, end_time)
+
+        Повертає:
+            Кількість завантажених записів виловів
+        """
+        shard_count = len(self.shards)
+        shard_trips: List[List[tuple]] = [[] for _ in self.shards]
+        for trip in trips:
+            index = self.shard_index(trip[1])
+            shard_trips[index].append((self._local_trip_id(index, trip[0]), *trip[1:]))
+        queues = [queue.Queue(maxsize=4) for _ in self.shards]
+        futures = [self._executor.submit(self._import_shard, shard, queues[index],
+                                         shard_trips[index])
+                   for index, shard in enumerate(self.shards)]
+        end_marker = _ABORT_IMPORT
+        try:
+            for chunk in chunks:
+                groups: List[List[tuple]] = [[] for _ in self.shards]
+                for row in chunk:
+                    index = self.shard_index(row[1])
+                    if row[0] % shard_count != index:
+                        raise ValueError(f"Вилов {row[0]} не належить шарду {index}: "
+                                         "експорт створено з іншою кількістю шардів")
+                    trip_id = self._local_trip_id(index, row[5]) if len(row) > 5 else None
+                    groups[index].append((row[0] // shard_count, *row[1:5], trip_id, *row[6:]))
+                for index, rows in enumerate(groups):
+                    if rows:
+                        queues[index].put(rows)
+            end_marker = None
+        finally:
+            for shard_queue in queues:
+                shard_queue.put(end_marker)
+            imported = sum(future.result() for future in futures)
+        return imported
+
+    def close(self) -> None:
+        """
+        Закриття з'єднань усіх шардів та пулу потоків.
+        """
+        self._executor.shutdown(wait=True)
+        for shard in self.shards:
+            shard.close()
+        logger.info("[ShardedCatchLogService] Закрито %d шардів", len(self.shards))
+
+    def __enter__(self) -> 'ShardedCatchLogService':
+        """
+        Вхід у контекстний менеджер сервісу.
+
+        Повертає:
+            Поточний сервіс журналу виловів
+        """
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        """
+        Вихід з контекстного менеджера із закриттям з'єднань.
+        """
+        self.close()
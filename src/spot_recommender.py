@@ -0,0 +1,320 @@
+"""
+Модуль рекомендацій точок кльову за історією виловів.
+
+Цей модуль будує в пам'яті індекс врожайності за ключем (локація, точка
+кльову, вид риби, діапазон температури води) з виловів у базі даних та
+вимірів датчиків. Індекс оновлюється інкрементально (лише нові вилови),
+рейтинги точок кешуються до наступного оновлення локації, а знімок
+індексу зберігається на диск, щоб не перебудовувати його при запуску.
+"""
+
+import calendar
+import json
+import math
+import os
+import time
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from logging_config import get_logger
+
+logger = get_logger("spot_recommender")
+
+SNAPSHOT_VERSION = 1
+
+# Функція температури води: (локація, мітка часу вилову) -> температура або None
+TemperatureLookup = Callable[[str, str], Optional[float]]
+
+
+class SpotRecommender:
+    """
+    Індекс історичної врожайності точок кльову.
+
+    Для кожної локації зберігаються лічильники (кількість, загальна вага)
+    за ключем (точка, вид риби, діапазон температури). Точки ранжуються
+    за загальною вагою виловів, що відповідають запиту.
+    """
+
+    def __init__(self, band_width: float = 2.0) -> None:
+        """
+        Ініціалізація порожнього індексу.
+
+        Параметри:
+            band_width: Ширина діапазону температури води у °C
+        """
+        self.band_width = band_width
+        self._index: Dict[str, Dict[Tuple[str, str, Optional[int]], List[float]]] = {}
+        self._rankings: Dict[Tuple[str, Optional[str], Optional[int]], List[dict]] = {}
+        self._watermarks: Dict[str, int] = {}
+
+    def temperature_band(self, temperature: Optional[float]) -> Optional[int]:
+        """
+        Визначення діапазону температури.
+
+        Параметри:
+            temperature: Температура води у °C або None
+
+        Повертає:
+            Номер діапазону або None для невідомої температури
+        """
+        if temperature is None:
+            return None
+        return math.floor(temperature / self.band_width)
+
+    def band_label(self, band: Optional[int]) -> str:
+        """
+        Текстове позначення діапазону температури.
+
+        Параметри:
+            band: Номер діапазону або None
+
+        Повертає:
+            Рядок виду '14-16°C' або 'невідомо'
+        """
+        if band is None:
+            return "невідомо"
+        return f"{band * self.band_width:g}-{(band + 1) * self.band_width:g}°C"
+
+    def add_observation(self, location: str, spot: str, fish_species: str,
+                        weight: float, temperature: Optional[float] = None) -> None:
+        """
+        Додавання одного вилову до індексу.
+
+        Параметри:
+            location: Назва водойми/місцезнаходження
+            spot: Точка кльову
+            fish_species: Вид риби
+            weight: Вага риби у кілограмах
+            temperature: Температура води під час вилову (опціонально)
+        """
+        self._add(location, spot, fish_species, weight, temperature)
+        self._invalidate(location)
+
+    def _add(self, location: str, spot: str, fish_species: str,
+             weight: float, temperature: Optional[float]) -> None:
+        """
+        Оновлення лічильників індексу без скидання кешу рейтингів.
+
+        Параметри:
+            location: Назва водойми/місцезнаходження
+            spot: Точка кльову
+            fish_species: Вид риби
+            weight: Вага риби у кілограмах
+            temperature: Температура води під час вилову або None
+        """
+        key = (spot, fish_species, self.temperature_band(temperature))
+        entries = self._index.setdefault(location, {})
+        counters = entries.get(key)
+        if counters is None:
+            entries[key] = [1, weight]
+        else:
+            counters[0] += 1
+            counters[1] += weight
+
+    def _invalidate(self, location: str) -> None:
+        """
+        Видалення кешованих рейтингів локації.
+
+        Параметри:
+            location: Назва водойми/місцезнаходження
+        """
+        if self._rankings:
+            for query in [query for query in self._rankings if query[0] == location]:
+                del self._rankings[query]
+
+    def update_from_service(self, service, temperature_lookup: Optional[TemperatureLookup] = None,
+                            chunk_size: int = 10000) -> int:
+        """
+        Інкрементальне оновлення індексу новими виловами з бази даних.
+
+        Для кожної бази даних зберігається id останнього обробленого
+        вилову, тому повторний виклик читає лише нові записи. Шардований
+        сервіс обробляється пошардово.
+
+        Параметри:
+            service: CatchLogService або ShardedCatchLogService
+            temperature_lookup: Функція температури води для вилову (опціонально)
+            chunk_size: Кількість записів, що читаються за один запит
+
+        Повертає:
+            Кількість доданих виловів
+        """
+        added = 0
+        updated_locations = set()
+        for shard in getattr(service, 'shards', [service]):
+            last_id = self._watermarks.get(shard.db_path, 0)
+            for chunk in shard.iter_spot_observations(last_id, chunk_size):
+                for _, location, spot, fish_species, weight, timestamp in chunk:
+                    temperature = (temperature_lookup(location, timestamp)
+                                   if temperature_lookup and timestamp else None)
+                    self._add(location, spot, fish_species, weight, temperature)
+                    updated_locations.add(location)
+                added += len(chunk)
+                last_id = chunk[-1][0]
+            self._watermarks[shard.db_path] = last_id
+        for location in updated_locations:
+            self._invalidate(location)
+        logger.info("[SpotRecommender] До індексу додано %d виловів", added)
+        return added
+
+    def recommend(self, location: str, fish_species: Optional[str] = None,
+                  temperature: Optional[float] = None, k: int = 3) -> List[dict]:
+        """
+        Отримання найкращих точок кльову локації.
+
+        Рейтинг для кожної комбінації (локація, вид, діапазон температури)
+        обчислюється один раз і кешується до наступного оновлення локації.
+
+        Параметри:
+            location: Назва водойми/місцезнаходження
+            fish_species: Вид риби (за замовчуванням: усі види)
+            temperature: Поточна температура води (за замовчуванням: будь-яка)
+            k: Кількість точок у результаті
+
+        Повертає:
+            Список словників з точкою, кількістю, загальною та середньою вагою
+            виловів, від найврожайнішої
+        """
+        query = (location, fish_species, self.temperature_band(temperature))
+        ranking = self._rankings.get(query)
+        if ranking is None:
+            ranking = self._rankings[query] = self._rank(*query)
+        return ranking[:k]
+
+    def _rank(self, location: str, fish_species: Optional[str],
+              band: Optional[int]) -> List[dict]:
+        """
+        Обчислення рейтингу точок локації.
+
+        Параметри:
+            location: Назва водойми/місцезнаходження
+            fish_species: Вид риби або None
+            band: Діапазон температури або None
+
+        Повертає:
+            Повний рейтинг точок
+        """
+        totals: Dict[str, List[float]] = {}
+        for (spot, species, entry_band), (count, weight) in self._index.get(location, {}).items():
+            if fish_species is not None and species != fish_species:
+                continue
+            if band is not None and entry_band != band:
+                continue
+            spot_totals = totals.setdefault(spot, [0, 0.0])
+            spot_totals[0] += count
+            spot_totals[1] += weight
+        ranking = [{
+            'spot': spot,
+            'catch_count': count,
+            'total_weight': round(weight, 3),
+            'mean_weight': round(weight / count, 3)
+        } for spot, (count, weight) in totals.items()]
+        ranking.sort(key=lambda item: (-item['total_weight'], item['spot']))
+        return ranking
+
+    def save_snapshot(self, path: str) -> None:
+        """
+        Збереження індексу у файл JSON.
+
+        Файл записується через тимчасовий файл і атомарно замінюється,
+        тому перерваний запис не пошкоджує попередній знімок.
+
+        Параметри:
+            path: Шлях до файлу знімка
+        """
+        snapshot = {
+            'version': SNAPSHOT_VERSION,
+            'band_width': self.band_width,
+            'watermarks': self._watermarks,
+            'entries': [[location, spot, species, band, count, weight]
+                        for location, entries in self._index.items()
+                        for (spot, species, band), (count, weight) in entries.items()]
+        }
+        temporary_path = f"{path}.tmp"
+        with open(temporary_path, "w", encoding="utf-8") as snapshot_file:
+            json.dump(snapshot, snapshot_file, ensure_ascii=False)
+        os.replace(temporary_path, path)
+        logger.info("[SpotRecommender] Знімок індексу збережено у '%s'", path)
+
+    @classmethod
+    def load_snapshot(cls, path: str) -> 'SpotRecommender':
+        """
+        Завантаження індексу зі знімка.
+
+        Параметри:
+            path: Шлях до файлу знімка
+
+        Повертає:
+            Індекс з даними знімка; подальші оновлення продовжуються
+            з останніх збережених виловів
+        """
+        with open(path, encoding="utf-8") as snapshot_file:
+            snapshot = json.load(snapshot_file)
+        if snapshot.get('version') != SNAPSHOT_VERSION:
+            raise ValueError(f"Непідтримувана версія знімка: {snapshot.get('version')}")
+        recommender = cls(snapshot['band_width'])
+        recommender._watermarks = dict(snapshot['watermarks'])
+        for location, spot, species, band, count, weight in snapshot['entries']:
+            recommender._index.setdefault(location, {})[(spot, species, band)] = [count, weight]
+        logger.info("[SpotRecommender] Індекс завантажено зі знімка '%s'", path)
+        return recommender
+
+    @classmethod
+    def open(cls, path: str, service, temperature_lookup: Optional[TemperatureLookup] = None,
+             band_width: float = 2.0) -> 'SpotRecommender':
+        """
+        Завантаження індексу зі знімка (якщо він є) та його оновлення.
+
+        Параметри:
+            path: Шлях до файлу знімка
+            service: CatchLogService або ShardedCatchLogService
+            temperature_lookup: Функція температури води для вилову (опціонально)
+            band_width: Ширина діапазону температури для нового індексу
+
+        Повертає:
+            Актуальний індекс; оновлений знімок зберігається на диск
+        """
+        recommender = cls.load_snapshot(path) if os.path.exists(path) else cls(band_width)
+        if recommender.update_from_service(service, temperature_lookup):
+            recommender.save_snapshot(path)
+        return recommender
+
+
+def sensor_temperature_lookup(store, sensors: Iterable, window: float = 1800.0) -> TemperatureLookup:
+    """
+    Створення функції температури води за вимірами датчиків локації.
+
+    Температура - середнє значення вимірів усіх датчиків локації у вікні
+    ±window секунд навколо вилову. Результати кешуються погодинно.
+
+    Параметри:
+        store: Сховище вимірів датчиків (SensorReadingStore)
+        sensors: Датчики з відомими локаціями
+        window: Половина ширини вікна у секундах
+
+    Повертає:
+        Функція (локація, мітка часу) -> температура або None
+    """
+    sensors_by_location: Dict[str, List[str]] = {}
+    for sensor in sensors:
+        sensors_by_location.setdefault(sensor.location, []).append(sensor.sensor_id)
+    cache: Dict[Tuple[str, int], Optional[float]] = {}
+
+    def lookup(location: str, timestamp: str) -> Optional[float]:
+        sensor_ids = sensors_by_location.get(location)
+        if not sensor_ids:
+            return None
+        epoch = calendar.timegm(time.strptime(timestamp[:19], "%Y-%m-%d %H:%M:%S"))
+        key = (location, epoch // 3600)
+        if key not in cache:
+            count = 0
+            total = 0.0
+            for sensor_id in sensor_ids:
+                stats = store.get_window_stats(sensor_id, 'temperature',
+                                               epoch - window, epoch + window)
+                if stats['count']:
+                    count += stats['count']
+                    total += stats['mean'] * stats['count']
+            cache[key] = total / count if count else None
+        return cache[key]
+
+    return lookup
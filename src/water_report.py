@@ -0,0 +1,99 @@
+"""
+Модуль структурованих звітів про стан водойми.
+
+Цей модуль описує звіт еколога по одній локації, зібраний з вимірів
+багатьох датчиків, у вигляді об'єкта замість текстового виводу.
+"""
+
+from typing import Dict, List, Optional
+
+
+class LocationReport:
+    """
+    Зведений звіт про умови води в одній локації.
+
+    Містить статистику температури по всіх датчиках локації, розподіл
+    якості води, висновки еколога та список аномальних датчиків.
+    """
+
+    def __init__(self, location: str, sensor_count: int, sample_count: int,
+                 temperature_mean: float, temperature_min: float, temperature_max: float,
+                 quality_distribution: Dict[str, int], temperature_assessment: str,
+                 quality_assessment: str, anomalies: Optional[List[dict]] = None) -> None:
+        """
+        Ініціалізація звіту.
+
+        Параметри:
+            location: Назва локації
+            sensor_count: Кількість датчиків у локації
+            sample_count: Загальна кількість вимірів
+            temperature_mean: Середня температура води
+            temperature_min: Мінімальна температура води
+            temperature_max: Максимальна температура води
+            quality_distribution: Кількість вимірів за рівнями якості води
+            temperature_assessment: Висновок щодо температури
+            quality_assessment: Висновок щодо якості води
+            anomalies: Аномальні датчики (ідентифікатор, причина, значення)
+        """
+        self.location = location
+        self.sensor_count = sensor_count
+        self.sample_count = sample_count
+        self.temperature_mean = temperature_mean
+        self.temperature_min = temperature_min
+        self.temperature_max = temperature_max
+        self.quality_distribution = quality_distribution
+        self.temperature_assessment = temperature_assessment
+        self.quality_assessment = quality_assessment
+        self.anomalies = anomalies or []
+
+    def to_dict(self) -> dict:
+        """
+        Перетворення звіту на словник.
+
+        Повертає:
+            Словник з усіма полями звіту
+        """
+        return {
+            'location': self.location,
+            'sensor_count': self.sensor_count,
+            'sample_count': self.sample_count,
+            'temperature': {
+                'mean': self.temperature_mean,
+                'min': self.temperature_min,
+                'max': self.temperature_max
+            },
+            'quality_distribution': dict(self.quality_distribution),
+            'temperature_assessment': self.temperature_assessment,
+            'quality_assessment': self.quality_assessment,
+            'anomalies': list(self.anomalies)
+        }
+
+    def display(self) -> None:
+        """
+        Виведення звіту в консоль.
+        """
+        print(f"\n[Location Report - {self.location}]")
+        print(f"  Датчиків: {self.sensor_count}, вимірів: {self.sample_count}")
+        print(f"  Температура води: середня {self.temperature_mean:.1f}°C, "
+              f"мін. {self.temperature_min}°C, макс. {self.temperature_max}°C")
+        distribution = ", ".join(f"{level}: {count}"
+                                 for level, count in self.quality_distribution.items())
+        print(f"  Якість води: {distribution}")
+        print(f"  Аналіз:")
+        print(f"    - {self.temperature_assessment}")
+        print(f"    - {self.quality_assessment}")
+        if self.anomalies:
+            print(f"  Аномальні датчики: {len(self.anomalies)}")
+            for anomaly in self.anomalies:
+                print(f"    ! {anomaly['sensor_id']}: {anomaly['reason']} ({anomaly['value']})")
+        print()
+
+    def __str__(self) -> str:
+        """
+        Рядкова репрезентація звіту.
+
+        Повертає:
+            Рядок з основною інформацією про звіт
+        """
+        return (f"LocationReport(location={self.location}, sensors={self.sensor_count}, "
+                f"temperature_mean={self.temperature_mean:.1f}, anomalies={len(self.anomalies)})")
@@ -5,8 +5,57 @@
 рибальської експедиції.
 """
 
+import logging
 import random
-from typing import Optional
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, List, Optional
+from forecast_cache import ForecastCache
+from logging_config import get_logger
+
+logger = get_logger("weather_service")
+
+
+class SimulatedForecastProvider:
+    """
+    Локальний імітатор віддаленої служби погоди.
+    
+    Генерує випадковий прогноз із заданою затримкою, що імітує час
+    відповіді віддаленого сервісу.
+    """
+
+    def __init__(self, latency: float = 0.0, seed: Optional[int] = None) -> None:
+        """
+        Ініціалізація імітатора служби погоди.
+        
+        Параметри:
+            latency: Затримка відповіді у секундах
+            seed: Початкове значення генератора випадкових чисел (опціонально)
+        """
+        self.latency = latency
+        self._rng = random.Random(seed)
+        self.request_count = 0
+
+    def fetch_forecast(self, location: str) -> dict:
+        """
+        Отримання прогнозу погоди для локації.
+        
+        Параметри:
+            location: Назва локації для прогнозу
+            
+        Повертає:
+            Словник з прогнозом погоди (температура, вітер, опади)
+        """
+        self.request_count += 1
+        if self.latency > 0:
+            time.sleep(self.latency)
+        return {
+            'location': location,
+            'temperature': self._rng.randint(10, 25),
+            'wind_speed': self._rng.randint(0, 20),
+            'precipitation': self._rng.choice(['Немає', 'Низька', 'Висока']),
+            'conditions': self._rng.choice(['Сонячно', 'Хмарно', 'Дощово'])
+        }
 
 
 class WeatherService:
@@ -14,11 +63,65 @@ class WeatherService:
     Сервіс для отримання прогнозу погоди.
     
     Симулює роботу служби погоди та надає прогноз для планування
-    рибальської діяльності.
+    рибальської діяльності. Джерело прогнозів можна замінити, а для
+    повторних запитів увімкнути кеш.
     """
 
-    @staticmethod
-    def get_weather_forecast(location: str) -> dict:
+    provider = SimulatedForecastProvider()
+    forecast_cache: Optional[ForecastCache] = None
+
+    @classmethod
+    def set_provider(cls, provider: SimulatedForecastProvider) -> None:
+        """
+        Встановлення джерела прогнозів погоди.
+        
+        Параметри:
+            provider: Об'єкт з методом fetch_forecast(location)
+        """
+        cls.provider = provider
+        if cls.forecast_cache is not None:
+            cls.enable_cache(cls.forecast_cache.ttl, cls.forecast_cache.max_entries)
+
+    @classmethod
+    def enable_cache(cls, ttl: float = 300.0, max_entries: int = 256) -> ForecastCache:
+        """
+        Увімкнення кешу прогнозів погоди.
+        
+        Параметри:
+            ttl: Час життя прогнозу в кеші у секундах
+            max_entries: Максимальна кількість локацій у кеші
+            
+        Повертає:
+            Новий кеш прогнозів
+        """
+        cls.forecast_cache = ForecastCache(
+            lambda location: cls.provider.fetch_forecast(location), ttl, max_entries)
+        return cls.forecast_cache
+
+    @classmethod
+    def disable_cache(cls) -> None:
+        """
+        Вимкнення кешу прогнозів погоди.
+        """
+        cls.forecast_cache = None
+
+    @classmethod
+    def _fetch_forecast(cls, location: str) -> dict:
+        """
+        Отримання прогнозу з кешу (якщо його увімкнено) або від джерела.
+        
+        Параметри:
+            location: Назва локації для прогнозу
+            
+        Повертає:
+            Словник з прогнозом погоди
+        """
+        if cls.forecast_cache is not None:
+            return dict(cls.forecast_cache.get(location))
+        return cls.provider.fetch_forecast(location)
+
+    @classmethod
+    def get_weather_forecast(cls, location: str) -> dict:
         """
         Отримання прогнозу погоди для локації.
         
@@ -28,29 +131,55 @@ class WeatherService:
         Повертає:
             Словник з прогнозом погоди (температура, вітер, опади)
         """
-        print(f"\n[WeatherService] Отримую прогноз погоди для місцезнаходження '{location}'")
+        logger.info("\n[WeatherService] Отримую прогноз погоди для місцезнаходження '%s'", location)
         
-        temperature = random.randint(10, 25)
-        wind_speed = random.randint(0, 20)
-        precipitation = random.choice(['Немає', 'Низька', 'Висока'])
-        conditions = random.choice(['Сонячно', 'Хмарно', 'Дощово'])
+        forecast = cls._fetch_forecast(location)
         
-        forecast = {
-            'location': location,
-            'temperature': temperature,
-            'wind_speed': wind_speed,
-            'precipitation': precipitation,
-            'conditions': conditions
-        }
-        
-        print(f"[Weather Forecast - {location}]")
-        print(f"  Температура: {temperature}°C")
-        print(f"  Вітер: {wind_speed} км/год")
-        print(f"  Опади: {precipitation}")
-        print(f"  Умови: {conditions}")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("[Weather Forecast - %s]", location)
+            logger.info("  Температура: %s°C", forecast['temperature'])
+            logger.info("  Вітер: %s км/год", forecast['wind_speed'])
+            logger.info("  Опади: %s", forecast['precipitation'])
+            logger.info("  Умови: %s", forecast['conditions'])
         
         return forecast
 
+    @classmethod
+    def get_weather_forecasts(cls, locations: Iterable[str],
+                              max_workers: int = 16) -> Dict[str, dict]:
+        """
+        Паралельне отримання прогнозів погоди для кількох локацій.
+        
+        Параметри:
+            locations: Назви локацій
+            max_workers: Максимальна кількість одночасних запитів
+            
+        Повертає:
+            Словник {локація: прогноз погоди} у порядку вхідних локацій
+        """
+        unique_locations = list(dict.fromkeys(locations))
+        if not unique_locations:
+            return {}
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(unique_locations))) as executor:
+            forecasts = executor.map(cls._fetch_forecast, unique_locations)
+            result = dict(zip(unique_locations, forecasts))
+        logger.info("[WeatherService] Отримано прогнози для %d локацій", len(result))
+        return result
+
+    @staticmethod
+    def _is_suitable(temperature: float, wind_speed: float) -> bool:
+        """
+        Критерій придатності погоди для риболовлі.
+        
+        Параметри:
+            temperature: Температура повітря у градусах Цельсія
+            wind_speed: Швидкість вітру у км/год
+            
+        Повертає:
+            True, якщо температура від 10 до 25 і вітер до 15 км/год
+        """
+        return 10 <= temperature <= 25 and wind_speed <= 15
+
     @staticmethod
     def is_suitable_for_fishing(forecast: dict) -> bool:
         """
@@ -66,9 +195,58 @@ class WeatherService:
         wind_speed = forecast.get('wind_speed', 0)
         
         # Умови придатні, якщо температура від 10 до 25 і вітер до 15 км/год
-        is_suitable = 10 <= temperature <= 25 and wind_speed <= 15
+        is_suitable = WeatherService._is_suitable(temperature, wind_speed)
         
-        status = "✓ Придатні" if is_suitable else "✗ Непридатні"
-        print(f"[Weather Assessment] Умови для риболовлі: {status}\n")
+        logger.info("[Weather Assessment] Умови для риболовлі: %s\n",
+                    "✓ Придатні" if is_suitable else "✗ Непридатні")
         
         return is_suitable
+
+    @staticmethod
+    def rank_suitable_locations(forecasts: Dict[str, dict]) -> List[dict]:
+        """
+        Оцінка придатності погоди для всіх локацій та їх ранжування.
+        
+        Оцінка кожної придатної локації складається з запасу за вітром
+        (0..1, тихіше - краще) та близькості температури до 17.5°C (0..1).
+        
+        Параметри:
+            forecasts: Словник {локація: прогноз погоди}
+            
+        Повертає:
+            Список придатних локацій (словники з локацією, температурою,
+            швидкістю вітру та оцінкою), від найкращої до найгіршої
+        """
+        locations = list(forecasts)
+        temperatures = [forecasts[location].get('temperature', 0) for location in locations]
+        wind_speeds = [forecasts[location].get('wind_speed', 0) for location in locations]
+        is_suitable = WeatherService._is_suitable
+        
+        table = [
+            {
+                'location': location,
+                'temperature': temperature,
+                'wind_speed': wind_speed,
+                'score': round((15 - wind_speed) / 15 + 1 - abs(temperature - 17.5) / 7.5, 3)
+            }
+            for location, temperature, wind_speed in zip(locations, temperatures, wind_speeds)
+            if is_suitable(temperature, wind_speed)
+        ]
+        table.sort(key=lambda row: row['score'], reverse=True)
+        return table
+
+    @classmethod
+    def plan_locations(cls, locations: Iterable[str], max_workers: int = 16) -> List[dict]:
+        """
+        Отримання прогнозів для кількох локацій та ранжування придатних.
+        
+        Параметри:
+            locations: Назви локацій
+            max_workers: Максимальна кількість одночасних запитів
+            
+        Повертає:
+            Рейтинг придатних для риболовлі локацій
+        """
+        ranking = cls.rank_suitable_locations(cls.get_weather_forecasts(locations, max_workers))
+        logger.info("[Weather Assessment] Придатних локацій: %d", len(ranking))
+        return ranking
@@ -0,0 +1,68 @@
+"""
+Перевірка асинхронного сервісу журналу виловів.
+"""
+
+import asyncio
+import os
+import sys
+import tempfile
+import unittest
+
+# Додавання папки src до шляху пошуку модулів
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+from async_catch_log_service import AsyncCatchLogService
+from logging_config import configure_logging
+
+
+class AsyncCatchLogServiceTest(unittest.TestCase):
+    """
+    Помилки запису повертаються лише тим викликам, яких вони стосуються.
+    """
+
+    def setUp(self) -> None:
+        configure_logging(quiet=True)
+        self._directory = tempfile.TemporaryDirectory()
+        self.db_path = os.path.join(self._directory.name, "fishing.db")
+
+    def tearDown(self) -> None:
+        self._directory.cleanup()
+
+    def test_bad_row_fails_only_its_caller(self) -> None:
+        async def scenario() -> tuple:
+            service = AsyncCatchLogService(self.db_path)
+            saved = await asyncio.gather(
+                service.save_catches_bulk([("Петро", "Щука", 2.5)]),
+                service.save_catches_bulk([("Марія", "Окунь", None)]),
+                service.save_catches_bulk([("Іван", "Лящ", 1.2), ("Іван", "Лящ", 0.9)]))
+            count = len(await service.get_all_catches())
+            await service.close()
+            return saved, count
+
+        saved, count = asyncio.run(scenario())
+        self.assertEqual(saved, [1, 0, 2])
+        self.assertEqual(count, 3)
+
+    def test_large_call_is_saved_with_small_batch_size(self) -> None:
+        async def scenario() -> int:
+            service = AsyncCatchLogService(self.db_path, batch_size=2)
+            saved = await asyncio.gather(
+                service.save_catches_bulk([("Петро", "Щука", 1.0)] * 5),
+                service.save_catch("Марія", "Окунь", 0.5))
+            await service.close()
+            return saved[0]
+
+        self.assertEqual(asyncio.run(scenario()), 5)
+
+    def test_write_after_close_raises(self) -> None:
+        async def scenario() -> None:
+            service = AsyncCatchLogService(self.db_path)
+            await service.close()
+            await asyncio.wait_for(service.save_catch("Петро", "Щука", 2.5), timeout=5)
+
+        with self.assertRaises(RuntimeError):
+            asyncio.run(scenario())
+
+
+if __name__ == "__main__":
+    unittest.main()
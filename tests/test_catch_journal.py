@@ -0,0 +1,158 @@
+"""
+Перевірка журналу попереднього запису виловів.
+
+Після збою записи журналу, яких ще немає в базі даних, повторюються
+рівно один раз, у тому числі коли пакет збережено лише в частині шардів.
+"""
+
+import json
+import os
+import sys
+import tempfile
+import unittest
+from typing import Dict
+
+# Додавання папки src до шляху пошуку модулів
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+from catch_journal import CatchJournal
+from catch_log_service import CatchLogService
+from logging_config import configure_logging
+from sharded_catch_log_service import ShardedCatchLogService
+
+
+class _UnavailableCatchLogService(CatchLogService):
+    """
+    Сервіс, що не зберігає пакети журналу, поки available дорівнює False.
+    """
+
+    available = True
+
+    def save_journal_batch(self, journal, seq, entries) -> bool:
+        if not self.available:
+            return False
+        return super().save_journal_batch(journal, seq, entries)
+
+
+class CatchJournalReplayTest(unittest.TestCase):
+    """
+    Незбережені записи журналу повторюються при наступному відкритті.
+    """
+
+    def setUp(self) -> None:
+        configure_logging(quiet=True)
+        self._directory = tempfile.TemporaryDirectory()
+        self.db_path = os.path.join(self._directory.name, "fishing.db")
+        self.journal_path = os.path.join(self._directory.name, "catches.journal")
+
+    def tearDown(self) -> None:
+        self._directory.cleanup()
+
+    def test_replays_uncommitted_records_after_crash(self) -> None:
+        service = CatchLogService(self.db_path)
+        records = [("Петро", "Щука", 1.0 + seq, None, None) for seq in range(1, 6)]
+        # Стан після збою: у БД збережено записи 1-2, у файлі журналу - 1-5
+        # та обірваний на півдорозі запис 6
+        journal_id = os.path.abspath(self.journal_path)
+        self.assertTrue(service.save_journal_batch(
+            journal_id, 2, [(1, records[0]), (2, records[1])]))
+        with open(self.journal_path, "w", encoding="utf-8") as journal_file:
+            for seq, record in enumerate(records, 1):
+                journal_file.write(json.dumps([seq, *record], ensure_ascii=False) + "\n")
+            journal_file.write('[6, "Петро", "Щу')
+
+        with CatchJournal(self.journal_path, service) as journal:
+            self.assertEqual(service.get_catch_summary("Петро")['count'], 5)
+            self.assertEqual(service.get_journal_checkpoint(journal_id), 5)
+            self.assertEqual(journal.append(("Петро", "Окунь", 0.5, None, None)), 6)
+            self.assertTrue(journal.flush(timeout=5))
+
+        # Повторне відкриття нічого не дублює
+        with CatchJournal(self.journal_path, service):
+            pass
+        weights = sorted(catch['weight'] for catch in service.get_all_catches("Петро"))
+        self.assertEqual(weights, [0.5, 2.0, 3.0, 4.0, 5.0, 6.0])
+        service.close()
+
+    def test_records_left_by_close_during_outage_are_replayed(self) -> None:
+        service = _UnavailableCatchLogService(self.db_path)
+        service.available = False
+        journal = CatchJournal(self.journal_path, service, flush_interval=0.01,
+                               retry_delay=0.01)
+        for weight in (1.0, 2.0, 3.0):
+            journal.append(("Петро", "Щука", weight, None, None))
+        journal.close()
+        self.assertEqual(service.get_catch_summary("Петро")['count'], 0)
+
+        service.available = True
+        with CatchJournal(self.journal_path, service):
+            self.assertEqual(service.get_catch_summary("Петро")['count'], 3)
+        service.close()
+
+
+class ShardedJournalTest(unittest.TestCase):
+    """
+    Пакет, збережений лише в частині шардів, повторюється без дублікатів.
+    """
+
+    NAMES = ["Ivan", "Іван", "Petro", "Петро"]
+
+    def setUp(self) -> None:
+        configure_logging(quiet=True)
+        self._directory = tempfile.TemporaryDirectory()
+        self.service = ShardedCatchLogService(os.path.join(self._directory.name, "fishing.db"), 4)
+        # Записи пакета потрапляють у всі шарди
+        self.assertEqual({self.service.shard_index(name) for name in self.NAMES}, {0, 1, 2, 3})
+        self.journal_path = os.path.join(self._directory.name, "catches.journal")
+        self.failing_shard = self.service.shards[self.service.shard_index("Petro")]
+        self._save_journal_batch = self.failing_shard.save_journal_batch
+        self.failures = 0
+
+    def tearDown(self) -> None:
+        self.service.close()
+        self._directory.cleanup()
+
+    def fail_first_save(self, journal: str, seq: int, entries) -> bool:
+        """
+        Збереження пакета в шарді, перша спроба якого завершується помилкою.
+        """
+        if not self.failures:
+            self.failures += 1
+            return False
+        return self._save_journal_batch(journal, seq, entries)
+
+    def counts(self) -> Dict[str, int]:
+        return {name: self.service.get_catch_summary(name)['count'] for name in self.NAMES}
+
+    def test_partial_batch_is_retried_without_duplicates(self) -> None:
+        self.failing_shard.save_journal_batch = self.fail_first_save
+        with CatchJournal(self.journal_path, self.service, flush_interval=0.01,
+                          retry_delay=0.01) as journal:
+            for name in self.NAMES * 3:
+                journal.append((name, "Щука", 1.5, None, None))
+            self.assertTrue(journal.flush(timeout=5))
+        self.assertEqual(self.failures, 1)
+        self.assertEqual(self.counts(), {name: 3 for name in self.NAMES})
+        self.assertEqual(self.service.get_journal_checkpoint(os.path.abspath(self.journal_path)),
+                         12)
+
+    def test_replay_after_partial_batch_does_not_duplicate(self) -> None:
+        journal_id = os.path.abspath(self.journal_path)
+        entries = [(seq, (name, "Щука", 1.5, None, None))
+                   for seq, name in enumerate(self.NAMES, 1)]
+        self.failing_shard.save_journal_batch = self.fail_first_save
+        self.assertFalse(self.service.save_journal_batch(journal_id, 4, entries))
+        self.assertEqual(self.service.get_journal_checkpoint(journal_id), 0)
+
+        # Збій до повтору: пакет залишився у файлі журналу
+        with open(self.journal_path, "w", encoding="utf-8") as journal_file:
+            for seq, record in entries:
+                journal_file.write(json.dumps([seq, *record], ensure_ascii=False) + "\n")
+        with CatchJournal(self.journal_path, self.service):
+            pass
+        self.assertEqual(self.counts(), {name: 1 for name in self.NAMES})
+        self.assertEqual(self.service.get_journal_checkpoint(journal_id), 4)
+
+
+if __name__ == "__main__":
+    unittest.main()
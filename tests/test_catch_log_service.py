@@ -0,0 +1,45 @@
+"""
+Перевірка посторінкового читання журналу виловів.
+"""
+
+import os
+import sys
+import tempfile
+import unittest
+
+# Додавання папки src до шляху пошуку модулів
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+from catch_log_service import CatchLogService
+from logging_config import configure_logging
+
+
+class IterCatchesTest(unittest.TestCase):
+    """
+    Посторінкове читання повертає кожен запис рівно один раз.
+    """
+
+    def setUp(self) -> None:
+        configure_logging(quiet=True)
+        self._directory = tempfile.TemporaryDirectory()
+        self.service = CatchLogService(os.path.join(self._directory.name, "fishing.db"))
+        # Імпорт дозволяє записи без часу вилову
+        self.service.import_catches([[
+            (index, "Петро", "Щука", 1.0,
+             None if index % 3 == 0 else f"2024-06-{index % 28 + 1:02d} 10:00:00")
+            for index in range(1, 31)]])
+
+    def tearDown(self) -> None:
+        self.service.close()
+        self._directory.cleanup()
+
+    def test_pages_cross_rows_without_timestamp(self) -> None:
+        for fetch_size in (1, 4, 100):
+            ids = [row['id'] for row in self.service.iter_catches("Петро", fetch_size=fetch_size)]
+            self.assertEqual(sorted(ids), list(range(1, 31)), f"fetch_size={fetch_size}")
+            # Записи без часу вилову повертаються в кінці
+            self.assertEqual(ids[-10:], list(range(30, 0, -3)))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,86 @@
+"""
+Перевірка буферизованого запису виловів рибалки.
+
+Буферизовані вилови не повинні губитися, якщо їх не вдалося записати
+в базу даних.
+"""
+
+import asyncio
+import contextlib
+import gc
+import io
+import os
+import sys
+import tempfile
+import unittest
+import warnings
+
+# Додавання папки src до шляху пошуку модулів
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+from async_catch_log_service import AsyncCatchLogService
+from catch_log_service import CatchLogService
+from fisherman import Fisherman
+from logging_config import configure_logging
+
+
+class _FailingCatchLogService(CatchLogService):
+    """
+    Сервіс, пакетний запис якого завершується винятком.
+    """
+
+    def save_catches_bulk(self, catches) -> int:
+        raise ValueError("Помилка запису пакета")
+
+
+class FishermanBufferTest(unittest.TestCase):
+    """
+    Буфер виловів зберігається при невдалому записі.
+    """
+
+    def setUp(self) -> None:
+        configure_logging(quiet=True)
+        self._directory = tempfile.TemporaryDirectory()
+        self.db_path = os.path.join(self._directory.name, "fishing.db")
+        # Рибалка виводить повідомлення в консоль
+        self._stdout = contextlib.redirect_stdout(io.StringIO())
+        self._stdout.__enter__()
+
+    def tearDown(self) -> None:
+        self._stdout.__exit__(None, None, None)
+        self._directory.cleanup()
+
+    def test_sync_flush_with_async_service_keeps_buffer(self) -> None:
+        async def scenario() -> dict:
+            service = AsyncCatchLogService(self.db_path)
+            fisherman = Fisherman("Петро", service, buffer_size=10)
+            await fisherman.start_fishing_async("Озеро Победы")
+            await fisherman.log_catch_async("Щука", 2.5)
+            with warnings.catch_warnings(record=True) as caught:
+                warnings.simplefilter("always")
+                with self.assertRaises(TypeError):
+                    fisherman.flush_catches()
+                gc.collect()
+            self.assertFalse([w for w in caught if "never awaited" in str(w.message)])
+            self.assertEqual(len(fisherman._pending_catches), 1)
+            await fisherman.end_fishing_async()
+            summary = await service.get_catch_summary("Петро")
+            await service.close()
+            return summary
+
+        summary = asyncio.run(scenario())
+        self.assertEqual(summary['count'], 1)
+
+    def test_flush_error_keeps_buffer(self) -> None:
+        service = _FailingCatchLogService(self.db_path)
+        fisherman = Fisherman("Петро", service, buffer_size=10)
+        fisherman.start_fishing("Озеро Победы")
+        fisherman.log_catch("Щука", 2.5)
+        with self.assertRaises(ValueError):
+            fisherman.flush_catches()
+        self.assertEqual(len(fisherman._pending_catches), 1)
+        service.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
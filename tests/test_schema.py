@@ -0,0 +1,96 @@
+"""
+Перевірка індексів схеми бази даних журналу виловів.
+
+Запити сервісу перехоплюються через trace callback з'єднання, а їхні
+плани виконання перевіряються через EXPLAIN QUERY PLAN, тому тест
+зламається, якщо міграція видалить індекс або запит перестане його
+використовувати.
+"""
+
+import os
+import sys
+import tempfile
+import unittest
+from typing import Callable, List
+
+# Додавання папки src до шляху пошуку модулів
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+from catch_log_service import CatchLogService
+from logging_config import configure_logging
+
+
+class SchemaIndexTest(unittest.TestCase):
+    """
+    Запити за рибалкою, видом риби та експедицією використовують індекси.
+    """
+
+    def setUp(self) -> None:
+        configure_logging(quiet=True)
+        self._directory = tempfile.TemporaryDirectory()
+        self.service = CatchLogService(os.path.join(self._directory.name, "fishing.db"))
+        trip_id = self.service.start_trip("Петро", "Озеро Победы")
+        self.service.save_catches_bulk([
+            ("Петро", "Щука", 2.5, trip_id),
+            ("Петро", "Окунь", 0.8, trip_id),
+            ("Марія", "Щука", 3.1),
+        ])
+        self.trip_id = trip_id
+
+    def tearDown(self) -> None:
+        self.service.close()
+        self._directory.cleanup()
+
+    def query_plans(self, call: Callable[[], object]) -> List[str]:
+        """
+        Виконання виклику сервісу та отримання планів усіх його запитів SELECT.
+
+        Параметри:
+            call: Виклик методу сервісу
+
+        Повертає:
+            Кроки планів виконання всіх запитів
+        """
+        statements: List[str] = []
+        connection = self.service._pool.get_connection()
+        connection.set_trace_callback(statements.append)
+        try:
+            call()
+        finally:
+            connection.set_trace_callback(None)
+        selects = [statement for statement in statements
+                   if statement.lstrip().upper().startswith("SELECT")]
+        self.assertTrue(selects, "виклик не виконав жодного запиту SELECT")
+        return [step for statement in selects
+                for step in self.service.explain_query_plan(statement)]
+
+    def assertUsesIndex(self, plan: List[str], index: str) -> None:
+        self.assertTrue(any(index in step for step in plan), f"{index} не використано: {plan}")
+        self.assertFalse(any(step.startswith("SCAN catches") for step in plan),
+                         f"повний перегляд таблиці catches: {plan}")
+
+    def test_get_all_catches_uses_fisherman_index(self) -> None:
+        plan = self.query_plans(lambda: self.service.get_all_catches("Петро"))
+        self.assertUsesIndex(plan, "idx_catches_fisherman_timestamp")
+
+    def test_iter_catches_by_fisherman_uses_fisherman_index(self) -> None:
+        plan = self.query_plans(lambda: list(self.service.iter_catches("Петро")))
+        self.assertUsesIndex(plan, "idx_catches_fisherman_timestamp")
+
+    def test_iter_catches_by_species_uses_species_index(self) -> None:
+        plan = self.query_plans(lambda: list(self.service.iter_catches(fish_species="Щука")))
+        self.assertUsesIndex(plan, "idx_catches_species")
+
+    def test_get_catch_summary_reads_summary_table_by_key(self) -> None:
+        # Зведення читається з catch_summaries, яку підтримують тригери
+        plan = self.query_plans(lambda: self.service.get_catch_summary("Петро"))
+        self.assertTrue(any(step.startswith("SEARCH catch_summaries") for step in plan), plan)
+        self.assertFalse(any(step.startswith("SCAN") for step in plan), plan)
+
+    def test_get_trip_stats_uses_trip_index(self) -> None:
+        plan = self.query_plans(lambda: self.service.get_trip_stats(self.trip_id))
+        self.assertUsesIndex(plan, "idx_catches_trip")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,64 @@
+"""
+Перевірка шардованого сервісу журналу виловів.
+
+Рибалка може приєднатися до експедиції, збереженої в шарді іншого
+рибалки; його вилови не повинні губитися.
+"""
+
+import contextlib
+import io
+import os
+import sys
+import tempfile
+import unittest
+
+# Додавання папки src до шляху пошуку модулів
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+from fisherman import Fisherman
+from fishing_trip import FishingTrip
+from logging_config import configure_logging
+from sharded_catch_log_service import ShardedCatchLogService
+
+
+class CrossShardTripTest(unittest.TestCase):
+    """
+    Вилови учасника експедиції з іншого шарда зберігаються.
+    """
+
+    def setUp(self) -> None:
+        configure_logging(quiet=True)
+        self._directory = tempfile.TemporaryDirectory()
+        self.service = ShardedCatchLogService(os.path.join(self._directory.name, "fishing.db"), 4)
+        # Організатор і учасник експедиції зберігаються в різних шардах
+        self.assertNotEqual(self.service.shard_index("Ivan"), self.service.shard_index("Petro"))
+        # Рибалка та експедиція виводять повідомлення в консоль
+        self._stdout = contextlib.redirect_stdout(io.StringIO())
+        self._stdout.__enter__()
+        self.trip = FishingTrip("Озеро Победы", "Ivan", "карта", ["Біля берега"], self.service)
+        self.trip.start()
+
+    def tearDown(self) -> None:
+        self._stdout.__exit__(None, None, None)
+        self.service.close()
+        self._directory.cleanup()
+
+    def test_buffered_catches_of_other_shard_participant_are_saved(self) -> None:
+        fisherman = Fisherman("Petro", self.service, buffer_size=2)
+        fisherman.start_fishing("Озеро Победы", self.trip)
+        fisherman.log_catch("Щука", 2.5)
+        fisherman.log_catch("Окунь", 0.8)
+        self.assertEqual(fisherman._pending_catches, [])
+        self.assertEqual(self.service.get_catch_summary("Petro")['count'], 2)
+        self.assertEqual([catch['trip_id'] for catch in self.service.get_all_catches("Petro")],
+                         [None, None])
+
+    def test_unbuffered_catch_of_other_shard_participant_is_saved(self) -> None:
+        fisherman = Fisherman("Petro", self.service)
+        fisherman.start_fishing("Озеро Победы", self.trip)
+        fisherman.log_catch("Щука", 2.5)
+        self.assertEqual(self.service.get_catch_summary("Petro")['count'], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()